@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Request
 import logging
 from app.domain.controller.crime_controller import CrimeController
+from app.domain.model.deadline import guard
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import HTMLResponse
@@ -15,13 +16,15 @@ router = APIRouter()
 @router.get("/preprocess", summary="범죄상세")
 async def preprocess():
     controller = CrimeController()
-    controller.preprocess('cctv_in_seoul.csv', 'crime_in_seoul.csv', 'pop_in_seoul.xls')
+    with guard("preprocess"):
+        controller.preprocess('cctv_in_seoul.csv', 'crime_in_seoul.csv', 'pop_in_seoul.xls')
     return {"message": '서울시의 범죄 데이터가 전처리 되었습니다.'}
 
 @router.get("/map", summary="범죄지도 그리기")
 async def draw_crime_map():
     controller = CrimeController()
-    controller.draw_crime_map()
+    with guard("map"):
+        controller.draw_crime_map()
     return {"message": '서울시의 범죄 지도가 완성되었습니다.'}
 
 @router.get("/view-map", summary="범죄지도 보기", response_class=HTMLResponse)
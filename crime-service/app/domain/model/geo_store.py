@@ -0,0 +1,50 @@
+import os
+import copy
+import json
+import logging
+import threading
+
+logger = logging.getLogger("crime_api")
+
+GEO_JSON_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'stored-data', 'geo_simple.json')
+
+
+class GeoStore:
+    """서울시 자치구 GeoJSON 을 프로세스에 한 번만 읽어 둡니다.
+
+    gunicorn 마스터가 fork 전에 load 를 호출하면 워커들은 파싱된 GeoJSON 을 공유합니다.
+    공유본은 수정하지 않도록 get 은 복사본을 반환합니다.
+    """
+
+    def __init__(self, fname: str = GEO_JSON_FILE):
+        self.fname = fname
+        self._geo = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._geo is not None
+
+    def load(self):
+        """GeoJSON 파일을 읽습니다 (이미 읽었으면 건너뜀)."""
+        with self._lock:
+            if self._geo is not None:
+                return
+            if not os.path.exists(self.fname):
+                raise FileNotFoundError(self.fname)
+            try:
+                with open(self.fname, 'r', encoding='utf-8') as f:
+                    self._geo = json.load(f)
+            except json.JSONDecodeError as e:
+                logger.error(f"{self.fname} 파일 로드 중 JSON 디코딩 오류: {e}")
+                raise ValueError(f"{self.fname} 파일의 형식이 올바르지 않습니다.")
+            logger.info(f"📦 GeoJSON 적재 완료: 자치구 {len(self._geo.get('features', []))}개")
+
+    def get(self) -> dict:
+        """folium 이 수정해도 공유본이 바뀌지 않도록 복사본을 반환합니다."""
+        self.load()
+        return copy.deepcopy(self._geo)
+
+
+# ✅ 프로세스 전역 GeoJSON 저장소
+geo_store = GeoStore()
@@ -4,6 +4,7 @@ import os
 from app.domain.model.reader_schema import ReaderSchema
 from sklearn import preprocessing
 from app.domain.model.google_map_schema import GoogleMapSchema
+from app.domain.model import deadline
 import logging
 import traceback
 from ..service.internal.crime_correlation import (
@@ -31,6 +32,7 @@ class CrimePrepocessor:
     def preprocess(self, *args) -> None:
         print(f"------------모델 전처리 시작-----------")
         for i in list(args):
+            deadline.check(f"preprocess:{i}")
             self.save_object_to_csv(i)
         
       
@@ -86,6 +88,8 @@ class CrimePrepocessor:
             gmaps = GoogleMapSchema()  # 구글맵 객체 생성
             
             for name in station_names:
+                # ✅ 경찰서마다 외부 API 를 부르므로 마감이 지났으면 중단
+                deadline.check("geocode")
                 tmp = gmaps.geocode(name, language='ko')
                 print(f"""{name}의 검색 결과: {tmp[0].get("formatted_address")}""")
                 station_addrs.append(tmp[0].get("formatted_address"))
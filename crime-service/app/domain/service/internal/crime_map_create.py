@@ -6,6 +6,7 @@ import folium
 from fastapi import HTTPException
 import logging
 import traceback
+from app.domain.model.geo_store import geo_store
 
 logger = logging.getLogger(__name__)
 
@@ -43,37 +44,21 @@ def _load_required_data(data_dir):
         """지도 생성에 필요한 데이터를 로드하고 기본적인 핸들링을 수행합니다."""
         logger.info("필수 데이터 로드 중...")
 
-            # police_norm 데이터 로드
+        # police_norm 데이터 로드 (/preprocess 로 갱신되므로 매번 읽음)
         police_norm_file = os.path.join(data_dir, 'police_norm_in_seoul.csv')
         if not os.path.exists(police_norm_file):
             raise FileNotFoundError(police_norm_file)
-        
-            try:
-                police_norm = pd.read_csv(police_norm_file)
-                logger.info(f"{police_norm_file} 파일 로드 완료")
-                police_norm = _preprocess_police_norm(police_norm)
-            except Exception as e:
-                logger.error(f"{police_norm_file} 파일 처리 중 오류: {e}")
+        try:
+            police_norm = pd.read_csv(police_norm_file)
+            logger.info(f"{police_norm_file} 파일 로드 완료")
+            police_norm = _preprocess_police_norm(police_norm)
+        except Exception as e:
+            logger.error(f"{police_norm_file} 파일 처리 중 오류: {e}")
             raise ValueError(f"{police_norm_file} 파일을 처리하는 중 오류가 발생했습니다: {e}")
 
-        # GeoJSON 데이터 로드 (stored-data 폴더에서)
-        stored_data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'stored-data')
-        geo_json_file = os.path.join(stored_data_dir, 'geo_simple.json')
-        if not os.path.exists(geo_json_file):
-            raise FileNotFoundError(geo_json_file)
-        
-            try:
-                with open(geo_json_file, 'r', encoding='utf-8') as f:
-                    state_geo = json.load(f)
-                logger.info(f"{geo_json_file} 파일 로드 완료")
-            except json.JSONDecodeError as e:
-                logger.error(f"{geo_json_file} 파일 로드 중 JSON 디코딩 오류: {e}")
-                raise ValueError(f"{geo_json_file} 파일의 형식이 올바르지 않습니다.")
-            except Exception as e:
-                logger.error(f"{geo_json_file} 파일 처리 중 오류: {e}")
-            raise ValueError(f"{geo_json_file} 파일을 처리하는 중 오류가 발생했습니다: {e}")
-
-            return police_norm, state_geo
+        # GeoJSON 데이터 (기동 시 적재한 공유본의 복사본)
+        state_geo = geo_store.get()
+        return police_norm, state_geo
 
 def _preprocess_police_norm(police_norm_df: pd.DataFrame) -> pd.DataFrame:
     """police_norm 데이터를 전처리합니다."""
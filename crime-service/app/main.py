@@ -4,6 +4,7 @@ import logging
 from datetime import datetime
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 
@@ -13,6 +14,9 @@ sys.path.append(project_root)
 
 from app.domain.controller.crime_controller import CrimeController
 from app.api.crime_router import router as predict_router
+from app.domain.model.readiness import readiness
+from app.domain.model.deadline import DeadlineExceeded, DeadlineMiddleware, deadline_exceeded_handler
+from app.domain.model.geo_store import geo_store
 
 # 로깅 설정
 logging.basicConfig(
@@ -27,11 +31,18 @@ logger = logging.getLogger("crime_api")
 # .env 파일 로드
 load_dotenv()
 
+# ✅ fork 전에 적재할 읽기 전용 상태 (gunicorn.conf.py 의 when_ready 에서 호출)
+def preload():
+    readiness.preload(geo_store.load)
+
 # ✅ 애플리케이션 시작 시 실행
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 Crime API 서비스 시작")
+    await readiness.start(geo_store.load)
+    readiness.install_signal_handlers()
     yield
+    await readiness.drain()
     logger.info("🛑 Crime API 서비스 종료")
 
 # ✅ FastAPI 앱 생성 
@@ -51,6 +62,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 게이트웨이가 보낸 x-deadline-ms 로 요청 마감 설정 (마감이 지나면 비싼 단계를 건너뛰고 504)
+app.add_middleware(DeadlineMiddleware)
+app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+
+# ✅ 준비 상태 엔드포인트 (GeoJSON 적재 전과 드레인 중에는 503)
+@app.get("/ready", include_in_schema=False)
+async def ready():
+    return JSONResponse(content=readiness.status(), status_code=200 if readiness.ready else 503)
+
 # ✅ 서브 라우터 생성
 crime_router = APIRouter(prefix="/crime", tags=["Crime API"])
 
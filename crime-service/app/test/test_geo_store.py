@@ -0,0 +1,38 @@
+import json
+import pytest
+from app.domain.model.geo_store import GeoStore
+
+GEO = {"type": "FeatureCollection", "features": [{"id": "강남구", "properties": {"name": "강남구"}}]}
+
+
+def write_geo(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return str(path)
+
+
+def test_load_reads_file_once(tmp_path):
+    fname = write_geo(tmp_path / "geo_simple.json", json.dumps(GEO))
+    store = GeoStore(fname)
+    store.load()
+    write_geo(fname, json.dumps({"features": []}))
+    store.load()
+    assert store.loaded
+    assert store.get()["features"][0]["id"] == "강남구"
+
+
+def test_get_returns_copy(tmp_path):
+    """folium 이 반환값을 고쳐도 공유본은 바뀌지 않아야 합니다."""
+    store = GeoStore(write_geo(tmp_path / "geo_simple.json", json.dumps(GEO)))
+    geo = store.get()
+    geo["features"][0]["properties"]["name"] = "changed"
+    assert store.get()["features"][0]["properties"]["name"] == "강남구"
+
+
+def test_missing_or_broken_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        GeoStore(str(tmp_path / "missing.json")).load()
+    store = GeoStore(write_geo(tmp_path / "broken.json", "{"))
+    with pytest.raises(ValueError):
+        store.load()
+    assert not store.loaded
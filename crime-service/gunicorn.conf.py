@@ -0,0 +1,30 @@
+"""운영 실행 설정 (gunicorn 마스터 + uvicorn 워커 여러 개)
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+마스터가 앱을 한 번 import 하고(preload_app) 무거운 읽기 전용 상태를 적재한 뒤 워커를 fork 하므로
+워커들은 그 메모리를 copy-on-write 로 공유합니다. 워커는 /ready 가 200 이 된 뒤부터 트래픽을 받습니다.
+SIGTERM 을 받으면 워커는 READINESS_DRAIN_DELAY 초(기본 5) 동안 /ready 를 503 으로 응답하며 요청을 계속 받고,
+그 뒤 리스닝 소켓을 닫고 진행 중인 요청이 끝나기를 기다립니다 (둘을 합쳐 graceful_timeout 초까지).
+"""
+import gc
+import os
+import multiprocessing
+
+bind = f"0.0.0.0:{os.getenv('PORT', '9002')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+# 게이트웨이 연결 풀의 keepalive_expiry(30초)보다 길게 잡아 재사용하려는 연결을 먼저 닫지 않음
+keepalive = int(os.getenv("KEEPALIVE", "35"))
+
+
+def when_ready(server):
+    """워커를 fork 하기 직전 (마스터) - 무거운 상태를 적재하고 GC 대상에서 빼 둡니다."""
+    from app.main import preload
+    preload()
+    # 워커의 GC 가 공유 객체 헤더를 건드려 페이지가 복사되는 것을 막음
+    gc.freeze()
+    server.log.info(f"🚀 워커 {workers}개 시작 (graceful_timeout={graceful_timeout}s)")
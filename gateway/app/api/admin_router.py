@@ -0,0 +1,191 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Optional
+import logging
+from app.domain.model.admin_auth import require_admin_token
+from app.domain.model.service_client_pool import client_pool
+from app.domain.model.upload_forwarder import upload_forwarder
+from app.domain.model.response_cache import response_cache
+from app.domain.model.single_flight import single_flight
+from app.domain.model.service_guard import service_guard
+from app.domain.model.load_balancer import upstream_balancer
+from app.domain.model.hedging import hedger
+from app.domain.model.deadline import adaptive_timeouts
+from app.domain.model.batch_dispatcher import batch_dispatcher
+from app.domain.model.route_table import route_table
+from app.domain.model.response_compression import response_compression
+from app.domain.model.rate_limiter import rate_limiter
+from app.domain.model.service_type import ServiceType
+from app.domain.repository.database import database_pool
+from app.domain.controller.login_controller import login_service
+from app.domain.model.login_model import LoginEntity
+from app.domain.repository.login_repository import LoginImportError
+from app.domain.service.login_service import parse_ndjson_logins
+
+# 로거 설정
+logger = logging.getLogger("gateway_api")
+router = APIRouter(prefix="/ai/v1/admin", tags=["Admin API"])
+
+# GET
+@router.get("/pool", summary="업스트림 커넥션 풀 통계")
+async def get_pool_stats():
+    """
+    서비스별 공유 클라이언트의 커넥션 풀 상태를 조회합니다.
+    """
+    return client_pool.stats()
+
+@router.get("/uploads", summary="업로드 스트리밍 전달 통계")
+async def get_upload_stats():
+    """
+    multipart 업로드 전달 통계(크기 제한, 거부 수, 업스트림 back-pressure 대기 시간)를 조회합니다.
+    """
+    return upload_forwarder.stats()
+
+@router.get("/cache", summary="응답 캐시 통계")
+async def get_cache_stats():
+    """
+    응답 캐시의 항목 수, 크기, 적중/실패 횟수를 조회합니다.
+    """
+    return response_cache.stats()
+
+@router.get("/single-flight", summary="요청 coalescing 통계")
+async def get_single_flight_stats():
+    """
+    동일한 동시 GET 요청이 업스트림 호출 하나로 합쳐진 횟수를 조회합니다.
+    """
+    return single_flight.stats()
+
+@router.get("/circuits", summary="서비스별 circuit breaker / bulkhead 상태")
+async def get_circuit_states():
+    """
+    서비스별 circuit 상태(closed/open/half_open), 실패율, bulkhead 사용량을 조회합니다.
+    """
+    return service_guard.stats()
+
+@router.get("/upstreams", summary="서비스별 복제본 상태")
+async def get_upstreams():
+    """
+    서비스별 복제본 목록과 헬스 상태, 진행 중 요청 수를 조회합니다.
+    """
+    return upstream_balancer.stats()
+
+@router.get("/hedging", summary="hedging / 재시도 예산 통계")
+async def get_hedging_stats():
+    """
+    hedge 요청 수, 재시도 수, 재시도 예산 잔액과 경로별 hedge 지연을 조회합니다.
+    """
+    return hedger.stats()
+
+@router.get("/timeouts", summary="경로별 적응형 타임아웃")
+async def get_timeout_stats():
+    """
+    경로별 지연 백분위수, 현재 타임아웃과 상한, 타임아웃/마감 초과 수를 조회합니다.
+    """
+    return adaptive_timeouts.stats()
+
+@router.get("/batch", summary="배치 fan-out 통계")
+async def get_batch_stats():
+    """
+    처리한 배치 수, 하위 요청 수, 마감 시간 초과와 오류 수를 조회합니다.
+    """
+    return batch_dispatcher.stats()
+
+@router.get("/routes", summary="라우팅 테이블 조회")
+async def get_routes():
+    """
+    현재 적용 중인 라우트 목록과 라우트 파일 버전/재로드 상태를 조회합니다.
+    """
+    return route_table.stats()
+
+@router.get("/compression", summary="응답 압축 통계")
+async def get_compression_stats():
+    """
+    인코딩별 압축 응답 수, 업스트림 압축 그대로 전달 수, 압축 전후 바이트를 조회합니다.
+    """
+    return response_compression.stats()
+
+@router.get("/rate-limits", summary="요청 제한 통계")
+async def get_rate_limit_stats():
+    """
+    서비스별 허용량(rate / burst)과 허용/제한된 요청 수, 저장소 상태를 조회합니다.
+    """
+    return rate_limiter.stats()
+
+@router.get("/database", summary="DB 연결 풀 통계")
+async def get_database_stats():
+    """
+    DB 연결 풀 크기, 연결 대기 시간, statement 별 쿼리 시간을 조회합니다.
+    """
+    return database_pool.stats()
+
+@router.get("/login-cache", summary="Login 캐시 통계")
+async def get_login_cache_stats():
+    """
+    Login 캐시의 항목 수, 적중률(없는 ID 포함), 무효화 전파 통계를 조회합니다.
+    """
+    return login_service.repository.cache_stats()
+
+@router.get("/login-renewal", summary="Login 토큰 갱신 통계")
+async def get_login_renewal_stats():
+    """
+    토큰 갱신 coalescing 과 만료 전 사전 갱신 작업 통계를 조회합니다.
+    """
+    return login_service.stats()
+
+# POST
+@router.post("/routes/reload", summary="라우팅 테이블 다시 읽기", dependencies=[Depends(require_admin_token)])
+async def reload_routes():
+    """
+    라우트 파일을 즉시 다시 읽어 컴파일합니다. 설정이 잘못되면 기존 테이블을 유지합니다.
+    """
+    reloaded = route_table.reload(force=True)
+    return {"reloaded": reloaded, **route_table.stats()}
+
+@router.post("/logins/import", summary="Login 정보 대량 가져오기", dependencies=[Depends(require_admin_token)])
+async def import_logins(
+    request: Request,
+    chunk_size: Optional[int] = Query(None, ge=1, le=50000, description="COPY 한 번에 넣을 행 수 (기본 LOGIN_IMPORT_CHUNK)")
+):
+    """
+    LoginEntity 배열(application/json) 또는 한 줄에 하나씩(application/x-ndjson) 받아
+    청크 단위로 COPY 후 한 번에 upsert 하고, 가져온 행 수와 초당 행 수를 반환합니다.
+    NDJSON 은 받는 대로 처리하므로 요청 전체를 메모리에 올리지 않습니다.
+    토큰을 직접 써 넣으므로 x-admin-token 헤더(GATEWAY_ADMIN_TOKEN)가 필요합니다.
+    """
+    if "ndjson" in request.headers.get("content-type", ""):
+        logins = parse_ndjson_logins(request.stream())
+    else:
+        body = await request.json()
+        if not isinstance(body, list):
+            raise HTTPException(status_code=400, detail="LoginEntity 배열이 필요합니다.")
+        logins = (LoginEntity.model_validate(item) for item in body)
+    try:
+        return await login_service.import_logins(logins, chunk_size)
+    except LoginImportError as e:
+        raise HTTPException(status_code=400, detail={"error": str(e), **e.progress})
+
+@router.post("/circuits/{service}/reset", summary="circuit 수동 복구", dependencies=[Depends(require_admin_token)])
+async def reset_circuit(service: ServiceType):
+    """
+    서비스의 circuit 을 closed 상태로 되돌립니다.
+    """
+    service_guard.reset(service)
+    return service_guard.stats()[service.value]
+
+# DELETE
+@router.delete("/cache", summary="응답 캐시 전체 삭제", dependencies=[Depends(require_admin_token)])
+async def purge_cache():
+    """
+    캐시된 모든 응답을 삭제합니다.
+    """
+    return {"purged": response_cache.purge()}
+
+@router.delete("/cache/{service}", summary="서비스별 응답 캐시 삭제", dependencies=[Depends(require_admin_token)])
+async def purge_service_cache(
+    service: ServiceType,
+    path: Optional[str] = Query(None, description="삭제할 경로 (없으면 서비스 전체)")
+):
+    """
+    특정 서비스(및 경로)의 캐시된 응답을 삭제합니다.
+    """
+    return {"purged": response_cache.purge(service.value, path)}
+
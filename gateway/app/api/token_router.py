@@ -0,0 +1,27 @@
+from fastapi import APIRouter
+import logging
+from app.domain.controller.token_controller import TokenController
+from app.domain.schema.token_schema import (
+    TokenSchema, TokenVerifyResponseSchema,
+    TokenBatchVerifySchema, TokenBatchVerifyResponseSchema
+)
+
+# 로거 설정
+logger = logging.getLogger("gateway_api")
+router = APIRouter(prefix="/ai/v1/token", tags=["Token API"])
+token_controller = TokenController()
+
+# POST
+@router.post("/verify", summary="토큰 검증", response_model=TokenVerifyResponseSchema)
+async def verify_token(token: TokenSchema):
+    """
+    토큰 하나의 유효성을 검증합니다.
+    """
+    return await token_controller.verify_token(token)
+
+@router.post("/verify/batch", summary="여러 토큰 한 번에 검증", response_model=TokenBatchVerifyResponseSchema)
+async def verify_tokens(batch: TokenBatchVerifySchema):
+    """
+    여러 토큰을 한 번에 검증하고 요청한 순서대로 토큰별 결과를 반환합니다.
+    """
+    return await token_controller.verify_many(batch)
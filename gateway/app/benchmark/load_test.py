@@ -0,0 +1,214 @@
+"""
+게이트웨이 부하 테스트
+
+titanic / crime / nlp / tf 스텁 백엔드 4개를 프로세스 안에서 띄우고 게이트웨이를
+별도 프로세스로 실행한 뒤, 라우트 종류(JSON GET, HTML GET, multipart POST)별로
+동시 요청을 보내 RPS, p50/p95/p99 지연 시간, 게이트웨이 CPU 사용량과 RSS 를 측정합니다.
+결과는 커밋 해시와 함께 JSON 파일로 저장되어 커밋 간 회귀 비교에 사용할 수 있습니다.
+
+실행:
+    cd gateway
+    python -m app.benchmark.load_test --requests 2000 --concurrency 50 --latency 0.01
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict
+import httpx
+from app.benchmark.passthrough_bench import GATEWAY_DIR, percentile, read_rss_kb
+from app.benchmark.stub_backend import StubServer, create_stub_app, free_port
+
+# ✅ 라우트 종류별 (서비스, 메서드, 경로)
+ROUTES = {
+    "json_get": ("titanic", "GET", "/ai/v1/titanic/predict"),
+    "html_get": ("crime", "GET", "/ai/v1/crime/view-map"),
+    "multipart_post": ("tf", "POST", "/ai/v1/tf/upload"),
+}
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def read_cpu_seconds(pid: int) -> float:
+    """/proc 에서 프로세스의 누적 CPU 시간(user + system, 초)을 읽습니다 (Linux 전용)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    except (OSError, IndexError, ValueError):
+        return 0.0
+
+
+def git_commit() -> str:
+    """현재 커밋 해시 (git 이 없으면 unknown)"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=GATEWAY_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def start_gateway(service_urls: Dict[str, str], env_overrides: Dict[str, str]) -> tuple:
+    """서비스별 스텁 URL 로 게이트웨이를 별도 프로세스로 실행합니다."""
+    port = free_port()
+    env = dict(os.environ)
+    env.update(env_overrides)
+    for service, url in service_urls.items():
+        env[f"{service.upper()}_SERVICE_URL"] = url
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=GATEWAY_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 20
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/ai/v1/health").status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("게이트웨이 시작 실패")
+
+
+def request_factory(method: str, path: str, upload_size: int) -> Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]:
+    """라우트 종류에 맞는 요청 함수를 만듭니다."""
+    if method == "POST":
+        payload = b"\x89PNG\r\n\x1a\n" + b"\x00" * max(upload_size - 8, 0)
+        return lambda client: client.post(path, files={"file": ("bench.png", payload, "image/png")})
+    return lambda client: client.get(path)
+
+
+async def drive(base_url: str, send, total: int, concurrency: int, warmup: int) -> dict:
+    """동시 요청을 보내고 지연 시간과 상태 코드를 집계합니다."""
+    latencies = []
+    statuses: Dict[str, int] = {}
+    queue = iter(range(total))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        for _ in range(warmup):
+            await send(client)
+
+        async def worker():
+            for _ in queue:
+                start = time.perf_counter()
+                try:
+                    response = await send(client)
+                    key = str(response.status_code)
+                except httpx.HTTPError as e:
+                    key = type(e).__name__
+                latencies.append((time.perf_counter() - start) * 1000)
+                statuses[key] = statuses.get(key, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(count for key, count in statuses.items() if not key.isdigit() or int(key) >= 400)
+    return {
+        "requests": total,
+        "errors": errors,
+        "statuses": statuses,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(total / elapsed, 1),
+        "mean_ms": round(statistics.mean(latencies), 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+def run(args) -> dict:
+    """스텁 백엔드와 게이트웨이를 띄우고 모든 라우트를 측정합니다."""
+    stub_options = dict(
+        html_size=args.html_size,
+        png_size=args.png_size,
+        json_items=args.json_items,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    servers = {service: StubServer(create_stub_app(name=service, **stub_options)) for service in ("titanic", "crime", "nlp", "tf")}
+    env_overrides = {}
+    if not args.with_cache:
+        # 캐시 / coalescing 없이 프록시 경로 자체를 측정
+        env_overrides["GATEWAY_CACHE_TTLS"] = "titanic/predict=0,crime/view-map=0,nlp/wordcloud=0"
+        env_overrides["GATEWAY_COALESCE_ROUTES"] = ""
+
+    for server in servers.values():
+        server.__enter__()
+    try:
+        process, base_url = start_gateway({service: server.url for service, server in servers.items()}, env_overrides)
+        try:
+            routes = {}
+            for name, (service, method, path) in ROUTES.items():
+                send = request_factory(method, path, args.upload_size)
+                cpu_before = read_cpu_seconds(process.pid)
+                stats = asyncio.run(drive(base_url, send, args.requests, args.concurrency, args.warmup))
+                cpu_seconds = read_cpu_seconds(process.pid) - cpu_before
+                stats["gateway_cpu_s"] = round(cpu_seconds, 3)
+                stats["gateway_cpu_percent"] = round(cpu_seconds / stats["elapsed_s"] * 100, 1)
+                stats["gateway_cpu_ms_per_request"] = round(cpu_seconds / args.requests * 1000, 3)
+                stats.update(read_rss_kb(process.pid))
+                routes[name] = {"service": service, "method": method, "path": path, **stats}
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+    finally:
+        for server in servers.values():
+            server.__exit__(None, None, None)
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "routes": routes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gateway load test with stub backends")
+    parser.add_argument("--requests", type=int, default=1000, help="라우트별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="스텁 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="스텁 지연 무작위 편차 최대값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="스텁 500 응답 확률 (0~1)")
+    parser.add_argument("--json-items", type=int, default=2, help="JSON 응답 승객 수")
+    parser.add_argument("--html-size", type=int, default=90_000, help="HTML 응답 크기 (bytes)")
+    parser.add_argument("--png-size", type=int, default=300_000, help="PNG 응답 크기 (bytes)")
+    parser.add_argument("--upload-size", type=int, default=500_000, help="multipart 업로드 크기 (bytes)")
+    parser.add_argument("--with-cache", action="store_true", help="응답 캐시 / coalescing 을 켠 채로 측정")
+    parser.add_argument("--output", default="load_test_results.json", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    result = run(args)
+
+    print(f"commit {result['commit']}  concurrency {args.concurrency}  latency {args.latency}s  error_rate {args.error_rate}")
+    print(f"{'route':<16}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'err':>6}{'cpu%':>8}{'cpu ms/req':>12}{'rss MB':>9}")
+    for name, s in result["routes"].items():
+        rss = f"{s['rss_kb'] / 1024:.1f}" if s["rss_kb"] else "-"
+        print(f"{name:<16}{s['rps']:>9}{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}{s['errors']:>6}"
+              f"{s['gateway_cpu_percent']:>8}{s['gateway_cpu_ms_per_request']:>12}{rss:>9}")
+
+    with open(args.output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
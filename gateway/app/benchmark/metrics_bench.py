@@ -0,0 +1,91 @@
+"""
+지표 수집 오버헤드 벤치마크
+
+1) 지표 기록 한 번(end_request + observe_upstream)의 비용과
+2) MetricsMiddleware 유무에 따른 요청당 처리 시간 차이를 측정합니다.
+
+실행:
+    cd gateway
+    python -m app.benchmark.metrics_bench --requests 5000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import httpx
+from fastapi import FastAPI
+from app.domain.model.gateway_metrics import GatewayMetrics, MetricsMiddleware
+from app.domain.model.service_type import ServiceType
+
+
+def bench_record(iterations: int) -> dict:
+    """지표 기록 한 번의 평균 비용 (ns)"""
+    metrics = GatewayMetrics()
+    started = time.perf_counter()
+    for i in range(iterations):
+        metrics.begin_request("titanic")
+        metrics.end_request("titanic", "GET", 200, 0.012 * (i % 50), 2048)
+        metrics.observe_upstream(ServiceType.TITANIC, "GET", 200, 0.01)
+    elapsed = time.perf_counter() - started
+    render_started = time.perf_counter()
+    metrics.render()
+    return {
+        "record_ns_per_request": round(elapsed / iterations * 1e9, 1),
+        "self_reported_overhead_ns": round(metrics.overhead.get(()) / iterations * 1e9, 1),
+        "render_ms": round((time.perf_counter() - render_started) * 1000, 3),
+    }
+
+
+def create_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ai/v1/titanic/predict")
+    async def predict():
+        return {"survived": [0, 1, 1]}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware, metrics=GatewayMetrics())
+    return app
+
+
+async def bench_requests(with_metrics: bool, total: int, rounds: int) -> float:
+    """요청당 평균 처리 시간 (µs, 여러 번 측정한 중앙값)"""
+    transport = httpx.ASGITransport(app=create_app(with_metrics))
+    samples = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(100):
+            await client.get("/ai/v1/titanic/predict")
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(total):
+                await client.get("/ai/v1/titanic/predict")
+            samples.append((time.perf_counter() - started) / total * 1e6)
+    return statistics.median(samples)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="지표 수집 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    record = bench_record(args.requests * 10)
+    baseline = await bench_requests(False, args.requests, args.rounds)
+    instrumented = await bench_requests(True, args.requests, args.rounds)
+    result = {
+        **record,
+        "request_us_without_metrics": round(baseline, 2),
+        "request_us_with_metrics": round(instrumented, 2),
+        "overhead_us_per_request": round(instrumented - baseline, 2),
+        "overhead_percent": round((instrumented - baseline) / baseline * 100, 2),
+    }
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+"""
+passthrough 모드 벤치마크
+
+JSON 재직렬화 모드(GATEWAY_PASSTHROUGH=false)와 스트리밍 passthrough 모드를
+같은 스텁 백엔드에 대해 비교하고, 라우트별 지연 시간과 게이트웨이 RSS 를 출력합니다.
+
+실행:
+    cd gateway
+    python -m app.benchmark.passthrough_bench --requests 300 --concurrency 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import httpx
+from app.benchmark.stub_backend import StubServer, create_stub_app, free_port
+
+GATEWAY_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROUTES = {
+    "json": "/ai/v1/titanic/predict",
+    "html": "/ai/v1/crime/view-map",
+    "png": "/ai/v1/nlp/wordcloud",
+}
+
+
+def read_rss_kb(pid: int) -> dict:
+    """/proc 에서 프로세스의 현재/최대 RSS(kB)를 읽습니다 (Linux 전용)."""
+    result = {"rss_kb": None, "peak_rss_kb": None}
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    result["rss_kb"] = int(line.split()[1])
+                elif line.startswith("VmHWM:"):
+                    result["peak_rss_kb"] = int(line.split()[1])
+    except OSError:
+        pass
+    return result
+
+
+def percentile(values: list, pct: float) -> float:
+    """정렬된 값 목록의 백분위수"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def drive(base_url: str, path: str, total: int, concurrency: int) -> dict:
+    """한 라우트에 동시 요청을 보내고 지연 시간을 집계합니다."""
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        async def one():
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    await response.aread()
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": round(total / elapsed, 1),
+        "mean_ms": round(statistics.mean(latencies), 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+def start_gateway(stub_url: str, passthrough: bool) -> tuple:
+    """게이트웨이를 별도 프로세스로 실행합니다."""
+    port = free_port()
+    env = dict(os.environ)
+    env["GATEWAY_PASSTHROUGH"] = "true" if passthrough else "false"
+    for name in ("TITANIC", "CRIME", "NLP", "TF"):
+        env[f"{name}_SERVICE_URL"] = stub_url
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=GATEWAY_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 20
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/ai/v1/health").status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("게이트웨이 시작 실패")
+
+
+def run_mode(stub_url: str, passthrough: bool, total: int, concurrency: int) -> dict:
+    """한 가지 모드로 모든 라우트를 측정합니다."""
+    process, base_url = start_gateway(stub_url, passthrough)
+    try:
+        result = {"idle": read_rss_kb(process.pid), "routes": {}}
+        for name, path in ROUTES.items():
+            stats = asyncio.run(drive(base_url, path, total, concurrency))
+            stats.update(read_rss_kb(process.pid))
+            result["routes"][name] = stats
+        return result
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gateway passthrough benchmark")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--html-size", type=int, default=90_000)
+    parser.add_argument("--png-size", type=int, default=300_000)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    stub = create_stub_app(html_size=args.html_size, png_size=args.png_size)
+    results = {}
+    with StubServer(stub) as server:
+        for mode, passthrough in (("json", False), ("passthrough", True)):
+            results[mode] = run_mode(server.url, passthrough, args.requests, args.concurrency)
+
+    print(f"{'mode':<12}{'route':<6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'err':>6}{'rss MB':>9}{'peak MB':>9}")
+    for mode, result in results.items():
+        for route, s in result["routes"].items():
+            rss = f"{s['rss_kb'] / 1024:.1f}" if s["rss_kb"] else "-"
+            peak = f"{s['peak_rss_kb'] / 1024:.1f}" if s["peak_rss_kb"] else "-"
+            print(f"{mode:<12}{route:<6}{s['rps']:>9}{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}{s['errors']:>6}{rss:>9}{peak:>9}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+벤치마크용 경량 스텁 백엔드
+
+titanic / crime / nlp / tf 서비스의 응답 형태(JSON, HTML, PNG)를 흉내 내는
+FastAPI 앱을 만들고, 별도 스레드의 uvicorn 서버로 실행합니다.
+"""
+import asyncio
+import random
+import socket
+import threading
+import time
+from fastapi import FastAPI, File, UploadFile
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+import uvicorn
+
+
+def create_stub_app(
+    html_size: int = 90_000,
+    png_size: int = 300_000,
+    json_items: int = 2,
+    name: str = "stub",
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0
+) -> FastAPI:
+    """스텁 백엔드 앱을 생성합니다.
+
+    Args:
+        name: 응답의 `x-stub-name` 헤더 값 (복제본 구분용)
+        html_size: crime `/view-map` HTML 크기 (bytes)
+        png_size: nlp `/wordcloud` PNG 크기 (bytes)
+        json_items: titanic `/predict` 승객 수
+        latency: 응답 전 지연 시간 (초)
+        jitter: 지연 시간에 더할 무작위 편차의 최대값 (초)
+        error_rate: 500 응답을 돌려줄 확률 (0~1)
+    """
+    app = FastAPI(title="Stub Backend")
+
+    @app.middleware("http")
+    async def add_name(request, call_next):
+        delay = latency + (random.uniform(0, jitter) if jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if error_rate and random.random() < error_rate:
+            response = JSONResponse(content={"detail": "stub error"}, status_code=500)
+        else:
+            response = await call_next(request)
+        response.headers["x-stub-name"] = name
+        return response
+    html = "<html><body>" + "x" * max(html_size - 26, 0) + "</body></html>"
+    png = b"\x89PNG\r\n\x1a\n" + b"\x00" * max(png_size - 8, 0)
+    passengers = [
+        {"pclass": 1, "sex": "female", "age": 25, "fare": 100.0, "survived": True, "probability": 0.95}
+        for _ in range(json_items)
+    ]
+
+    @app.get("/predict")
+    async def predict():
+        return {"passengers": passengers}
+
+    @app.get("/view-map")
+    async def view_map():
+        return HTMLResponse(content=html)
+
+    @app.get("/wordcloud")
+    async def wordcloud():
+        return Response(content=png, media_type="image/png")
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        size = len(await file.read())
+        return {"filename": file.filename, "size": size, "message": "파일 업로드 성공!"}
+
+    return app
+
+
+def free_port() -> int:
+    """사용 가능한 로컬 포트를 반환합니다."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StubServer:
+    """스레드에서 실행되는 uvicorn 서버 (with 문으로 사용)"""
+
+    def __init__(self, app: FastAPI, port: int = None):
+        self.port = port or free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self._server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning"))
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
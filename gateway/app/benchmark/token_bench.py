@@ -0,0 +1,91 @@
+"""
+토큰 검증 마이크로벤치마크
+
+TokenService.verify_token 의 초당 검증 수를 검증 캐시 없이(cache_size=0)와
+캐시 사용 시로 비교합니다. 토큰 N 개를 발급한 뒤 무작위 순서로 반복 검증합니다.
+--batch-size 를 주면 캐시 없이 verify_token N 번과 verify_many 한 번도 비교합니다.
+
+실행:
+    cd gateway
+    python -m app.benchmark.token_bench --tokens 1000 --verifications 50000 --batch-size 500
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from app.domain.schema.token_schema import TokenSchema
+from app.domain.service.token_service import TokenService
+
+
+async def measure(cache_size: int, tokens: int, verifications: int) -> dict:
+    """검증 캐시 크기별 초당 검증 수"""
+    service = TokenService(cache_size=cache_size)
+    issued = [TokenSchema(token=(await service.create_token(f"user-{i}")).access_token) for i in range(tokens)]
+    rng = random.Random(0)
+    order = [rng.choice(issued) for _ in range(verifications)]
+
+    started = time.perf_counter()
+    valid = 0
+    for schema in order:
+        valid += (await service.verify_token(schema)).is_valid
+    elapsed = time.perf_counter() - started
+    assert valid == verifications
+    return {
+        "cache_size": cache_size,
+        "verifications_per_second": round(verifications / elapsed),
+        "us_per_verification": round(elapsed / verifications * 1e6, 2),
+        "cache": service.cache_stats(),
+    }
+
+
+async def measure_batch(batch_size: int, rounds: int) -> dict:
+    """캐시 없이 토큰 batch_size 개를 verify_token 으로 하나씩 vs verify_many 로 한 번에 검증"""
+    service = TokenService(cache_size=0)
+    tokens = [(await service.create_token(f"user-{i}")).access_token for i in range(batch_size)]
+    schemas = [TokenSchema(token=token) for token in tokens]
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for schema in schemas:
+            assert (await service.verify_token(schema)).is_valid
+    single = (time.perf_counter() - started) / rounds
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        assert all(result.is_valid for result in await service.verify_many(tokens))
+    batch = (time.perf_counter() - started) / rounds
+    return {
+        "batch_size": batch_size,
+        "single_calls_ms": round(single * 1000, 2),
+        "verify_many_ms": round(batch * 1000, 2),
+        "speedup": round(single / batch, 2),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="TokenService.verify_token 벤치마크")
+    parser.add_argument("--tokens", type=int, default=1000, help="발급할 토큰 수")
+    parser.add_argument("--verifications", type=int, default=50000, help="검증 횟수")
+    parser.add_argument("--batch-size", type=int, default=0, help="배치 검증 비교에 사용할 토큰 수 (0 이면 생략)")
+    parser.add_argument("--rounds", type=int, default=20, help="배치 검증 비교 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    before = await measure(0, args.tokens, args.verifications)
+    after = await measure(args.tokens * 2, args.tokens, args.verifications)
+    result = {
+        "before": before,
+        "after": after,
+        "speedup": round(after["verifications_per_second"] / before["verifications_per_second"], 2),
+    }
+    if args.batch_size:
+        result["batch"] = await measure_batch(args.batch_size, args.rounds)
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,26 +1,49 @@
-from fastapi import APIRouter, HTTPException, Query
-from app.api.gateway.login_router import router as login_router
-from app.domain.schema.login_schema import LoginResponseSchema, LoginSchema
+from contextlib import aclosing
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.domain.schema.login_schema import LoginPageSchema, LoginResponseSchema, LoginSchema, LoginSummarySchema
 from app.domain.service.login_service import LoginService
+from app.domain.model.admin_auth import require_admin_token
 
-from app.domain.model.login_model import LoginEntity
-from typing import List
+from typing import Optional
+import os
 
-router = APIRouter(prefix="/login",tags=["login"])
+# ✅ 목록 한 페이지의 최대 항목 수
+LOGIN_PAGE_MAX = int(os.getenv("LOGIN_PAGE_MAX", "500"))
+
+# ✅ OAuth 토큰을 다루는 API 이므로 모든 경로에 x-admin-token (GATEWAY_ADMIN_TOKEN) 필요
+router = APIRouter(prefix="/login",tags=["login"], dependencies=[Depends(require_admin_token)])
 login_service = LoginService()
 
-@router.get("/{login_id}", response_model=LoginEntity)
+@router.get("/export", summary="제공자별 Login 정보 NDJSON 스트리밍")
+async def export_login_by_provider(provider: str = Query(..., description="Login 제공자")):
+    """제공자별 Login 정보를 DB 에서 읽는 대로 한 줄에 하나씩 전송합니다 (토큰 포함)"""
+    async def lines():
+        # 클라이언트가 끊으면 서버 측 커서와 연결을 GC 를 기다리지 않고 바로 반환
+        async with aclosing(login_service.stream_login_by_provider(provider)) as logins:
+            async for login in logins:
+                yield login.model_dump_json() + "\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.get("/{login_id}", response_model=LoginSummarySchema)
 async def get_login_by_id(login_id: str):
-    """ID로 Login 정보 조회"""
+    """ID로 Login 정보 조회 (토큰 제외)"""
     login = await login_service.get_login_by_id(login_id)
     if not login:
         raise HTTPException(status_code=404, detail="Login 정보를 찾을 수 없습니다")
     return login
 
-@router.get("/", response_model=List[LoginEntity])
-async def get_login_by_provider(provider: str = Query(..., description="Login 제공자")):
-    """제공자별 Login 정보 조회"""
-    return await login_service.get_login_by_provider(provider)
+@router.get("/", response_model=LoginPageSchema)
+async def get_login_by_provider(
+    provider: str = Query(..., description="Login 제공자"),
+    limit: int = Query(100, ge=1, le=LOGIN_PAGE_MAX, description="한 페이지 항목 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
+):
+    """제공자별 Login 정보 조회 (created_at 순 keyset 페이지네이션, 토큰 제외)"""
+    try:
+        return await login_service.get_login_page(provider, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/", response_model=LoginResponseSchema)
 async def create_login(login_data: LoginSchema):
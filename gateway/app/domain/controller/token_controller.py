@@ -1,8 +1,11 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from fastapi import HTTPException, status
 
 from app.domain.service.token_service import TokenService
-from app.domain.schema.token_schema import TokenSchema, TokenResponseSchema, TokenVerifyResponseSchema
+from app.domain.schema.token_schema import (
+    TokenSchema, TokenResponseSchema, TokenVerifyResponseSchema,
+    TokenBatchVerifySchema, TokenBatchVerifyResponseSchema
+)
 
 class TokenController:
     """토큰 컨트롤러"""
@@ -31,6 +34,18 @@ class TokenController:
                 detail=f"토큰 검증 중 오류 발생: {str(e)}"
             )
     
+    async def verify_many(self, batch: TokenBatchVerifySchema) -> TokenBatchVerifyResponseSchema:
+        """여러 토큰 검증"""
+        try:
+            return TokenBatchVerifyResponseSchema(results=await self.service.verify_many(batch.tokens))
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"토큰 검증 중 오류 발생: {str(e)}"
+            )
+    
     async def revoke_token(self, token: str) -> Dict[str, Any]:
         """토큰 폐기"""
         try:
@@ -0,0 +1,16 @@
+import os
+import hmac
+from fastapi import HTTPException, Request
+
+# ✅ 데이터를 바꾸거나 토큰을 내보내는 관리자 API 의 자격 증명 헤더 (GATEWAY_ADMIN_TOKEN 이 없으면 해당 API 는 꺼짐)
+ADMIN_TOKEN_HEADER = "x-admin-token"
+
+
+def require_admin_token(request: Request):
+    """GATEWAY_ADMIN_TOKEN 과 같은 x-admin-token 헤더가 있어야 통과합니다."""
+    expected = os.getenv("GATEWAY_ADMIN_TOKEN", "")
+    if not expected:
+        raise HTTPException(status_code=403, detail="GATEWAY_ADMIN_TOKEN 이 설정되지 않아 사용할 수 없는 API 입니다.")
+    provided = request.headers.get(ADMIN_TOKEN_HEADER, "")
+    if not hmac.compare_digest(provided.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 올바르지 않습니다.")
@@ -0,0 +1,211 @@
+import os
+import json
+import time
+import base64
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import HTTPException, Request, Response
+from app.domain.model.service_proxy_factory import ServiceProxyFactory, filter_response_headers
+from app.domain.model.response_cache import response_cache
+from app.domain.model.single_flight import single_flight
+from app.domain.model.rate_limiter import rate_limiter
+from app.domain.model.deadline import deadline_scope
+from app.domain.schema.batch_schema import (
+    BatchItemSchema,
+    BatchItemResultSchema,
+    BatchRequestSchema,
+    BatchResponseSchema,
+)
+
+logger = logging.getLogger("gateway_api")
+
+# 배치 하위 요청으로 허용하는 메서드
+BATCH_METHODS = {"GET", "POST", "PUT", "DELETE", "PATCH"}
+
+# 본문을 텍스트로 돌려주는 content-type (그 외 바이너리는 base64)
+TEXT_CONTENT_TYPES = ("text/", "application/xml", "application/javascript")
+
+
+def decode_body(content_type: str, body: bytes) -> Tuple[Any, Optional[str]]:
+    """응답 본문을 JSON 에 담을 수 있는 값과 인코딩으로 변환합니다."""
+    if not body:
+        return None, None
+    if "json" in content_type:
+        try:
+            return json.loads(body), None
+        except ValueError:
+            pass
+    if content_type.startswith(TEXT_CONTENT_TYPES) or "json" in content_type:
+        return body.decode("utf-8", errors="replace"), None
+    return base64.b64encode(body).decode("ascii"), "base64"
+
+
+def sub_request(item: BatchItemSchema) -> Request:
+    """하위 요청을 캐시 키 계산에 쓸 수 있는 Request 객체로 만듭니다."""
+    headers = [
+        (key.lower().encode("latin-1"), value.encode("latin-1"))
+        for key, value in (item.headers or {}).items()
+    ]
+    return Request({
+        "type": "http",
+        "method": item.method.upper(),
+        "path": f"/{item.path.lstrip('/')}",
+        "query_string": b"",
+        "headers": headers,
+    })
+
+
+class BatchDispatcher:
+    """여러 서비스로 가는 하위 요청을 동시에 실행하는 fan-out 처리기
+
+    하위 요청은 단일 요청과 같은 경로(공유 커넥션 풀, 캐시, single-flight,
+    bulkhead / circuit breaker, hedging)를 거칩니다. 하위 요청마다 마감 시간을
+    줄 수 있고, 배치 전체 마감 시간이 지나면 끝나지 않은 요청은 504 로 채웁니다.
+    """
+
+    def __init__(self, max_items: Optional[int] = None, default_timeout: Optional[float] = None):
+        """초기화
+
+        Args:
+            max_items: 배치 하나의 최대 하위 요청 수 (기본 GATEWAY_BATCH_MAX_ITEMS 또는 20)
+            default_timeout: 배치 전체 기본 마감 시간 초 (기본 GATEWAY_BATCH_TIMEOUT 또는 10)
+        """
+        self.max_items = max_items or int(os.getenv("GATEWAY_BATCH_MAX_ITEMS", "20"))
+        self.default_timeout = default_timeout or float(os.getenv("GATEWAY_BATCH_TIMEOUT", "10.0"))
+        self.batches = 0
+        self.items = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    async def _call(self, item: BatchItemSchema) -> Response:
+        """하위 요청 하나를 업스트림으로 보냅니다."""
+        method = item.method.upper()
+        service = item.service.value
+        factory = ServiceProxyFactory.for_service(item.service)
+        request = sub_request(item)
+
+        if method == "GET":
+            ttl = response_cache.ttl_for(service, item.path)
+            if ttl:
+                return await response_cache.fetch(factory, service, item.path, request, ttl)
+            if single_flight.coalesces(service, item.path):
+                key = response_cache.make_key(service, item.path, request)
+                result = await single_flight.do(key, lambda: factory.fetch(item.path, request.headers.raw))
+                return result.to_response()
+            return (await factory.fetch(item.path, request.headers.raw)).to_response()
+
+        response = await factory.request(
+            method=method,
+            path=item.path,
+            headers=request.headers.raw,
+            json=item.body
+        )
+        headers = filter_response_headers(response.headers)
+        headers.pop("content-encoding", None)
+        headers.pop("content-length", None)
+        return Response(content=response.content, status_code=response.status_code, headers=headers)
+
+    async def _run_item(
+        self,
+        item_id: str,
+        item: BatchItemSchema,
+        timeout: float,
+        client: Optional[str] = None
+    ) -> BatchItemResultSchema:
+        """하위 요청 하나를 마감 시간 안에 실행하고 결과로 변환합니다."""
+        started = time.monotonic()
+
+        def result(status_code: int, **fields) -> BatchItemResultSchema:
+            return BatchItemResultSchema(
+                id=item_id,
+                status_code=status_code,
+                elapsed_ms=round((time.monotonic() - started) * 1000, 2),
+                **fields
+            )
+
+        if item.method.upper() not in BATCH_METHODS:
+            return result(405, error=f"지원하지 않는 메서드입니다: {item.method}")
+        try:
+            if client is not None:
+                # 하위 요청도 단일 요청과 같은 클라이언트 허용량을 사용
+                await rate_limiter.check(item.service, client)
+            # 하위 요청 마감을 백엔드까지 전달 (x-deadline-ms)
+            with deadline_scope(timeout):
+                response = await asyncio.wait_for(self._call(item), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            return result(504, error=f"하위 요청 마감 시간({timeout:.2f}s)을 초과했습니다.")
+        except HTTPException as e:
+            self.errors += 1
+            return result(e.status_code, error=str(e.detail))
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"❌ 배치 하위 요청 실패 ({item_id}): {str(e)}")
+            return result(502, error=str(e))
+
+        content_type = response.headers.get("content-type", "")
+        body, encoding = decode_body(content_type, response.body)
+        return result(
+            response.status_code,
+            content_type=content_type or None,
+            body=body,
+            encoding=encoding
+        )
+
+    async def dispatch(self, batch: BatchRequestSchema, client: Optional[str] = None) -> BatchResponseSchema:
+        """배치의 모든 하위 요청을 동시에 실행합니다.
+
+        Args:
+            batch: 하위 요청 목록과 전체 마감 시간
+            client: rate limit 에 사용할 클라이언트 식별자 (없으면 제한하지 않음)
+        """
+        if len(batch.requests) > self.max_items:
+            raise HTTPException(
+                status_code=400,
+                detail=f"배치에는 최대 {self.max_items}개의 요청만 담을 수 있습니다."
+            )
+        started = time.monotonic()
+        deadline = batch.timeout or self.default_timeout
+        ids = [item.id or str(index) for index, item in enumerate(batch.requests)]
+        self.batches += 1
+        self.items += len(ids)
+
+        tasks: List[asyncio.Task] = [
+            asyncio.ensure_future(self._run_item(item_id, item, min(item.timeout or deadline, deadline), client))
+            for item_id, item in zip(ids, batch.requests)
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+
+        results = []
+        for item_id, task in zip(ids, tasks):
+            if task in done:
+                results.append(task.result())
+            else:
+                self.timeouts += 1
+                results.append(BatchItemResultSchema(
+                    id=item_id,
+                    status_code=504,
+                    error=f"배치 마감 시간({deadline:.2f}s)을 초과했습니다.",
+                    elapsed_ms=round(deadline * 1000, 2)
+                ))
+        elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+        logger.info(f"📦 배치 처리 완료: {len(results)}건, {elapsed_ms}ms")
+        return BatchResponseSchema(results=results, elapsed_ms=elapsed_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        """배치 처리 통계를 반환합니다."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "max_items": self.max_items,
+            "default_timeout": self.default_timeout,
+        }
+
+
+# ✅ 게이트웨이 전역 배치 처리기
+batch_dispatcher = BatchDispatcher()
@@ -0,0 +1,171 @@
+import os
+import time
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+import httpx
+from app.domain.model.hedging import LatencyWindow
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+# ✅ 남은 처리 시간(ms)을 백엔드로 전달하는 헤더
+DEADLINE_HEADER = "x-deadline-ms"
+
+# 현재 요청의 마감 시각 (time.monotonic 기준, 없으면 None)
+_deadline: ContextVar[Optional[float]] = ContextVar("gateway_deadline", default=None)
+
+
+def remaining() -> Optional[float]:
+    """현재 요청의 남은 시간 초 (마감이 없으면 None)"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """블록 안의 요청 마감을 지금부터 seconds 초 뒤로 줄입니다 (이미 더 이르면 그대로)."""
+    current = _deadline.get()
+    if seconds is not None:
+        candidate = time.monotonic() + seconds
+        if current is None or candidate < current:
+            current = candidate
+    token = _deadline.set(current)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def budget_from_headers(headers) -> Optional[float]:
+    """요청 헤더의 x-deadline-ms 를 초 단위 남은 시간으로 읽습니다 (없거나 잘못되면 None)."""
+    if not headers:
+        return None
+    for key, value in (headers.items() if hasattr(headers, "items") else headers):
+        key = key.decode("latin-1") if isinstance(key, bytes) else key
+        if key.lower() == DEADLINE_HEADER:
+            try:
+                return max(0.0, float(value.decode("latin-1") if isinstance(value, bytes) else value) / 1000)
+            except ValueError:
+                return None
+    return None
+
+
+def with_deadline_header(headers, seconds: Optional[float]) -> Optional[List[Tuple[Any, Any]]]:
+    """요청 헤더에서 기존 x-deadline-ms 를 빼고 남은 시간을 새로 넣습니다.
+
+    같은 이름의 헤더(Cookie, Forwarded 등)가 합쳐지지 않도록 (이름, 값) 목록으로 반환합니다.
+    """
+    result = [
+        (key, value) for key, value in (headers.items() if hasattr(headers, "items") else headers or [])
+        if (key.decode("latin-1") if isinstance(key, bytes) else key).lower() != DEADLINE_HEADER
+    ]
+    if seconds is not None:
+        result.append((DEADLINE_HEADER, str(max(0, int(seconds * 1000)))))
+    return result or None
+
+
+async def within(awaitable: Awaitable[Any], seconds: Optional[float]) -> Any:
+    """seconds 안에 끝나지 않으면 취소하고 httpx.ReadTimeout 을 올립니다.
+
+    httpx 의 read 타임아웃은 읽기 한 번 단위라 응답 전체가 마감 안에 끝나는 것을 보장하지 않습니다.
+    """
+    if seconds is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, seconds)
+    except asyncio.TimeoutError:
+        raise httpx.ReadTimeout(f"요청 마감 시간({seconds:.2f}s)을 초과했습니다.")
+
+
+class AdaptiveTimeouts:
+    """경로별로 관측한 지연 백분위수에서 업스트림 타임아웃을 정합니다.
+
+    타임아웃 = 지연 percentile × multiplier 를 [min_timeout, ceiling] 으로 자른 값이며,
+    ceiling 은 라우트 설정의 timeout 또는 서비스 타임아웃입니다. 표본이 min_samples 보다
+    적으면 ceiling 을 그대로 씁니다. 타임아웃으로 끝난 요청은 걸린 시간을 표본으로 남겨
+    백엔드가 느려지면 타임아웃도 ceiling 까지 다시 늘어납니다.
+    """
+
+    def __init__(
+        self,
+        percentile: Optional[float] = None,
+        multiplier: Optional[float] = None,
+        min_timeout: Optional[float] = None,
+        min_samples: Optional[int] = None,
+        max_routes: int = 256
+    ):
+        """초기화
+
+        Args:
+            percentile: 기준 백분위수 (기본 GATEWAY_TIMEOUT_PERCENTILE 또는 99)
+            multiplier: 백분위 지연에 곱할 여유 배수 (기본 GATEWAY_TIMEOUT_MULTIPLIER 또는 3)
+            min_timeout: 최소 타임아웃 초 (기본 GATEWAY_TIMEOUT_MIN 또는 1)
+            min_samples: 적응을 시작하기 위한 최소 표본 수 (기본 GATEWAY_TIMEOUT_MIN_SAMPLES 또는 20)
+            max_routes: 표본을 유지할 최대 경로 수 (넘으면 새 경로는 ceiling 사용)
+        """
+        self.percentile = percentile or float(os.getenv("GATEWAY_TIMEOUT_PERCENTILE", "99"))
+        self.multiplier = multiplier or float(os.getenv("GATEWAY_TIMEOUT_MULTIPLIER", "3"))
+        self.min_timeout = min_timeout if min_timeout is not None else float(os.getenv("GATEWAY_TIMEOUT_MIN", "1.0"))
+        self.min_samples = min_samples if min_samples is not None else int(os.getenv("GATEWAY_TIMEOUT_MIN_SAMPLES", "20"))
+        self.max_routes = max_routes
+        self._latency: Dict[Tuple[str, str], LatencyWindow] = {}
+        self._ceilings: Dict[Tuple[str, str], float] = {}
+        self.timeouts = 0
+        self.expired = 0
+
+    def timeout_for(self, service_type: ServiceType, route: str, ceiling: float) -> float:
+        """경로의 현재 타임아웃 초"""
+        key = (service_type.value, route)
+        # 경로는 클라이언트가 정하므로 record 와 같이 max_routes 개까지만 기록
+        if key in self._ceilings or len(self._ceilings) < self.max_routes:
+            self._ceilings[key] = ceiling
+        window = self._latency.get(key)
+        if window is None or len(window) < self.min_samples:
+            return ceiling
+        return min(ceiling, max(self.min_timeout, window.percentile(self.percentile) * self.multiplier))
+
+    def record(self, service_type: ServiceType, route: str, seconds: float, timed_out: bool = False):
+        """업스트림 응답 시간을 기록합니다 (timed_out 이면 타임아웃까지 걸린 시간)."""
+        key = (service_type.value, route)
+        window = self._latency.get(key)
+        if window is None:
+            if len(self._latency) >= self.max_routes:
+                return
+            window = self._latency[key] = LatencyWindow()
+        window.add(seconds)
+        if timed_out:
+            self.timeouts += 1
+
+    def reset(self):
+        self._latency.clear()
+        self._ceilings.clear()
+        self.timeouts = 0
+        self.expired = 0
+
+    def stats(self) -> dict:
+        routes = {}
+        for (service, route), ceiling in sorted(self._ceilings.items()):
+            window = self._latency.get((service, route))
+            routes[f"{service}/{route}"] = {
+                "samples": len(window) if window else 0,
+                "p50_ms": round(window.percentile(50) * 1000, 2) if window else None,
+                "p99_ms": round(window.percentile(99) * 1000, 2) if window else None,
+                "timeout_s": round(self.timeout_for(ServiceType(service), route, ceiling), 3),
+                "ceiling_s": ceiling,
+            }
+        return {
+            "percentile": self.percentile,
+            "multiplier": self.multiplier,
+            "min_timeout": self.min_timeout,
+            "min_samples": self.min_samples,
+            "timeouts": self.timeouts,
+            "expired": self.expired,
+            "routes": routes,
+        }
+
+
+# ✅ 게이트웨이 전역 적응형 타임아웃
+adaptive_timeouts = AdaptiveTimeouts()
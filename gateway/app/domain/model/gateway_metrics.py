@@ -0,0 +1,250 @@
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.domain.model.service_type import ServiceType
+from app.domain.model.service_client_pool import client_pool
+
+# 게이트웨이 API 경로 접두사 (이 뒤의 첫 경로 조각이 서비스 이름)
+API_PREFIX = "/ai/v1/"
+
+# 라벨로 기록하는 메서드 (그 외는 OTHER 로 묶어 라벨 수를 제한)
+KNOWN_METHODS = {"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"}
+
+# ✅ 기본 지연 시간 버킷 (초) - 캐시 hit 수 ms 부터 tf 모자이크 처리 수십 초까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+SERVICE_NAMES = {service.value for service in ServiceType}
+
+Labels = Tuple[str, ...]
+
+
+def escape(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...]):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels, amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, labels: Labels) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self, kind: str = "counter") -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {kind}"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{format_labels(self.labelnames, labels)} {format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """라벨별 현재 값"""
+
+    def set(self, labels: Labels, value: float):
+        self._values[labels] = value
+
+    def dec(self, labels: Labels, amount: float = 1.0):
+        self.inc(labels, -amount)
+
+    def render(self, kind: str = "gauge") -> List[str]:
+        return super().render(kind)
+
+
+class Histogram:
+    """라벨별 고정 버킷 히스토그램
+
+    관측 시에는 해당 버킷 하나만 올리고(bisect, O(log 버킷 수)),
+    누적 합은 스크레이프할 때 계산합니다.
+    """
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...], buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 → [버킷별 개수..., +Inf 개수, 합계]
+        self._series: Dict[Labels, list] = {}
+
+    def observe(self, labels: Labels, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, labels: Labels) -> int:
+        series = self._series.get(labels)
+        return sum(series[:-1]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = f'le="{format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {format_value(series[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+def service_label(path: str) -> str:
+    """요청 경로에서 서비스 라벨을 구합니다 (서비스 경로가 아니면 gateway)."""
+    if path.startswith(API_PREFIX):
+        service = path[len(API_PREFIX):].split("/", 1)[0]
+        if service in SERVICE_NAMES:
+            return service
+    return "gateway"
+
+
+def method_label(method: str) -> str:
+    method = method.upper()
+    return method if method in KNOWN_METHODS else "OTHER"
+
+
+class GatewayMetrics:
+    """게이트웨이 요청/업스트림 지표 (Prometheus 텍스트 형식으로 노출)
+
+    외부 라이브러리 없이 프로세스 안에서 집계하며, 기록 비용 자체도
+    gateway_metrics_overhead_seconds_total 로 측정해 함께 노출합니다.
+    """
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        """초기화
+
+        Args:
+            buckets: 지연 시간 히스토그램 버킷 (기본 DEFAULT_BUCKETS 또는 GATEWAY_METRICS_BUCKETS)
+        """
+        if buckets is None:
+            env_buckets = os.getenv("GATEWAY_METRICS_BUCKETS")
+            buckets = tuple(float(b) for b in env_buckets.split(",")) if env_buckets else DEFAULT_BUCKETS
+        self.requests = Counter(
+            "gateway_requests_total", "게이트웨이가 처리한 요청 수", ("service", "method", "status"))
+        self.request_duration = Histogram(
+            "gateway_request_duration_seconds", "게이트웨이 요청 전체 처리 시간", ("service", "method"), buckets)
+        self.response_bytes = Counter(
+            "gateway_response_bytes_total", "클라이언트로 보낸 응답 본문 바이트", ("service", "method"))
+        self.in_flight = Gauge(
+            "gateway_in_flight_requests", "처리 중인 게이트웨이 요청 수", ("service",))
+        self.upstream_requests = Counter(
+            "gateway_upstream_requests_total", "업스트림 호출 수 (status=error 는 응답 전 실패)", ("service", "method", "status"))
+        self.upstream_duration = Histogram(
+            "gateway_upstream_duration_seconds", "업스트림 응답 헤더까지의 시간", ("service", "method"), buckets)
+        self.overhead = Counter(
+            "gateway_metrics_overhead_seconds_total", "지표 기록에 사용한 누적 시간", ())
+        self.observations = Counter(
+            "gateway_metrics_observations_total", "지표 기록 횟수", ())
+
+    def begin_request(self, service: str):
+        self.in_flight.inc((service,))
+
+    def end_request(self, service: str, method: str, status: int, seconds: float, body_bytes: int):
+        """게이트웨이 요청 하나를 기록합니다."""
+        started = time.perf_counter()
+        method = method_label(method)
+        self.in_flight.dec((service,))
+        self.requests.inc((service, method, str(status)))
+        self.request_duration.observe((service, method), seconds)
+        self.response_bytes.inc((service, method), body_bytes)
+        self._account(started)
+
+    def observe_upstream(self, service: ServiceType, method: str, status: Optional[int], seconds: float):
+        """업스트림 호출 하나를 기록합니다 (status 가 None 이면 오류)."""
+        started = time.perf_counter()
+        method = method_label(method)
+        self.upstream_requests.inc((service.value, method, str(status) if status is not None else "error"))
+        self.upstream_duration.observe((service.value, method), seconds)
+        self._account(started)
+
+    def _account(self, started: float):
+        self.overhead.inc((), time.perf_counter() - started)
+        self.observations.inc(())
+
+    def _pool_lines(self) -> List[str]:
+        """커넥션 풀 상태는 스크레이프 시점에 읽습니다."""
+        stats = client_pool.stats()
+        connections = Gauge("gateway_pool_connections", "업스트림 커넥션 수", ("service", "state"))
+        utilization = Gauge("gateway_pool_utilization_ratio", "사용 중 커넥션 / 최대 커넥션", ("service",))
+        upstream_in_flight = Gauge("gateway_upstream_in_flight_requests", "진행 중인 업스트림 호출 수", ("service",))
+        for service, pool in stats.items():
+            connections.set((service, "active"), pool["active_connections"])
+            connections.set((service, "idle"), pool["idle_connections"])
+            if pool["max_connections"]:
+                utilization.set((service,), round(pool["active_connections"] / pool["max_connections"], 4))
+            upstream_in_flight.set((service,), pool["in_flight"])
+        return connections.render() + utilization.render() + upstream_in_flight.render()
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)으로 지표를 출력합니다."""
+        lines: List[str] = []
+        for metric in (
+            self.requests, self.request_duration, self.response_bytes, self.in_flight,
+            self.upstream_requests, self.upstream_duration, self.overhead, self.observations,
+        ):
+            lines.extend(metric.render())
+        lines.extend(self._pool_lines())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """요청 수, 전체 처리 시간, 응답 바이트를 기록하는 ASGI 미들웨어
+
+    BaseHTTPMiddleware 와 달리 응답 본문을 감싸지 않고 send 만 관찰하므로
+    스트리밍 응답에도 추가 버퍼링이 없습니다.
+    """
+
+    def __init__(self, app, metrics: Optional[GatewayMetrics] = None):
+        self.app = app
+        self.metrics = metrics or gateway_metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        service = service_label(scope["path"])
+        started = time.perf_counter()
+        status = 500
+        body_bytes = 0
+
+        async def send_wrapper(message):
+            nonlocal status, body_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        self.metrics.begin_request(service)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.end_request(service, scope["method"], status, time.perf_counter() - started, body_bytes)
+
+
+# ✅ 게이트웨이 전역 지표
+gateway_metrics = GatewayMetrics()
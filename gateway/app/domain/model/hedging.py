@@ -0,0 +1,283 @@
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+import httpx
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+# hedging / 재시도를 적용할 수 있는 멱등 메서드
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# 재시도해도 안전한 일시적 연결 오류 (요청이 백엔드에 도달하지 않은 경우)
+TRANSIENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# ✅ 기본 hedging 대상 경로 - 가볍고 멱등인 titanic / crime 조회
+DEFAULT_HEDGE_ROUTES: Set[Tuple[str, str]] = {
+    ("titanic", "predict"),
+    ("crime", "view-map"),
+}
+
+
+def parse_routes(value: str) -> Set[Tuple[str, str]]:
+    """`titanic/predict,crime/view-map` 형식의 경로 목록을 읽습니다."""
+    routes = set()
+    for item in value.split(","):
+        service, _, path = item.strip().partition("/")
+        if service:
+            routes.add((service, path.strip("/")))
+    return routes
+
+
+class RetryBudget:
+    """재시도/hedge 요청 수를 전체 요청 대비 비율로 제한하는 토큰 버킷
+
+    요청마다 ratio 만큼 토큰이 쌓이고 재시도나 hedge 한 번에 토큰 1개를 씁니다.
+    트래픽이 적을 때를 위해 초당 min_per_second 개가 추가로 채워지며,
+    잔액은 max_tokens 를 넘지 않습니다. 장애 중에도 재시도가 요청량의 ratio 를
+    넘지 않으므로 재시도가 장애를 증폭시키지 않습니다.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 5.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.balance = min(max_tokens, min_per_second)
+        self._refilled_at = time.monotonic()
+        self.deposits = 0
+        self.withdrawals = 0
+        self.exhausted = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.balance = min(self.max_tokens, self.balance + (now - self._refilled_at) * self.min_per_second)
+        self._refilled_at = now
+
+    def deposit(self):
+        """일반 요청 한 건을 기록합니다."""
+        self._refill()
+        self.balance = min(self.max_tokens, self.balance + self.ratio)
+        self.deposits += 1
+
+    def withdraw(self) -> bool:
+        """재시도/hedge 한 건에 쓸 토큰을 꺼냅니다. 부족하면 False."""
+        self._refill()
+        if self.balance >= 1.0 - 1e-9:
+            self.balance -= 1.0
+            self.withdrawals += 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def stats(self) -> dict:
+        self._refill()
+        return {
+            "balance": round(self.balance, 2),
+            "ratio": self.ratio,
+            "min_per_second": self.min_per_second,
+            "requests": self.deposits,
+            "spent": self.withdrawals,
+            "exhausted": self.exhausted,
+        }
+
+
+class LatencyWindow:
+    """최근 응답 지연 시간 표본"""
+
+    def __init__(self, size: int = 256):
+        self._samples = deque(maxlen=size)
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> float:
+        ordered = sorted(self._samples)
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class Hedger:
+    """멱등 요청의 hedging 과 예산 내 재시도
+
+    hedging 대상 경로는 관측된 지연 백분위수(percentile)만큼 기다린 뒤에도
+    응답이 없으면 같은 요청을 한 번 더 보내고, 먼저 도착한 응답을 사용합니다.
+    연결 오류는 RetryBudget 이 허락하는 범위에서 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Set[Tuple[str, str]]] = None,
+        percentile: Optional[float] = None,
+        min_delay: Optional[float] = None,
+        min_samples: Optional[int] = None,
+        retry_attempts: Optional[Dict[ServiceType, int]] = None,
+        budget: Optional[RetryBudget] = None
+    ):
+        """초기화
+
+        Args:
+            routes: hedging 대상 (서비스, 경로) (기본 DEFAULT_HEDGE_ROUTES 또는 GATEWAY_HEDGE_ROUTES)
+            percentile: hedge 지연으로 쓸 백분위수 (기본 GATEWAY_HEDGE_PERCENTILE 또는 95)
+            min_delay: 최소 hedge 지연 초 (기본 GATEWAY_HEDGE_MIN_DELAY 또는 0.02)
+            min_samples: hedging 을 시작하기 위한 최소 표본 수 (기본 20)
+            retry_attempts: 서비스별 최대 재시도 횟수 (기본 GATEWAY_RETRY_ATTEMPTS 또는 <SERVICE>_RETRY_ATTEMPTS)
+            budget: 전역 재시도 예산
+        """
+        if routes is None:
+            env_routes = os.getenv("GATEWAY_HEDGE_ROUTES")
+            routes = parse_routes(env_routes) if env_routes is not None else set(DEFAULT_HEDGE_ROUTES)
+        self.routes = routes
+        self.percentile = percentile or float(os.getenv("GATEWAY_HEDGE_PERCENTILE", "95"))
+        self.min_delay = min_delay if min_delay is not None else float(os.getenv("GATEWAY_HEDGE_MIN_DELAY", "0.02"))
+        self.min_samples = min_samples if min_samples is not None else int(os.getenv("GATEWAY_HEDGE_MIN_SAMPLES", "20"))
+        if retry_attempts is None:
+            default = os.getenv("GATEWAY_RETRY_ATTEMPTS", "2")
+            retry_attempts = {
+                service: int(os.getenv(f"{service.name}_RETRY_ATTEMPTS", default))
+                for service in ServiceType
+            }
+        self.retry_attempts = retry_attempts
+        self.budget = budget or RetryBudget(
+            ratio=float(os.getenv("GATEWAY_RETRY_BUDGET_RATIO", "0.1")),
+            min_per_second=float(os.getenv("GATEWAY_RETRY_BUDGET_MIN_PER_SECOND", "5")),
+        )
+        self._latency: Dict[Tuple[str, str], LatencyWindow] = {}
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.retries = 0
+
+    def hedges_route(self, service_type: ServiceType, path: str) -> bool:
+        return (service_type.value, path.strip("/")) in self.routes
+
+    def hedge_delay(self, service_type: ServiceType, path: str) -> Optional[float]:
+        """경로의 hedge 지연 시간 (표본이 부족하면 None)"""
+        window = self._latency.get((service_type.value, path.strip("/")))
+        if window is None or len(window) < self.min_samples:
+            return None
+        return max(self.min_delay, window.percentile(self.percentile))
+
+    def _record(self, service_type: ServiceType, path: str, seconds: float):
+        key = (service_type.value, path.strip("/"))
+        if key not in self._latency:
+            self._latency[key] = LatencyWindow()
+        self._latency[key].add(seconds)
+
+    async def _with_retries(self, service_type: ServiceType, attempt: Callable[[], Awaitable[Any]]) -> Any:
+        """연결 오류를 예산 안에서 재시도합니다."""
+        retries_left = self.retry_attempts.get(service_type, 0)
+        while True:
+            try:
+                return await attempt()
+            except TRANSIENT_ERRORS as e:
+                if retries_left <= 0 or not self.budget.withdraw():
+                    raise
+                retries_left -= 1
+                self.retries += 1
+                logger.warning(f"🔁 {service_type.value} 연결 오류 재시도: {str(e)}")
+
+    async def run(
+        self,
+        service_type: ServiceType,
+        method: str,
+        path: str,
+        attempt: Callable[[], Awaitable[Any]],
+        discard: Optional[Callable[[Any], Awaitable[None]]] = None
+    ) -> Any:
+        """요청을 실행합니다. 멱등 메서드가 아니면 attempt 를 한 번만 호출합니다.
+
+        Args:
+            service_type: 서비스 종류
+            method: HTTP 메서드
+            path: 요청 경로
+            attempt: 업스트림 호출 한 번을 수행하는 코루틴 함수
+            discard: 사용하지 않게 된 결과(늦게 끝난 hedge 응답)를 정리하는 함수
+        """
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return await attempt()
+
+        self.budget.deposit()
+        started = time.monotonic()
+        delay = self.hedge_delay(service_type, path) if self.hedges_route(service_type, path) else None
+        primary = asyncio.ensure_future(self._with_retries(service_type, attempt))
+        tasks = {primary}
+        # 시도별 시작 시각 (지연 표본은 시도마다 따로 기록)
+        launched = {primary: started}
+        error: Optional[BaseException] = None
+        hedged = delay is None
+        try:
+            while True:
+                timeout = None if hedged else max(0.0, started + delay - time.monotonic())
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    if self.budget.withdraw():
+                        self.hedges += 1
+                        logger.info(f"🪞 {service_type.value}/{path} hedge 요청 전송 ({delay * 1000:.0f}ms 경과)")
+                        hedge = asyncio.ensure_future(self._with_retries(service_type, attempt))
+                        launched[hedge] = time.monotonic()
+                        tasks.add(hedge)
+                    continue
+
+                tasks -= done
+                now = time.monotonic()
+                winners = [task for task in done if not task.cancelled() and task.exception() is None]
+                if winners:
+                    winner = winners[0]
+                    for extra in winners[1:]:
+                        if discard:
+                            await discard(extra.result())
+                    if winner is not primary:
+                        self.hedge_wins += 1
+                    for task in winners:
+                        self._record(service_type, path, now - launched[task])
+                    return winner.result()
+                for task in done:
+                    if not task.cancelled():
+                        error = task.exception()
+                if not tasks:
+                    # 모든 시도가 끝나면 취소된 시도가 아닌 마지막 실패의 예외를 그대로 전달
+                    raise error if error is not None else asyncio.CancelledError()
+        finally:
+            now = time.monotonic()
+            for task in tasks:
+                # 진 시도는 취소 시점까지의 시간(실제 지연의 하한)을 남겨 hedge 지연이 낮게 치우치지 않게 함
+                self._record(service_type, path, now - launched[task])
+                task.cancel()
+                if discard:
+                    task.add_done_callback(lambda t: self._discard_late(t, discard))
+
+    @staticmethod
+    def _discard_late(task: asyncio.Task, discard: Callable[[Any], Awaitable[None]]):
+        """취소 전에 이미 끝난 hedge 결과를 정리합니다."""
+        if not task.cancelled() and task.exception() is None:
+            asyncio.ensure_future(discard(task.result()))
+
+    def stats(self) -> dict:
+        """hedging / 재시도 통계를 반환합니다."""
+        return {
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "retries": self.retries,
+            "budget": self.budget.stats(),
+            "routes": {
+                f"{service}/{path}": {
+                    "samples": len(self._latency.get((service, path), [])),
+                    "hedge_delay_ms": round(d * 1000, 2) if (d := self.hedge_delay(ServiceType(service), path)) else None,
+                }
+                for service, path in sorted(self.routes)
+                if service in ServiceType._value2member_map_
+            },
+            "retry_attempts": {service.value: n for service, n in self.retry_attempts.items()},
+        }
+
+
+# ✅ 게이트웨이 전역 hedger
+hedger = Hedger()
@@ -0,0 +1,185 @@
+import os
+import random
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.domain.model.service_client_pool import client_pool
+
+logger = logging.getLogger("gateway_api")
+
+LEAST_OUTSTANDING = "least_outstanding"
+POWER_OF_TWO = "p2c"
+ROUND_ROBIN = "round_robin"
+
+
+def parse_replicas(value: Optional[str]) -> List[str]:
+    """`http://a:9000,http://b:9000` 형식의 서비스 URL 목록을 읽습니다."""
+    if not value:
+        return []
+    return [url.strip().rstrip("/") for url in value.split(",") if url.strip()]
+
+
+class Replica:
+    """서비스 인스턴스 하나 (진행 중 요청 수와 헬스 상태)"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.healthy = True
+        self.consecutive_failures = 0
+        self.consecutive_successes = 0
+        self.total_requests = 0
+
+    def stats(self) -> dict:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "total_requests": self.total_requests,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class UpstreamBalancer:
+    """서비스별 복제본 선택과 능동 헬스 체크
+
+    복제본 목록은 SERVICE_URLS 의 값(쉼표로 구분된 URL)에서 만들고,
+    백그라운드 작업이 주기적으로 헬스 경로를 호출해 복제본을 제외/재투입합니다.
+    모든 복제본이 제외된 경우에는 전체 복제본 중에서 선택합니다 (fail-open).
+    """
+
+    def __init__(
+        self,
+        policy: Optional[str] = None,
+        interval: Optional[float] = None,
+        unhealthy_threshold: Optional[int] = None,
+        healthy_threshold: Optional[int] = None
+    ):
+        """초기화
+
+        Args:
+            policy: 부하 분산 정책 (least_outstanding, p2c, round_robin; 기본 GATEWAY_LB_POLICY)
+            interval: 헬스 체크 주기 초 (기본 GATEWAY_HEALTH_INTERVAL 또는 5)
+            unhealthy_threshold: 제외까지 연속 실패 수 (기본 2)
+            healthy_threshold: 재투입까지 연속 성공 수 (기본 2)
+        """
+        self.policy = policy or os.getenv("GATEWAY_LB_POLICY", LEAST_OUTSTANDING)
+        self.interval = interval or float(os.getenv("GATEWAY_HEALTH_INTERVAL", "5.0"))
+        self.unhealthy_threshold = unhealthy_threshold or int(os.getenv("GATEWAY_HEALTH_UNHEALTHY_THRESHOLD", "2"))
+        self.healthy_threshold = healthy_threshold or int(os.getenv("GATEWAY_HEALTH_HEALTHY_THRESHOLD", "2"))
+        self._replicas: Dict[ServiceType, List[Replica]] = {}
+        self._sources: Dict[ServiceType, str] = {}
+        self._cursor: Dict[ServiceType, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def replicas(self, service_type: ServiceType) -> List[Replica]:
+        """서비스의 복제본 목록 (SERVICE_URLS 가 바뀌면 다시 만듦)"""
+        source = SERVICE_URLS.get(service_type) or ""
+        if self._sources.get(service_type) != source:
+            previous = {replica.url: replica for replica in self._replicas.get(service_type, [])}
+            self._replicas[service_type] = [
+                previous.get(url) or Replica(url) for url in parse_replicas(source)
+            ]
+            self._sources[service_type] = source
+        return self._replicas[service_type]
+
+    def health_path(self, service_type: ServiceType) -> str:
+        return os.getenv(f"{service_type.name}_HEALTH_PATH", os.getenv("GATEWAY_HEALTH_PATH", "/docs"))
+
+    def pick(self, service_type: ServiceType) -> Replica:
+        """정책에 따라 복제본 하나를 선택합니다."""
+        replicas = self.replicas(service_type)
+        if not replicas:
+            raise ValueError(f"Service URL not found for {service_type}")
+        candidates = [replica for replica in replicas if replica.healthy] or replicas
+        if len(candidates) == 1:
+            return candidates[0]
+        if self.policy == ROUND_ROBIN:
+            index = self._cursor.get(service_type, 0)
+            self._cursor[service_type] = index + 1
+            return candidates[index % len(candidates)]
+        if self.policy == POWER_OF_TWO:
+            first, second = random.sample(candidates, 2)
+            return first if first.outstanding <= second.outstanding else second
+        lowest = min(replica.outstanding for replica in candidates)
+        return random.choice([replica for replica in candidates if replica.outstanding == lowest])
+
+    def acquire(self, service_type: ServiceType) -> Replica:
+        """복제본을 선택하고 진행 중 요청 수를 올립니다. 끝나면 release 를 호출해야 합니다."""
+        replica = self.pick(service_type)
+        replica.outstanding += 1
+        replica.total_requests += 1
+        return replica
+
+    @staticmethod
+    def release(replica: Replica):
+        replica.outstanding -= 1
+
+    async def check(self, service_type: ServiceType, replica: Replica):
+        """복제본 하나의 헬스 체크를 수행합니다."""
+        client = client_pool.get_client(service_type)
+        try:
+            response = await client.get(f"{replica.url}{self.health_path(service_type)}", timeout=2.0)
+            ok = response.status_code < 500
+        except Exception:
+            ok = False
+
+        if ok:
+            replica.consecutive_failures = 0
+            replica.consecutive_successes += 1
+            if not replica.healthy and replica.consecutive_successes >= self.healthy_threshold:
+                replica.healthy = True
+                logger.info(f"💚 {service_type.value} 복제본 재투입: {replica.url}")
+        else:
+            replica.consecutive_successes = 0
+            replica.consecutive_failures += 1
+            if replica.healthy and replica.consecutive_failures >= self.unhealthy_threshold:
+                replica.healthy = False
+                logger.warning(f"💔 {service_type.value} 복제본 제외: {replica.url}")
+
+    async def check_all(self):
+        """모든 서비스의 모든 복제본을 동시에 헬스 체크합니다."""
+        await asyncio.gather(*(
+            self.check(service, replica)
+            for service in ServiceType
+            for replica in self.replicas(service)
+        ))
+
+    async def _run(self):
+        while True:
+            try:
+                await self.check_all()
+            except Exception as e:
+                logger.error(f"❌ 헬스 체크 실패: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    async def start_health_checks(self):
+        """백그라운드 헬스 체크를 시작합니다."""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"🩺 헬스 체크 시작 (주기 {self.interval}s, 정책 {self.policy})")
+
+    async def stop_health_checks(self):
+        """백그라운드 헬스 체크를 중지합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, dict]:
+        """서비스별 복제본 상태를 반환합니다."""
+        return {
+            service.value: {
+                "policy": self.policy,
+                "replicas": [replica.stats() for replica in self.replicas(service)],
+            }
+            for service in ServiceType
+        }
+
+
+# ✅ 게이트웨이 전역 업스트림 부하 분산기
+upstream_balancer = UpstreamBalancer()
@@ -0,0 +1,274 @@
+import os
+import time
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple
+from app.domain.model.login_model import LoginEntity
+
+logger = logging.getLogger("gateway_api")
+
+# ✅ Login 캐시 설정
+LOGIN_CACHE_SIZE = int(os.getenv("LOGIN_CACHE_SIZE", "10000"))
+# 항목 유지 시간 상한 (초) - 다른 워커의 변경이 무효화 메시지 없이도 반영되는 최대 지연
+LOGIN_CACHE_TTL = float(os.getenv("LOGIN_CACHE_TTL", "60"))
+# 없는 ID 를 기억하는 시간 (초)
+LOGIN_CACHE_NEGATIVE_TTL = float(os.getenv("LOGIN_CACHE_NEGATIVE_TTL", "5"))
+LOGIN_CACHE_CHANNEL = "gateway:login:invalidate"
+
+# 캐시 전체를 비우라는 무효화 메시지의 ID (대량 가져오기처럼 ID 가 많을 때 청크마다 한 번)
+INVALIDATE_ALL = "*"
+
+
+class LoginCache:
+    """Login 정보 LRU 캐시
+
+    항목은 access token 의 expires_at 또는 ttl 중 이른 시각에 만료되고,
+    DB 에 없는 ID 는 negative_ttl 동안 None 으로 기억합니다.
+    꺼낸 항목은 복사본이라 호출한 쪽에서 수정해도 캐시는 바뀌지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None
+    ):
+        """초기화
+
+        Args:
+            max_entries: 최대 항목 수 (기본 LOGIN_CACHE_SIZE)
+            ttl: 항목 유지 시간 상한 초 (기본 LOGIN_CACHE_TTL, 0 이면 expires_at 까지)
+            negative_ttl: 없는 ID 유지 시간 초 (기본 LOGIN_CACHE_NEGATIVE_TTL)
+        """
+        self.max_entries = LOGIN_CACHE_SIZE if max_entries is None else max_entries
+        self.ttl = LOGIN_CACHE_TTL if ttl is None else ttl
+        self.negative_ttl = LOGIN_CACHE_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        # id → (entity 또는 None, 만료 시각)
+        self._entries: "OrderedDict[str, Tuple[Optional[LoginEntity], float]]" = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, id: str, now: Optional[float] = None) -> Tuple[bool, Optional[LoginEntity]]:
+        """(캐시 적중 여부, entity) - 적중했지만 entity 가 None 이면 없는 ID"""
+        entry = self._entries.get(id)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        entity, expires = entry
+        if expires <= (now if now is not None else time.time()):
+            del self._entries[id]
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(id)
+        if entity is None:
+            self.negative_hits += 1
+            return True, None
+        self.hits += 1
+        return True, entity.model_copy()
+
+    def put(self, entity: LoginEntity, now: Optional[float] = None, persistent: bool = False):
+        """entity 를 저장합니다 (persistent 면 만료 없이 LRU 로만 제거 - DB 없이 실행할 때)."""
+        now = now if now is not None else time.time()
+        expires = now + self.ttl if self.ttl > 0 else float("inf")
+        if persistent:
+            expires = float("inf")
+        elif entity.expires_at is not None:
+            expires = min(expires, entity.expires_at.timestamp())
+        if expires > now:
+            self._store(entity.id, entity.model_copy(), expires)
+        else:
+            self._entries.pop(entity.id, None)
+
+    def put_missing(self, id: str, now: Optional[float] = None):
+        if self.negative_ttl > 0:
+            self._store(id, None, (now if now is not None else time.time()) + self.negative_ttl)
+
+    def _store(self, id: str, entity: Optional[LoginEntity], expires: float):
+        if self.max_entries <= 0:
+            return
+        self._entries[id] = (entity, expires)
+        self._entries.move_to_end(id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, id: str):
+        if self._entries.pop(id, None) is not None:
+            self.invalidations += 1
+
+    def values(self):
+        """만료되지 않은 entity 목록 (DB 없이 실행할 때 제공자별 조회용)"""
+        now = time.time()
+        return [entity.model_copy() for entity, expires in self._entries.values() if entity and expires > now]
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "negative_ttl": self.negative_ttl,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class RedisInvalidationBus:
+    """Redis pub/sub 으로 다른 워커의 Login 캐시 항목을 무효화합니다.
+
+    메시지는 "<워커 ID>:<login id>" 형식이며 자기 자신이 보낸 메시지는 무시합니다.
+    login id 가 INVALIDATE_ALL 이면 캐시 전체를 비웁니다.
+    Redis 오류는 기록만 하고 요청은 계속 처리합니다. 구독이 끊기면 지수 backoff 로 다시
+    구독하고, 끊긴 동안 놓친 메시지가 있을 수 있으므로 다시 구독할 때 캐시를 비웁니다.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        url: Optional[str] = None,
+        channel: str = LOGIN_CACHE_CHANNEL,
+        resubscribe_delay: float = 0.5,
+        max_resubscribe_delay: float = 30.0
+    ):
+        """초기화
+
+        Args:
+            client: redis.asyncio 호환 클라이언트 (없으면 url 로 생성)
+            url: Redis URL (기본 GATEWAY_REDIS_URL 또는 redis://localhost:6379/0)
+            channel: pub/sub 채널
+            resubscribe_delay: 구독이 끊긴 뒤 처음 다시 구독하기까지 기다리는 시간 (초)
+            max_resubscribe_delay: 다시 구독 대기 시간의 상한 (초)
+        """
+        if client is None:
+            import redis.asyncio as redis
+            client = redis.from_url(url or os.getenv("GATEWAY_REDIS_URL", "redis://localhost:6379/0"))
+        self.client = client
+        self.channel = channel
+        self.origin = uuid.uuid4().hex[:12]
+        self.resubscribe_delay = resubscribe_delay
+        self.max_resubscribe_delay = max_resubscribe_delay
+        self._listener: Optional[asyncio.Task] = None
+        self._pubsub = None
+        self.published = 0
+        self.received = 0
+        self.errors = 0
+        self.resubscribes = 0
+
+    async def publish(self, id: str):
+        try:
+            await self.client.publish(self.channel, f"{self.origin}:{id}")
+            self.published += 1
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"❌ Login 캐시 무효화 전파 실패: {str(e)}")
+
+    async def start(self, cache: LoginCache):
+        """채널을 구독하고 받은 ID 를 cache 에서 지우는 작업을 시작합니다."""
+        if self._listener is None:
+            self._pubsub = await self._subscribe()
+            self._listener = asyncio.get_running_loop().create_task(self._listen(cache))
+
+    async def _subscribe(self):
+        pubsub = self.client.pubsub()
+        try:
+            await pubsub.subscribe(self.channel)
+        except BaseException:
+            await self._close_pubsub(pubsub)
+            raise
+        return pubsub
+
+    async def _listen(self, cache: LoginCache):
+        delay = self.resubscribe_delay
+        while True:
+            try:
+                if self._pubsub is None:
+                    self._pubsub = await self._subscribe()
+                    # 끊긴 동안 다른 워커가 보낸 무효화를 놓쳤을 수 있음
+                    cache.clear()
+                    self.resubscribes += 1
+                    logger.info(f"🔄 Login 캐시 무효화 채널 다시 구독: {self.channel}")
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    delay = self.resubscribe_delay
+                    data = message["data"]
+                    origin, _, id = (data.decode() if isinstance(data, bytes) else data).partition(":")
+                    if origin != self.origin:
+                        if id == INVALIDATE_ALL:
+                            cache.clear()
+                        else:
+                            cache.invalidate(id)
+                        self.received += 1
+                raise ConnectionError("구독 연결이 닫혔습니다")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"❌ Login 캐시 무효화 구독 끊김, {delay:.1f}초 뒤 다시 구독: {str(e)}")
+                pubsub, self._pubsub = self._pubsub, None
+                await self._close_pubsub(pubsub)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_resubscribe_delay)
+
+    @staticmethod
+    async def _close_pubsub(pubsub):
+        """구독을 해제하고 pubsub 연결을 닫습니다 (이미 끊긴 연결의 오류는 무시)."""
+        if pubsub is None:
+            return
+        try:
+            await pubsub.unsubscribe()
+        except Exception:
+            pass
+        close = getattr(pubsub, "aclose", None) or getattr(pubsub, "close", None)
+        if close is not None:
+            try:
+                await close()
+            except Exception:
+                pass
+
+    async def close(self):
+        """구독 작업을 멈추고 pubsub 과 Redis 연결을 닫습니다."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        pubsub, self._pubsub = self._pubsub, None
+        await self._close_pubsub(pubsub)
+        close = getattr(self.client, "aclose", None) or getattr(self.client, "close", None)
+        if close is not None:
+            await close()
+
+    def stats(self) -> dict:
+        return {
+            "channel": self.channel,
+            "published": self.published,
+            "received": self.received,
+            "errors": self.errors,
+            "resubscribes": self.resubscribes,
+        }
+
+
+def create_invalidation_bus() -> Optional[RedisInvalidationBus]:
+    """LOGIN_CACHE_INVALIDATION=redis 이면 Redis 무효화 전파를 사용합니다."""
+    if os.getenv("LOGIN_CACHE_INVALIDATION", "none") == "redis":
+        return RedisInvalidationBus()
+    return None
+
+
+# ✅ 게이트웨이 전역 Login 캐시
+login_cache = LoginCache()
@@ -0,0 +1,262 @@
+import os
+import time
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from fastapi import HTTPException, Request
+from pydantic import BaseModel
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+MEMORY_BACKEND = "memory"
+REDIS_BACKEND = "redis"
+
+# ✅ Redis 토큰 버킷 스크립트 - 조회/충전/차감을 원자적으로 수행하고 서버 시간을 사용
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {allowed, tostring(retry_after), tostring(tokens)}
+"""
+
+
+def take_tokens(tokens: float, updated_at: float, now: float, rate: float, burst: float, cost: float = 1.0) -> Tuple[bool, float, float]:
+    """토큰 버킷 한 번 계산 (TOKEN_BUCKET_SCRIPT 와 같은 규칙)
+
+    Returns:
+        (허용 여부, 다시 시도할 때까지의 초, 남은 토큰)
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated_at) * rate)
+    if tokens >= cost:
+        return True, 0.0, tokens - cost
+    return False, (cost - tokens) / rate, tokens
+
+
+class RateLimitRule(BaseModel):
+    """서비스별 허용량 (초당 rate 개, 최대 burst 개까지 누적)"""
+    rate: float = 10.0
+    burst: float = 20.0
+
+    @classmethod
+    def from_env(cls, service_type: ServiceType) -> "RateLimitRule":
+        """`GATEWAY_RATE_LIMIT_RATE/BURST` 가 기본값이고 `TITANIC_RATE_LIMIT_RATE` 처럼 덮어쓸 수 있습니다."""
+        def env(key: str, default: str) -> float:
+            return float(os.getenv(f"{service_type.name}_RATE_LIMIT_{key}", os.getenv(f"GATEWAY_RATE_LIMIT_{key}", default)))
+
+        return cls(rate=env("RATE", "10"), burst=env("BURST", "20"))
+
+
+class RateLimited(HTTPException):
+    """허용량 초과 (429 + Retry-After)"""
+
+    def __init__(self, detail: str, retry_after: float):
+        super().__init__(
+            status_code=429,
+            detail=detail,
+            headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+        )
+
+
+class MemoryBucketStore:
+    """프로세스 메모리 토큰 버킷 저장소 (키당 O(1), 오래 안 쓴 키부터 제거)"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Tuple[bool, float, float]:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [burst, now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                # 제거된 키는 가득 찬 버킷으로 다시 시작하므로 허용 쪽으로만 어긋남
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        allowed, retry_after, bucket[0] = take_tokens(bucket[0], bucket[1], now, rate, burst, cost)
+        bucket[1] = now
+        return allowed, retry_after, bucket[0]
+
+    def clear(self):
+        self._buckets.clear()
+
+    def stats(self) -> dict:
+        return {"keys": len(self._buckets), "max_keys": self.max_keys}
+
+
+class RedisBucketStore:
+    """Redis 토큰 버킷 저장소 (여러 워커가 허용량을 공유)
+
+    스크립트는 EVALSHA 로 실행하고 서버에 없으면(NOSCRIPT) 다시 등록합니다.
+    Redis 에 연결할 수 없으면 요청을 허용하고(fail-open) 오류 수만 기록합니다.
+    """
+
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = "gateway:ratelimit:"):
+        """초기화
+
+        Args:
+            client: redis.asyncio 호환 클라이언트 (없으면 url 로 생성)
+            url: Redis URL (기본 GATEWAY_REDIS_URL 또는 redis://localhost:6379/0)
+            prefix: 키 접두사
+        """
+        if client is None:
+            import redis.asyncio as redis
+            client = redis.from_url(url or os.getenv("GATEWAY_REDIS_URL", "redis://localhost:6379/0"))
+        self.client = client
+        self.prefix = prefix
+        self._sha: Optional[str] = None
+        self.errors = 0
+
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Tuple[bool, float, float]:
+        try:
+            if self._sha is None:
+                self._sha = await self.client.script_load(TOKEN_BUCKET_SCRIPT)
+            try:
+                result = await self.client.evalsha(self._sha, 1, self.prefix + key, rate, burst, cost)
+            except Exception as e:
+                if "NOSCRIPT" not in str(e):
+                    raise
+                self._sha = await self.client.script_load(TOKEN_BUCKET_SCRIPT)
+                result = await self.client.evalsha(self._sha, 1, self.prefix + key, rate, burst, cost)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"❌ Redis rate limit 확인 실패 (허용 처리): {str(e)}")
+            return True, 0.0, burst
+        allowed, retry_after, tokens = result
+        return bool(int(allowed)), float(retry_after), float(tokens)
+
+    def clear(self):
+        pass
+
+    def stats(self) -> dict:
+        return {"errors": self.errors, "prefix": self.prefix}
+
+
+class RateLimiter:
+    """클라이언트(토큰 subject 또는 IP) × ServiceType 별 토큰 버킷 rate limiter
+
+    기본은 꺼져 있으며 GATEWAY_RATE_LIMIT=true 로 켭니다. 토큰이 없는 요청은 IP 로 구분하므로
+    리버스 프록시 뒤에서 켤 때는 GATEWAY_TRUST_FORWARDED=true 도 함께 설정해야 합니다
+    (아니면 모든 클라이언트가 프록시 주소 하나의 버킷을 나눠 씁니다).
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        rules: Optional[Dict[ServiceType, RateLimitRule]] = None,
+        store=None,
+        trust_forwarded: Optional[bool] = None,
+        subject_lookup: Optional[Callable[[str], Optional[str]]] = None
+    ):
+        """초기화
+
+        Args:
+            enabled: 사용 여부 (기본 GATEWAY_RATE_LIMIT 또는 false)
+            rules: 서비스별 허용량 (없는 서비스는 환경 변수에서 읽음)
+            store: 버킷 저장소 (기본 GATEWAY_RATE_LIMIT_BACKEND 가 redis 면 RedisBucketStore, 아니면 메모리)
+            trust_forwarded: X-Forwarded-For 의 첫 주소를 클라이언트 IP 로 사용할지 (기본 GATEWAY_TRUST_FORWARDED)
+            subject_lookup: Bearer 토큰 → 이미 검증된 subject (기본 토큰 서비스의 검증 캐시 조회)
+        """
+        self.enabled = enabled if enabled is not None else os.getenv("GATEWAY_RATE_LIMIT", "false").lower() == "true"
+        self._rules = rules or {}
+        if store is None:
+            backend = os.getenv("GATEWAY_RATE_LIMIT_BACKEND", MEMORY_BACKEND)
+            store = RedisBucketStore() if backend == REDIS_BACKEND else MemoryBucketStore(
+                int(os.getenv("GATEWAY_RATE_LIMIT_MAX_KEYS", "100000")))
+        self.store = store
+        self.trust_forwarded = trust_forwarded if trust_forwarded is not None else \
+            os.getenv("GATEWAY_TRUST_FORWARDED", "false").lower() == "true"
+        self._subject_lookup = subject_lookup
+        self.allowed: Dict[ServiceType, int] = {service: 0 for service in ServiceType}
+        self.limited: Dict[ServiceType, int] = {service: 0 for service in ServiceType}
+
+    def rule_for(self, service_type: ServiceType) -> RateLimitRule:
+        if service_type not in self._rules:
+            self._rules[service_type] = RateLimitRule.from_env(service_type)
+        return self._rules[service_type]
+
+    def subject_lookup(self, token: str) -> Optional[str]:
+        if self._subject_lookup is None:
+            from app.api.token_router import token_controller
+            self._subject_lookup = token_controller.service.cached_subject
+        return self._subject_lookup(token)
+
+    def client_key(self, request: Request) -> str:
+        """요청의 클라이언트 식별자 (검증 캐시에 있는 Bearer 토큰의 sub, 없으면 IP)
+
+        요청마다 서명을 다시 검증하지 않도록 이미 검증된 토큰만 subject 로 인정합니다.
+        검증 전 페이로드의 sub 는 위조로 다른 사용자의 허용량을 쓰거나 한도를 피할 수 있어 쓰지 않습니다.
+        """
+        authorization = request.headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            subject = self.subject_lookup(authorization[7:].strip())
+            if subject:
+                return f"sub:{subject}"
+        if self.trust_forwarded:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                return f"ip:{forwarded.split(',')[0].strip()}"
+        return f"ip:{request.client.host if request.client else 'unknown'}"
+
+    async def check(self, service_type: ServiceType, client: str, cost: float = 1.0):
+        """허용량을 하나 사용합니다. 초과하면 RateLimited(429)."""
+        if not self.enabled:
+            return
+        rule = self.rule_for(service_type)
+        allowed, retry_after, _ = await self.store.take(f"{service_type.value}:{client}", rule.rate, rule.burst, cost)
+        if allowed:
+            self.allowed[service_type] += 1
+            return
+        self.limited[service_type] += 1
+        logger.warning(f"🚦 {service_type.value} 요청 제한: {client} ({retry_after:.2f}s 후 재시도)")
+        raise RateLimited(f"{service_type.value} 서비스 요청 한도를 초과했습니다.", retry_after)
+
+    def reset(self):
+        """메모리 버킷을 비웁니다."""
+        self.store.clear()
+
+    def stats(self) -> dict:
+        """서비스별 허용/제한 수와 저장소 상태를 반환합니다."""
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.store).__name__,
+            "store": self.store.stats(),
+            "services": {
+                service.value: {
+                    **self.rule_for(service).model_dump(),
+                    "allowed": self.allowed[service],
+                    "limited": self.limited[service],
+                }
+                for service in ServiceType
+            },
+        }
+
+
+# ✅ 게이트웨이 전역 rate limiter
+rate_limiter = RateLimiter()
+
+
+async def enforce_rate_limit(request: Request):
+    """프록시 라우트 의존성: 경로의 서비스에 대해 클라이언트 허용량을 확인합니다."""
+    service = request.path_params.get("service")
+    if service in ServiceType._value2member_map_:
+        await rate_limiter.check(ServiceType(service), rate_limiter.client_key(request))
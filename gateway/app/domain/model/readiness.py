@@ -0,0 +1,149 @@
+import os
+import time
+import signal
+import asyncio
+import logging
+import functools
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger("gateway_api")
+
+
+class Readiness:
+    """워밍업/드레인 상태 (/ready 응답)
+
+    무거운 읽기 전용 상태는 gunicorn 마스터가 fork 전에 preload 로 한 번 적재해
+    워커들이 copy-on-write 로 공유합니다. 적재되지 않은 워커(개발용 단일 프로세스 등)는
+    lifespan 에서 백그라운드로 적재하며, 끝날 때까지 /ready 는 503 을 반환합니다.
+    종료 신호를 받으면 install_signal_handlers 가 설치한 핸들러가 곧바로 503 으로 바꾸고,
+    헬스 체크가 트래픽을 뺄 시간을 준 뒤 서버 종료를 시작합니다.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self.ready = False
+        self.draining = False
+        self.error: Optional[str] = None
+        self.preload_seconds = 0.0
+        self.warmup_seconds = 0.0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def preload(self, loader: Callable[[], None]) -> bool:
+        """loader 를 한 번만 실행합니다 (실패하면 기록만 하고 워커가 다시 시도)."""
+        with self._lock:
+            if self.loaded:
+                return True
+            started = time.perf_counter()
+            try:
+                loader()
+                self.loaded = True
+                self.error = None
+            except Exception as e:
+                self.error = str(e)
+                logger.error(f"❌ 읽기 전용 상태 적재 실패: {str(e)}")
+            self.preload_seconds = time.perf_counter() - started
+            if self.loaded:
+                logger.info(f"📦 읽기 전용 상태 적재 완료 ({self.preload_seconds:.2f}s)")
+            return self.loaded
+
+    async def start(
+        self,
+        loader: Optional[Callable[[], None]] = None,
+        worker_init: Optional[Callable[[], None]] = None
+    ):
+        """워커 시작 시 호출합니다.
+
+        Args:
+            loader: fork 전에 적재했어야 할 상태 (이미 적재됐으면 건너뜀)
+            worker_init: fork 후 워커마다 해야 하는 초기화 (JVM 같은 fork 에 안전하지 않은 자원)
+        """
+        self.draining = False
+        if loader is None and worker_init is None:
+            self.ready = True
+            return
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._warm_up(loader, worker_init))
+
+    async def _warm_up(self, loader, worker_init):
+        started = time.perf_counter()
+        if loader is not None and not await asyncio.to_thread(self.preload, loader):
+            return
+        if worker_init is not None:
+            try:
+                await asyncio.to_thread(worker_init)
+            except Exception as e:
+                self.error = str(e)
+                logger.error(f"❌ 워커 초기화 실패: {str(e)}")
+                return
+        self.warmup_seconds = time.perf_counter() - started
+        self.ready = not self.draining
+        logger.info(f"✅ 요청 받을 준비 완료 ({self.warmup_seconds:.2f}s)")
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """진행 중인 워밍업이 끝날 때까지 기다리고 준비 여부를 반환합니다."""
+        if self._task is not None and not self._task.done():
+            await asyncio.wait({self._task}, timeout=timeout)
+        return self.ready
+
+    def install_signal_handlers(self, delay: Optional[float] = None):
+        """SIGTERM/SIGINT 를 받으면 /ready 를 바로 503 으로 바꾸고 delay 초 뒤에 원래 핸들러를 호출합니다.
+
+        uvicorn 은 종료 신호를 받으면 새 연결을 받지 않고 진행 중인 요청을 마친 뒤에야 lifespan
+        종료(drain)를 실행하므로, 그 전에 503 을 보여주려면 신호를 먼저 받아야 합니다. delay 는
+        READINESS_DRAIN_DELAY (기본 5초) 이며 graceful_timeout 보다 짧아야 합니다.
+        lifespan 시작(워커의 메인 스레드)에서 호출합니다.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        delay = delay if delay is not None else float(os.getenv("READINESS_DRAIN_DELAY", "5"))
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous = signal.getsignal(signum)
+            signal.signal(signum, functools.partial(self._on_signal, loop, previous, delay))
+
+    def _on_signal(self, loop, previous, delay, signum, frame):
+        first = not self.draining
+        self.draining = True
+        self.ready = False
+        if first and delay > 0:
+            logger.info(f"🚰 종료 신호 수신 - /ready 503, {delay:.1f}s 뒤 종료 시작")
+            loop.call_soon_threadsafe(loop.call_later, delay, self._forward, previous, signum)
+        else:
+            # 두 번째 신호는 기다리지 않고 바로 전달
+            self._forward(previous, signum)
+
+    @staticmethod
+    def _forward(previous, signum):
+        if callable(previous):
+            previous(signum, None)
+        else:
+            signal.signal(signum, previous)
+            signal.raise_signal(signum)
+
+    async def drain(self):
+        """종료 - /ready 를 503 으로 유지하고 진행 중인 워밍업을 멈춥니다."""
+        self.draining = True
+        self.ready = False
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        logger.info("🚰 드레인 완료 - 워커를 종료합니다.")
+
+    def status(self) -> dict:
+        return {
+            "status": "ready" if self.ready else ("draining" if self.draining else "warming_up"),
+            "loaded": self.loaded,
+            "preload_seconds": round(self.preload_seconds, 4),
+            "warmup_seconds": round(self.warmup_seconds, 4),
+            "error": self.error,
+        }
+
+
+# ✅ 프로세스 전역 준비 상태
+readiness = Readiness()
@@ -0,0 +1,250 @@
+import os
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from fastapi import Request, Response
+from pydantic import BaseModel
+from app.domain.model.service_type import ServiceType
+from app.domain.model.single_flight import single_flight
+from app.domain.model.route_table import route_table
+
+logger = logging.getLogger("gateway_api")
+
+# 캐시 키에 포함되는 요청 헤더 (응답 표현이 달라질 수 있는 헤더)
+VARY_HEADERS = ("accept", "accept-encoding", "accept-language")
+
+# 캐시 키에 해시로 포함되는 자격 증명 헤더 (사용자별 응답이 다른 사용자에게 가지 않도록)
+CREDENTIAL_HEADERS = ("authorization", "cookie")
+
+# 캐시된 응답에 다시 싣지 않는 헤더
+UNCACHED_HEADERS = {
+    "connection", "keep-alive", "transfer-encoding", "content-length",
+    "date", "server", "set-cookie", "etag", "age", "x-cache",
+}
+
+# ✅ 기본 라우트별 TTL (초) - 미리 계산된 결과를 읽기만 하는 GET 경로
+DEFAULT_ROUTE_TTLS: Dict[Tuple[str, str], float] = {
+    (ServiceType.CRIME.value, "view-map"): 300.0,
+    (ServiceType.TITANIC.value, "predict"): 60.0,
+    (ServiceType.NLP.value, "wordcloud"): 600.0,
+}
+
+
+class CacheEntry(BaseModel):
+    """캐시된 업스트림 응답"""
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+    etag: str
+    stored_at: float
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers.items())
+
+
+def parse_route_ttls(value: str) -> Dict[Tuple[str, str], float]:
+    """`crime/view-map=300,nlp/wordcloud=600` 형식의 TTL 설정을 읽습니다."""
+    ttls = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        route, ttl = item.split("=", 1)
+        service, _, path = route.strip().partition("/")
+        ttls[(service, path.strip("/"))] = float(ttl)
+    return ttls
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag 와 일치하는지 확인합니다 (약한 비교)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
+
+
+class ResponseCache:
+    """멱등 GET 응답용 TTL + 메모리 제한 LRU 캐시
+
+    키는 (서비스, 경로, 정렬된 쿼리, VARY_HEADERS 값, 자격 증명 해시) 이며,
+    전체 크기가 max_bytes 를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+        route_ttls: Optional[Dict[Tuple[str, str], float]] = None
+    ):
+        """캐시 초기화
+
+        Args:
+            max_bytes: 전체 캐시 크기 제한 (기본 GATEWAY_CACHE_MAX_BYTES 또는 64MB)
+            max_entry_bytes: 항목 하나의 크기 제한 (기본 GATEWAY_CACHE_MAX_ENTRY_BYTES 또는 8MB)
+            route_ttls: (서비스, 경로) 별 TTL (기본 DEFAULT_ROUTE_TTLS + GATEWAY_CACHE_TTLS)
+        """
+        self.max_bytes = max_bytes or int(os.getenv("GATEWAY_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        self.max_entry_bytes = max_entry_bytes or int(os.getenv("GATEWAY_CACHE_MAX_ENTRY_BYTES", str(8 * 1024 * 1024)))
+        if route_ttls is None:
+            route_ttls = dict(DEFAULT_ROUTE_TTLS)
+            route_ttls.update(parse_route_ttls(os.getenv("GATEWAY_CACHE_TTLS", "")))
+        self.route_ttls = route_ttls
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stores = 0
+
+    def ttl_for(self, service: str, path: str) -> float:
+        """라우트의 TTL 을 반환합니다 (캐시 대상이 아니면 0).
+
+        라우팅 테이블에 cache_ttl 이 지정된 라우트는 그 값을 우선 사용합니다.
+        """
+        route = route_table.match(ServiceType(service), path)
+        if route is not None and route.rule.cache_ttl is not None:
+            return route.rule.cache_ttl
+        return self.route_ttls.get((service, path.strip("/")), 0.0)
+
+    @staticmethod
+    def make_key(service: str, path: str, request: Request) -> tuple:
+        """요청에서 캐시 키를 만듭니다."""
+        query = tuple(sorted(request.query_params.multi_items()))
+        vary = tuple(request.headers.get(name, "") for name in VARY_HEADERS)
+        credentials = "\n".join("\0".join(request.headers.getlist(name)) for name in CREDENTIAL_HEADERS)
+        principal = hashlib.sha256(credentials.encode()).hexdigest() if credentials.strip() else ""
+        return (service, path.strip("/"), query, vary, principal)
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        """유효한 캐시 항목을 조회합니다 (LRU 갱신)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: tuple, status_code: int, headers: Dict[str, str], body: bytes, ttl: float) -> Optional[CacheEntry]:
+        """응답을 저장합니다. 너무 크거나 no-store 인 응답은 저장하지 않습니다."""
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return None
+        stored_headers = {k: v for k, v in headers.items() if k.lower() not in UNCACHED_HEADERS}
+        etag = headers.get("etag") or f'"{hashlib.sha1(body).hexdigest()}"'
+        now = time.monotonic()
+        entry = CacheEntry(
+            status_code=status_code,
+            headers=stored_headers,
+            body=body,
+            etag=etag,
+            stored_at=now,
+            expires_at=now + ttl
+        )
+        if entry.size > self.max_entry_bytes:
+            return None
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._size += entry.size
+        self.stores += 1
+        while self._size > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return entry
+
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def purge(self, service: Optional[str] = None, path: Optional[str] = None) -> int:
+        """캐시 항목을 삭제하고 삭제된 수를 반환합니다."""
+        keys = [
+            key for key in self._entries
+            if (service is None or key[0] == service)
+            and (path is None or key[1] == path.strip("/"))
+        ]
+        for key in keys:
+            self._remove(key)
+        logger.info(f"🧹 캐시 삭제: service={service}, path={path}, {len(keys)}건")
+        return len(keys)
+
+    def respond(self, entry: CacheEntry, request: Request, status: str) -> Response:
+        """캐시 항목으로 응답을 만듭니다 (If-None-Match 일치 시 304)."""
+        headers = dict(entry.headers)
+        headers["etag"] = entry.etag
+        headers["x-cache"] = status
+        headers["age"] = str(int(time.monotonic() - entry.stored_at))
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            self.not_modified += 1
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, status_code=entry.status_code, headers=headers)
+
+    async def fetch(self, factory, service: str, path: str, request: Request, ttl: float) -> Response:
+        """캐시를 거쳐 GET 요청을 처리합니다.
+
+        Args:
+            factory: 업스트림 요청에 사용할 ServiceProxyFactory
+            service: 서비스 이름
+            path: 요청 경로
+            request: 클라이언트 요청
+            ttl: 캐시 유지 시간 (초)
+        """
+        key = self.make_key(service, path, request)
+        if "no-cache" not in request.headers.get("cache-control", "").lower():
+            entry = self.get(key)
+            if entry is not None:
+                return self.respond(entry, request, "HIT")
+        else:
+            self.misses += 1
+
+        # 같은 키의 동시 캐시 miss 는 업스트림 호출 하나로 합칩니다.
+        result = await single_flight.do(key, lambda: factory.fetch(path, request.headers.raw))
+        if result.status_code == 200:
+            entry = self.put(key, result.status_code, result.headers, result.body, ttl)
+            if entry is not None:
+                return self.respond(entry, request, "MISS")
+        return result.to_response()
+
+    def stats(self) -> dict:
+        """캐시 통계를 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "max_entry_bytes": self.max_entry_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "not_modified": self.not_modified,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "routes": {f"{service}/{path}": ttl for (service, path), ttl in self.route_ttls.items()},
+        }
+
+
+# ✅ 게이트웨이 전역 응답 캐시
+response_cache = ResponseCache()
@@ -0,0 +1,251 @@
+import os
+import zlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 사용
+    brotli = None
+
+logger = logging.getLogger("gateway_api")
+
+# ✅ 압축하지 않는 content-type (이미 압축된 형식)
+DEFAULT_SKIP_TYPES = (
+    "image/png", "image/jpeg", "image/gif", "image/webp", "image/avif",
+    "video/", "audio/", "font/woff",
+    "application/zip", "application/gzip", "application/x-gzip", "application/pdf",
+    "application/octet-stream",
+)
+
+# 본문이 없는 응답 상태
+NO_BODY_STATUSES = {204, 304}
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q} 로 읽습니다."""
+    result = {}
+    for item in value.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        result[name] = q
+    return result
+
+
+def choose_encoding(accept_encoding: str, available: Tuple[str, ...]) -> Optional[str]:
+    """클라이언트가 허용하는 인코딩 중 q 값이 가장 높은 것을 고릅니다 (같으면 available 순서)."""
+    if not accept_encoding:
+        return None
+    accepted = parse_accept_encoding(accept_encoding)
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class StreamCompressor:
+    """청크 단위 압축기 (gzip 또는 brotli)"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(chunk)
+        return self._zlib.compress(chunk)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class ResponseCompression:
+    """Accept-Encoding 협상 설정과 통계"""
+
+    def __init__(
+        self,
+        min_size: Optional[int] = None,
+        skip_types: Optional[Tuple[str, ...]] = None,
+        gzip_level: Optional[int] = None,
+        brotli_quality: Optional[int] = None
+    ):
+        """초기화
+
+        Args:
+            min_size: 압축할 최소 본문 크기 bytes (기본 GATEWAY_COMPRESSION_MIN_SIZE 또는 1024)
+            skip_types: 압축하지 않을 content-type 접두사 (기본 DEFAULT_SKIP_TYPES + GATEWAY_COMPRESSION_SKIP_TYPES)
+            gzip_level: gzip 압축 레벨 (기본 GATEWAY_GZIP_LEVEL 또는 6)
+            brotli_quality: brotli 품질 (기본 GATEWAY_BROTLI_QUALITY 또는 4)
+        """
+        self.min_size = min_size if min_size is not None else int(os.getenv("GATEWAY_COMPRESSION_MIN_SIZE", "1024"))
+        if skip_types is None:
+            extra = tuple(t.strip() for t in os.getenv("GATEWAY_COMPRESSION_SKIP_TYPES", "").split(",") if t.strip())
+            skip_types = DEFAULT_SKIP_TYPES + extra
+        self.skip_types = skip_types
+        self.gzip_level = gzip_level if gzip_level is not None else int(os.getenv("GATEWAY_GZIP_LEVEL", "6"))
+        self.brotli_quality = brotli_quality if brotli_quality is not None else int(os.getenv("GATEWAY_BROTLI_QUALITY", "4"))
+        self.encodings: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+        self.compressed: Dict[str, int] = {encoding: 0 for encoding in self.encodings}
+        self.passthrough = 0
+        self.skipped = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def compressible(self, headers: List[Tuple[bytes, bytes]]) -> bool:
+        """응답 헤더를 보고 압축 대상인지 판단합니다."""
+        content_type = ""
+        for key, value in headers:
+            key = key.lower()
+            if key == b"content-encoding":
+                # 업스트림이 이미 압축한 응답은 그대로 전달
+                self.passthrough += 1
+                return False
+            if key == b"content-type":
+                content_type = value.decode("latin-1").lower()
+            elif key == b"content-length" and int(value) < self.min_size:
+                self.skipped += 1
+                return False
+        if content_type.startswith(self.skip_types):
+            self.skipped += 1
+            return False
+        return True
+
+    def compressor(self, encoding: str) -> StreamCompressor:
+        return StreamCompressor(encoding, self.gzip_level, self.brotli_quality)
+
+    def stats(self) -> dict:
+        """압축 통계를 반환합니다."""
+        return {
+            "encodings": list(self.encodings),
+            "min_size": self.min_size,
+            "compressed": self.compressed,
+            "passthrough": self.passthrough,
+            "skipped": self.skipped,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else None,
+            "skip_types": list(self.skip_types),
+        }
+
+
+class CompressionMiddleware:
+    """응답 본문을 스트리밍으로 압축하는 ASGI 미들웨어
+
+    본문 크기를 모를 때는 min_size 까지만 모아 보고 판단하며,
+    그 이후 청크는 도착하는 대로 압축해 내보내므로 전체 본문을 버퍼링하지 않습니다.
+    """
+
+    def __init__(self, app, compression: Optional[ResponseCompression] = None):
+        self.app = app
+        self.compression = compression or response_compression
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept_encoding, self.compression.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, CompressingSender(send, encoding, self.compression))
+
+
+class CompressingSender:
+    """응답 시작 메시지를 잡아 두고 본문을 보고 압축 여부를 정하는 send 래퍼"""
+
+    def __init__(self, send, encoding: str, compression: ResponseCompression):
+        self.send = send
+        self.encoding = encoding
+        self.compression = compression
+        self.start: Optional[dict] = None
+        self.pending: List[bytes] = []
+        self.pending_size = 0
+        self.compressor: Optional[StreamCompressor] = None
+        self.decided = False
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = message.get("headers", [])
+            if message["status"] in NO_BODY_STATUSES or not self.compression.compressible(headers):
+                self.decided = True
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or (self.decided and self.compressor is None):
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.decided:
+            self.pending.append(body)
+            self.pending_size += len(body)
+            if more_body and self.pending_size < self.compression.min_size:
+                return
+            self.decided = True
+            body = b"".join(self.pending)
+            self.pending = []
+            if not more_body and len(body) < self.compression.min_size:
+                # 작은 본문은 압축하지 않고 그대로 보냄
+                self.compression.skipped += 1
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": body, "more_body": False})
+                return
+            self.compressor = self.compression.compressor(self.encoding)
+            self.compression.compressed[self.encoding] += 1
+            await self.send(self._compressed_start())
+
+        self.compression.bytes_in += len(body)
+        data = self.compressor.compress(body) if body else b""
+        if not more_body:
+            data += self.compressor.finish()
+        self.compression.bytes_out += len(data)
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _compressed_start(self) -> dict:
+        """압축 응답 헤더 (content-length 제거, Vary 추가, 강한 ETag 는 약한 ETag 로)"""
+        headers = []
+        vary = None
+        for key, value in self.start.get("headers", []):
+            lower = key.lower()
+            if lower == b"content-length":
+                continue
+            if lower == b"vary":
+                vary = value
+                continue
+            if lower == b"etag" and not value.startswith(b"W/"):
+                value = b"W/" + value
+            headers.append((key, value))
+        if vary is None:
+            vary = b"Accept-Encoding"
+        elif b"accept-encoding" not in vary.lower():
+            vary = vary + b", Accept-Encoding"
+        headers.append((b"vary", vary))
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        return {**self.start, "headers": headers}
+
+
+# ✅ 게이트웨이 전역 응답 압축 설정
+response_compression = ResponseCompression()
@@ -0,0 +1,186 @@
+import os
+import json
+import time
+import logging
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+# 모든 서비스에 적용되는 라우트의 서비스 값
+ANY_SERVICE = "*"
+
+# ✅ 라우트 파일 기본 위치 (gateway/routes.json)
+DEFAULT_ROUTES_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "routes.json"
+)
+
+# ✅ 라우트 파일이 없을 때 사용하는 기본 라우트 (기존 경로 재작성 규칙)
+DEFAULT_ROUTES = [
+    {"service": ANY_SERVICE, "path": "titanic", "match": "exact", "rewrite": "titanic/predict"},
+    {"service": ANY_SERVICE, "path": "matzip", "match": "exact", "rewrite": "matzip/predict"},
+    {"service": ANY_SERVICE, "path": "crime", "match": "exact", "rewrite": "crime/predict"},
+    {"service": ANY_SERVICE, "path": "nlp", "match": "exact", "rewrite": "nlp/wordcloud"},
+]
+
+
+class RouteRule(BaseModel):
+    """라우트 설정 하나"""
+    service: str = Field(ANY_SERVICE, description="서비스 이름 (* 이면 모든 서비스)")
+    path: str = Field(..., description="매칭할 경로 (서비스 내 경로)")
+    match: Literal["exact", "prefix"] = Field("prefix", description="정확히 일치 / 경로 조각 단위 접두사")
+    rewrite: Optional[str] = Field(None, description="매칭된 부분을 바꿀 업스트림 경로")
+    upstream: Optional[str] = Field(None, description="서비스 URL 대신 사용할 업스트림 URL")
+    timeout: Optional[float] = Field(None, gt=0, description="업스트림 요청 타임아웃(초)")
+    cache_ttl: Optional[float] = Field(None, ge=0, description="GET 응답 캐시 TTL(초, 0 이면 캐시 안 함)")
+
+    @property
+    def segments(self) -> List[str]:
+        return [segment for segment in self.path.strip("/").split("/") if segment]
+
+
+class RouteMatch(BaseModel):
+    """경로 조회 결과 (적용된 라우트와 재작성된 경로)"""
+    rule: RouteRule
+    path: str
+
+
+class RouteNode:
+    """경로 조각 단위 prefix trie 노드"""
+    __slots__ = ("children", "exact", "prefix")
+
+    def __init__(self):
+        self.children: Dict[str, "RouteNode"] = {}
+        self.exact: Optional[RouteRule] = None
+        self.prefix: Optional[RouteRule] = None
+
+
+def compile_routes(rules: List[RouteRule]) -> Dict[str, RouteNode]:
+    """라우트 목록을 서비스별 trie 로 컴파일합니다 (같은 경로는 뒤의 설정이 우선)."""
+    roots: Dict[str, RouteNode] = {}
+    for rule in rules:
+        if rule.service != ANY_SERVICE and rule.service not in ServiceType._value2member_map_:
+            raise ValueError(f"알 수 없는 서비스입니다: {rule.service}")
+        node = roots.setdefault(rule.service, RouteNode())
+        for segment in rule.segments:
+            node = node.children.setdefault(segment, RouteNode())
+        if rule.match == "exact":
+            node.exact = rule
+        else:
+            node.prefix = rule
+    return roots
+
+
+def lookup(root: Optional[RouteNode], segments: List[str]) -> Optional[tuple]:
+    """trie 에서 (라우트, 매칭된 조각 수) 를 찾습니다. 정확히 일치 > 가장 긴 접두사 순."""
+    if root is None:
+        return None
+    best = (root.prefix, 0) if root.prefix else None
+    node = root
+    for depth, segment in enumerate(segments, 1):
+        node = node.children.get(segment)
+        if node is None:
+            return best
+        if node.prefix is not None:
+            best = (node.prefix, depth)
+    if node.exact is not None:
+        return node.exact, len(segments)
+    return best
+
+
+class RouteTable:
+    """파일에서 읽어 prefix trie 로 컴파일한 라우팅 테이블
+
+    조회는 경로 조각 수에 비례(O(경로 길이))하고 라우트 수와 무관합니다.
+    파일 수정 시각을 reload_interval 초마다 확인해 바뀌었으면 다시 컴파일하며,
+    새 설정이 잘못되었으면 기존 테이블을 그대로 사용합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, reload_interval: Optional[float] = None):
+        """초기화
+
+        Args:
+            path: 라우트 JSON 파일 경로 (기본 GATEWAY_ROUTES_FILE 또는 gateway/routes.json)
+            reload_interval: 파일 변경 확인 주기 초 (기본 GATEWAY_ROUTES_RELOAD_INTERVAL 또는 2, 0 이면 자동 확인 안 함)
+        """
+        self.path = path or os.getenv("GATEWAY_ROUTES_FILE", DEFAULT_ROUTES_FILE)
+        self.reload_interval = reload_interval if reload_interval is not None else float(
+            os.getenv("GATEWAY_ROUTES_RELOAD_INTERVAL", "2.0"))
+        self.rules: List[RouteRule] = []
+        self._roots: Dict[str, RouteNode] = {}
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self.version = 0
+        self.reloads = 0
+        self.reload_errors = 0
+        self.last_error: Optional[str] = None
+        self.reload(force=True)
+
+    def _read_rules(self) -> List[RouteRule]:
+        if not os.path.exists(self.path):
+            return [RouteRule(**route) for route in DEFAULT_ROUTES]
+        with open(self.path, encoding="utf-8") as f:
+            config = json.load(f)
+        routes = config.get("routes", []) if isinstance(config, dict) else config
+        return [RouteRule(**route) for route in routes]
+
+    def reload(self, force: bool = False) -> bool:
+        """파일이 바뀌었으면(또는 force) 다시 읽어 컴파일합니다. 교체했으면 True."""
+        try:
+            mtime = os.path.getmtime(self.path) if os.path.exists(self.path) else None
+            if not force and mtime == self._mtime:
+                return False
+            rules = self._read_rules()
+            roots = compile_routes(rules)
+        except Exception as e:
+            self.reload_errors += 1
+            self.last_error = str(e)
+            logger.error(f"❌ 라우트 설정 로드 실패 (기존 설정 유지): {str(e)}")
+            return False
+        # 컴파일이 끝난 뒤 한 번에 교체하므로 조회 중인 요청은 이전 또는 새 테이블 중 하나만 봅니다.
+        self.rules, self._roots, self._mtime = rules, roots, mtime
+        self.version += 1
+        self.reloads += 1
+        self.last_error = None
+        logger.info(f"🗺️ 라우트 {len(rules)}개 로드 (v{self.version}, {self.path})")
+        return True
+
+    def _maybe_reload(self):
+        if self.reload_interval <= 0:
+            return
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.reload_interval
+            self.reload()
+
+    def match(self, service_type: ServiceType, path: str) -> Optional[RouteMatch]:
+        """요청 경로에 맞는 라우트를 찾습니다 (서비스 라우트 우선, 없으면 * 라우트)."""
+        self._maybe_reload()
+        segments = [segment for segment in path.strip("/").split("/") if segment]
+        found = lookup(self._roots.get(service_type.value), segments) or lookup(self._roots.get(ANY_SERVICE), segments)
+        if found is None:
+            return None
+        rule, depth = found
+        if rule.rewrite is None:
+            return RouteMatch(rule=rule, path=path)
+        rest = "/".join(segments[depth:])
+        rewritten = rule.rewrite.strip("/")
+        return RouteMatch(rule=rule, path=f"{rewritten}/{rest}" if rest else rewritten)
+
+    def stats(self) -> dict:
+        """라우팅 테이블 상태를 반환합니다."""
+        return {
+            "file": self.path,
+            "version": self.version,
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors,
+            "last_error": self.last_error,
+            "reload_interval": self.reload_interval,
+            "routes": [rule.model_dump(exclude_none=True) for rule in self.rules],
+        }
+
+
+# ✅ 게이트웨이 전역 라우팅 테이블
+route_table = RouteTable()
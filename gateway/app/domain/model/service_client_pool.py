@@ -0,0 +1,159 @@
+import os
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+import httpx
+from pydantic import BaseModel
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+
+class PoolSettings(BaseModel):
+    """업스트림 커넥션 풀 설정"""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    default_timeout: float = 5.0
+    service_timeouts: Dict[ServiceType, float] = {}
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """환경 변수에서 풀 설정을 읽어옵니다.
+
+        서비스별 타임아웃은 `TITANIC_SERVICE_TIMEOUT` 처럼
+        `<SERVICE>_SERVICE_TIMEOUT` 형식으로 지정합니다.
+        """
+        default_timeout = float(os.getenv("GATEWAY_DEFAULT_TIMEOUT", "5.0"))
+        service_timeouts = {}
+        for service in ServiceType:
+            value = os.getenv(f"{service.name}_SERVICE_TIMEOUT")
+            if value:
+                service_timeouts[service] = float(value)
+        return cls(
+            max_connections=int(os.getenv("GATEWAY_POOL_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("GATEWAY_POOL_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=float(os.getenv("GATEWAY_POOL_KEEPALIVE_EXPIRY", "30.0")),
+            connect_timeout=float(os.getenv("GATEWAY_CONNECT_TIMEOUT", "5.0")),
+            default_timeout=default_timeout,
+            service_timeouts=service_timeouts,
+        )
+
+    def timeout_for(self, service_type: ServiceType) -> httpx.Timeout:
+        """서비스별 타임아웃 객체를 반환합니다."""
+        timeout = self.service_timeouts.get(service_type, self.default_timeout)
+        return httpx.Timeout(timeout, connect=min(self.connect_timeout, timeout))
+
+
+class ServiceClientPool:
+    """ServiceType 별로 하나의 httpx.AsyncClient 를 공유하는 풀
+
+    게이트웨이 lifespan 에서 `startup()` 으로 생성하고 `shutdown()` 으로 닫습니다.
+    startup 전에 요청이 들어오면 필요한 클라이언트를 지연 생성합니다.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[PoolSettings] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """풀 초기화
+
+        Args:
+            settings: 풀 설정 (없으면 startup 시 환경 변수에서 읽음)
+            transport: 테스트용 전송 계층
+        """
+        self.settings = settings
+        self._transport = transport
+        self._clients: Dict[ServiceType, httpx.AsyncClient] = {}
+        self._in_flight: Dict[ServiceType, int] = {service: 0 for service in ServiceType}
+        self._total_requests: Dict[ServiceType, int] = {service: 0 for service in ServiceType}
+
+    def _create_client(self, service_type: ServiceType) -> httpx.AsyncClient:
+        """서비스용 클라이언트를 생성합니다."""
+        if self.settings is None:
+            self.settings = PoolSettings.from_env()
+        limits = httpx.Limits(
+            max_connections=self.settings.max_connections,
+            max_keepalive_connections=self.settings.max_keepalive_connections,
+            keepalive_expiry=self.settings.keepalive_expiry,
+        )
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=self.settings.timeout_for(service_type),
+            transport=self._transport,
+        )
+
+    async def startup(self):
+        """모든 서비스의 클라이언트를 생성합니다."""
+        if self.settings is None:
+            self.settings = PoolSettings.from_env()
+        for service in ServiceType:
+            if service not in self._clients:
+                self._clients[service] = self._create_client(service)
+        logger.info(f"🔌 업스트림 커넥션 풀 생성: {[s.value for s in self._clients]}")
+
+    async def shutdown(self):
+        """모든 클라이언트를 닫습니다."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+        logger.info("🔌 업스트림 커넥션 풀 종료")
+
+    def timeout_ceiling(self, service_type: ServiceType) -> float:
+        """서비스 타임아웃 초 (라우트에 timeout 이 없을 때 적응형 타임아웃의 상한)"""
+        if self.settings is None:
+            self.settings = PoolSettings.from_env()
+        return self.settings.service_timeouts.get(service_type, self.settings.default_timeout)
+
+    def get_client(self, service_type: ServiceType) -> httpx.AsyncClient:
+        """서비스의 공유 클라이언트를 반환합니다."""
+        client = self._clients.get(service_type)
+        if client is None or client.is_closed:
+            client = self._create_client(service_type)
+            self._clients[service_type] = client
+        return client
+
+    @asynccontextmanager
+    async def track(self, service_type: ServiceType):
+        """진행 중인 요청 수를 집계합니다."""
+        self._in_flight[service_type] += 1
+        self._total_requests[service_type] += 1
+        try:
+            yield
+        finally:
+            self._in_flight[service_type] -= 1
+
+    def stats(self) -> Dict[str, dict]:
+        """서비스별 풀 통계를 반환합니다."""
+        result = {}
+        for service in ServiceType:
+            client = self._clients.get(service)
+            connections = self._connections(client)
+            idle = sum(1 for conn in connections if conn.is_idle())
+            result[service.value] = {
+                "open": client is not None and not client.is_closed,
+                "in_flight": self._in_flight[service],
+                "total_requests": self._total_requests[service],
+                "connections": len(connections),
+                "idle_connections": idle,
+                "active_connections": len(connections) - idle,
+                "max_connections": self.settings.max_connections if self.settings else None,
+                "max_keepalive_connections": self.settings.max_keepalive_connections if self.settings else None,
+                "keepalive_expiry": self.settings.keepalive_expiry if self.settings else None,
+                "timeout": self.settings.timeout_for(service).read if self.settings else None,
+            }
+        return result
+
+    @staticmethod
+    def _connections(client: Optional[httpx.AsyncClient]) -> list:
+        """httpcore 커넥션 풀의 커넥션 목록 (사용할 수 없으면 빈 목록)"""
+        if client is None:
+            return []
+        pool = getattr(client._transport, "_pool", None)
+        return list(getattr(pool, "connections", []))
+
+
+# ✅ 게이트웨이 전역 커넥션 풀
+client_pool = ServiceClientPool()
@@ -0,0 +1,298 @@
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Dict, Optional
+from fastapi import HTTPException
+from pydantic import BaseModel
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class GuardSettings(BaseModel):
+    """서비스별 bulkhead / circuit breaker 설정"""
+    max_concurrency: int = 50
+    max_queue: int = 100
+    queue_timeout: float = 5.0
+    window_size: int = 20
+    min_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    slow_call_seconds: float = 10.0
+    slow_call_rate_threshold: float = 0.8
+    open_seconds: float = 30.0
+    half_open_calls: int = 2
+
+    @classmethod
+    def from_env(cls, service_type: ServiceType) -> "GuardSettings":
+        """환경 변수에서 설정을 읽어옵니다.
+
+        `GATEWAY_BULKHEAD_*`, `GATEWAY_BREAKER_*` 가 기본값이고,
+        `TF_MAX_CONCURRENCY`, `TF_SLOW_CALL_SECONDS` 처럼 서비스별로 덮어쓸 수 있습니다.
+        """
+        def env(service_key: str, default_key: str, default: str) -> str:
+            return os.getenv(f"{service_type.name}_{service_key}", os.getenv(default_key, default))
+
+        return cls(
+            max_concurrency=int(env("MAX_CONCURRENCY", "GATEWAY_BULKHEAD_MAX_CONCURRENCY", "50")),
+            max_queue=int(env("MAX_QUEUE", "GATEWAY_BULKHEAD_MAX_QUEUE", "100")),
+            queue_timeout=float(env("QUEUE_TIMEOUT", "GATEWAY_BULKHEAD_QUEUE_TIMEOUT", "5.0")),
+            window_size=int(os.getenv("GATEWAY_BREAKER_WINDOW", "20")),
+            min_calls=int(os.getenv("GATEWAY_BREAKER_MIN_CALLS", "10")),
+            failure_rate_threshold=float(os.getenv("GATEWAY_BREAKER_FAILURE_RATE", "0.5")),
+            slow_call_seconds=float(env("SLOW_CALL_SECONDS", "GATEWAY_BREAKER_SLOW_CALL_SECONDS", "10.0")),
+            slow_call_rate_threshold=float(os.getenv("GATEWAY_BREAKER_SLOW_CALL_RATE", "0.8")),
+            open_seconds=float(os.getenv("GATEWAY_BREAKER_OPEN_SECONDS", "30.0")),
+            half_open_calls=int(os.getenv("GATEWAY_BREAKER_HALF_OPEN_CALLS", "2")),
+        )
+
+
+class ServiceUnavailable(HTTPException):
+    """bulkhead 포화 또는 circuit open 으로 즉시 거부"""
+
+    def __init__(self, detail: str, retry_after: float):
+        super().__init__(
+            status_code=503,
+            detail=detail,
+            headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+        )
+
+
+class Bulkhead:
+    """동시 실행 수와 대기열 길이를 제한하는 격벽"""
+
+    def __init__(self, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    async def acquire(self, name: str):
+        """실행 슬롯을 얻습니다. 대기열이 가득 차거나 대기 시간이 지나면 503."""
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self.rejected += 1
+                raise ServiceUnavailable(f"{name} 서비스 요청이 너무 많습니다 (대기열 포화).", 1)
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise ServiceUnavailable(f"{name} 서비스 대기 시간이 초과되었습니다.", 1)
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.active += 1
+
+    def release(self):
+        self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+        }
+
+
+class CircuitBreaker:
+    """오류율/지연 기반 circuit breaker (half-open 탐색 포함)
+
+    최근 window_size 건의 호출 결과 중 실패율 또는 느린 호출 비율이 임계값을
+    넘으면 OPEN 이 되어 즉시 실패합니다. open_seconds 후 HALF_OPEN 에서
+    half_open_calls 건의 탐색 요청이 모두 성공하면 CLOSED 로 돌아갑니다.
+    """
+
+    def __init__(self, settings: GuardSettings):
+        self.settings = settings
+        self.state = CircuitState.CLOSED
+        self._window = deque(maxlen=settings.window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self.rejected = 0
+        self.opened = 0
+
+    def _transition(self, state: CircuitState, name: str):
+        logger.warning(f"⚡ {name} circuit: {self.state.value} → {state.value}")
+        self.state = state
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            self.opened += 1
+        if state == CircuitState.HALF_OPEN:
+            self._probes = 0
+            self._probe_successes = 0
+        if state == CircuitState.CLOSED:
+            self._window.clear()
+
+    def before_call(self, name: str):
+        """호출 전 상태를 확인합니다. OPEN 이면 즉시 503."""
+        if self.state == CircuitState.OPEN:
+            remaining = self._opened_at + self.settings.open_seconds - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise ServiceUnavailable(f"{name} 서비스 circuit 이 열려 있습니다.", remaining)
+            self._transition(CircuitState.HALF_OPEN, name)
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes >= self.settings.half_open_calls:
+                self.rejected += 1
+                raise ServiceUnavailable(f"{name} 서비스 상태를 확인하는 중입니다.", 1)
+            self._probes += 1
+
+    def record(self, name: str, success: bool, elapsed: float):
+        """호출 결과를 기록하고 필요하면 상태를 전환합니다."""
+        slow = elapsed >= self.settings.slow_call_seconds
+        if self.state == CircuitState.HALF_OPEN:
+            if not success or slow:
+                self._transition(CircuitState.OPEN, name)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.settings.half_open_calls:
+                self._transition(CircuitState.CLOSED, name)
+            return
+
+        self._window.append((success, slow))
+        if len(self._window) < self.settings.min_calls:
+            return
+        failures = sum(1 for ok, _ in self._window if not ok)
+        slow_calls = sum(1 for _, is_slow in self._window if is_slow)
+        if (failures / len(self._window) >= self.settings.failure_rate_threshold
+                or slow_calls / len(self._window) >= self.settings.slow_call_rate_threshold):
+            self._transition(CircuitState.OPEN, name)
+
+    def release_probe(self):
+        """결과를 기록하지 않은 탐색 호출의 슬롯을 돌려줍니다."""
+        if self.state == CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def stats(self) -> dict:
+        window = list(self._window)
+        result = {
+            "state": self.state.value,
+            "calls_in_window": len(window),
+            "failure_rate": round(sum(1 for ok, _ in window if not ok) / len(window), 4) if window else 0.0,
+            "slow_call_rate": round(sum(1 for _, slow in window if slow) / len(window), 4) if window else 0.0,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+        if self.state == CircuitState.OPEN:
+            result["retry_after"] = round(max(0.0, self._opened_at + self.settings.open_seconds - time.monotonic()), 2)
+        return result
+
+
+class GuardedCall:
+    """보호된 호출 하나의 결과 (응답 헤더를 받은 시점과 상태 코드)"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.status_code: Optional[int] = None
+        self.elapsed: Optional[float] = None
+
+    def mark_response(self, status_code: int):
+        """응답 헤더를 받았을 때 호출합니다 (지연 시간은 이 시점까지로 계산)."""
+        self.status_code = status_code
+        self.elapsed = time.monotonic() - self.started
+
+
+class ServiceGuard:
+    """ServiceType 별 bulkhead + circuit breaker"""
+
+    def __init__(self, settings: Optional[Dict[ServiceType, GuardSettings]] = None):
+        """초기화
+
+        Args:
+            settings: 서비스별 설정 (없는 서비스는 환경 변수에서 읽음)
+        """
+        self._settings = settings or {}
+        self._bulkheads: Dict[ServiceType, Bulkhead] = {}
+        self._breakers: Dict[ServiceType, CircuitBreaker] = {}
+
+    def _settings_for(self, service_type: ServiceType) -> GuardSettings:
+        if service_type not in self._settings:
+            self._settings[service_type] = GuardSettings.from_env(service_type)
+        return self._settings[service_type]
+
+    def bulkhead(self, service_type: ServiceType) -> Bulkhead:
+        if service_type not in self._bulkheads:
+            s = self._settings_for(service_type)
+            self._bulkheads[service_type] = Bulkhead(s.max_concurrency, s.max_queue, s.queue_timeout)
+        return self._bulkheads[service_type]
+
+    def breaker(self, service_type: ServiceType) -> CircuitBreaker:
+        if service_type not in self._breakers:
+            self._breakers[service_type] = CircuitBreaker(self._settings_for(service_type))
+        return self._breakers[service_type]
+
+    @asynccontextmanager
+    async def protect(self, service_type: ServiceType):
+        """업스트림 호출을 bulkhead 와 circuit breaker 로 보호합니다.
+
+        예외 또는 5xx 응답은 실패로, 4xx 성격의 HTTPException 은 기록하지 않습니다.
+        """
+        name = service_type.value
+        breaker = self.breaker(service_type)
+        bulkhead = self.bulkhead(service_type)
+        breaker.before_call(name)
+        try:
+            await bulkhead.acquire(name)
+        except HTTPException:
+            breaker.release_probe()
+            raise
+        call = GuardedCall()
+        try:
+            yield call
+        except HTTPException as e:
+            if e.status_code >= 500:
+                breaker.record(name, False, time.monotonic() - call.started)
+            else:
+                breaker.release_probe()
+            raise
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except BaseException:
+            breaker.record(name, False, time.monotonic() - call.started)
+            raise
+        else:
+            elapsed = call.elapsed if call.elapsed is not None else time.monotonic() - call.started
+            success = call.status_code is None or call.status_code < 500
+            breaker.record(name, success, elapsed)
+        finally:
+            bulkhead.release()
+
+    def reset(self, service_type: ServiceType):
+        """서비스의 circuit 을 CLOSED 로 되돌립니다."""
+        breaker = self.breaker(service_type)
+        if breaker.state != CircuitState.CLOSED:
+            breaker._transition(CircuitState.CLOSED, service_type.value)
+
+    def stats(self) -> Dict[str, dict]:
+        """서비스별 bulkhead / circuit 상태를 반환합니다."""
+        return {
+            service.value: {
+                "circuit": self.breaker(service).stats(),
+                "bulkhead": self.bulkhead(service).stats(),
+            }
+            for service in ServiceType
+        }
+
+
+# ✅ 게이트웨이 전역 서비스 보호기
+service_guard = ServiceGuard()
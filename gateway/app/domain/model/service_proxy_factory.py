@@ -1,12 +1,78 @@
-from typing import Optional
-from fastapi import HTTPException
+from contextlib import AsyncExitStack, contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+import time
+from fastapi import HTTPException, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel
 import httpx
 import logging
 from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.domain.model.service_client_pool import client_pool
+from app.domain.model.service_guard import service_guard
+from app.domain.model.load_balancer import Replica, upstream_balancer
+from app.domain.model.hedging import hedger
+from app.domain.model.gateway_metrics import gateway_metrics
+from app.domain.model.route_table import RouteMatch, route_table
+from app.domain.model import deadline
+from app.domain.model.deadline import adaptive_timeouts
 
 logger = logging.getLogger("gateway_api")
 
+# 프록시 구간에서 전달하지 않는 hop-by-hop 헤더
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+}
+
+# 버퍼링 조회 시 업스트림으로 전달하지 않는 조건부 요청 헤더 (항상 전체 본문이 필요)
+CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since", "cache-control"}
+
+# 본문 끝까지의 지연을 기록하는 버퍼링 요청의 적응형 타임아웃 경로 접미사 (스트리밍과 표본을 섞지 않음)
+BUFFERED_ROUTE_SUFFIX = ":full"
+
+
+class BufferedResponse(BaseModel):
+    """본문까지 모두 읽은 업스트림 응답 (여러 요청에 공유 가능)"""
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def to_response(self, headers: Optional[Dict[str, str]] = None) -> Response:
+        """클라이언트 응답을 만듭니다."""
+        return Response(content=self.body, status_code=self.status_code, headers={**self.headers, **(headers or {})})
+
+
+def filter_request_headers(headers) -> Optional[List[Tuple[str, str]]]:
+    """업스트림으로 보낼 요청 헤더에서 hop-by-hop 헤더와 host 를 제거합니다 (같은 이름의 헤더는 모두 유지)."""
+    if not headers:
+        return None
+    excluded = HOP_BY_HOP_HEADERS | {"host"}
+    result = []
+    for key, value in (headers.items() if hasattr(headers, "items") else headers):
+        key = key.decode("latin-1") if isinstance(key, bytes) else key
+        value = value.decode("latin-1") if isinstance(value, bytes) else value
+        if key.lower() not in excluded:
+            result.append((key, value))
+    return result
+
+
+def filter_response_headers(headers: httpx.Headers) -> Dict[str, str]:
+    """클라이언트로 돌려줄 응답 헤더에서 hop-by-hop 헤더를 제거합니다."""
+    return {
+        key: value for key, value in headers.items()
+        if key.lower() not in HOP_BY_HOP_HEADERS
+    }
+
 class ServiceProxyFactory:
+    _instances: Dict[ServiceType, "ServiceProxyFactory"] = {}
+
     def __init__(self, service_type: ServiceType):
         self.service_type = service_type
         self.base_url = SERVICE_URLS.get(service_type)
@@ -14,6 +80,80 @@ class ServiceProxyFactory:
             raise ValueError(f"Service URL not found for {service_type}")
         print(f"🔍 Service URL: {self.base_url}")
 
+    @classmethod
+    def for_service(cls, service_type: ServiceType) -> "ServiceProxyFactory":
+        """서비스별로 재사용되는 프록시 인스턴스를 반환합니다."""
+        factory = cls._instances.get(service_type)
+        if factory is None:
+            factory = cls(service_type)
+            cls._instances[service_type] = factory
+        return factory
+
+    def _build_url(self, path: str, base_url: Optional[str] = None, route: Optional[RouteMatch] = None) -> str:
+        """요청 경로를 업스트림 URL 로 변환합니다.
+
+        Args:
+            path: 요청 경로
+            base_url: 요청을 보낼 복제본 URL (없으면 self.base_url)
+            route: 라우팅 테이블 조회 결과 (없으면 여기서 조회)
+        """
+        if route is None:
+            route = route_table.match(self.service_type, path)
+        if route is not None:
+            path = route.path
+            base_url = route.rule.upstream or base_url
+        return f"{(base_url or self.base_url).rstrip('/')}/{path}"
+
+    @staticmethod
+    def _route_key(path: str, route: Optional[RouteMatch], streaming: bool = False) -> str:
+        """지연 통계를 모을 경로 (라우트가 있으면 라우트 경로, 없으면 첫 경로 조각)
+
+        스트리밍은 응답 헤더까지, 버퍼링(캐시 / coalescing / 배치)은 본문 끝까지의 시간을 재므로
+        버퍼링 요청은 BUFFERED_ROUTE_SUFFIX 를 붙인 별도 경로에 모읍니다.
+        """
+        key = route.rule.path.strip("/") if route is not None else path.strip("/").split("/", 1)[0]
+        return key if streaming else key + BUFFERED_ROUTE_SUFFIX
+
+    @contextmanager
+    def _deadline(self, path: str, headers=None, streaming: bool = False):
+        """요청 마감을 정합니다 - 경로의 적응형 타임아웃과 클라이언트가 보낸 x-deadline-ms 중 짧은 쪽.
+
+        hedge / 재시도를 포함한 모든 시도가 이 마감을 함께 씁니다.
+        """
+        route = route_table.match(self.service_type, path)
+        ceiling = route.rule.timeout if route is not None and route.rule.timeout else client_pool.timeout_ceiling(self.service_type)
+        budget = adaptive_timeouts.timeout_for(self.service_type, self._route_key(path, route, streaming), ceiling)
+        incoming = deadline.budget_from_headers(headers)
+        if incoming is not None:
+            budget = min(budget, incoming)
+        with deadline.deadline_scope(budget):
+            yield
+
+    def _target(self, path: str, streaming: bool = False) -> Tuple[Optional[Replica], str, Any, str, Optional[float]]:
+        """라우트를 조회해 (복제본, URL, 타임아웃, 통계 경로, 남은 시간) 을 정합니다.
+
+        라우트에 upstream 이 지정되면 복제본 선택 없이 그 URL 로 보냅니다.
+        복제본을 받았으면 요청이 끝난 뒤 upstream_balancer.release 를 호출해야 합니다.
+        마감이 이미 지났으면 업스트림에 보내지 않고 504 를 올립니다.
+        """
+        left = deadline.remaining()
+        if left is not None and left <= 0:
+            adaptive_timeouts.expired += 1
+            raise HTTPException(status_code=504, detail="요청 마감 시간을 초과했습니다.")
+        route = route_table.match(self.service_type, path)
+        replica = None
+        if route is None or route.rule.upstream is None:
+            replica = upstream_balancer.acquire(self.service_type)
+        url = self._build_url(path, replica.url if replica else None, route)
+        if left is not None:
+            connect = client_pool.settings.connect_timeout if client_pool.settings else left
+            timeout = httpx.Timeout(left, connect=min(connect, left))
+        elif route is not None and route.rule.timeout:
+            timeout = route.rule.timeout
+        else:
+            timeout = httpx.USE_CLIENT_DEFAULT
+        return replica, url, timeout, self._route_key(path, route, streaming), left
+
     async def request(
         self,
         method: str,
@@ -21,7 +161,8 @@ class ServiceProxyFactory:
         headers: list = None,
         json: dict = None,
         data: bytes = None,
-        files: dict = None
+        files: dict = None,
+        content: Any = None
     ) -> httpx.Response:
         """
         서비스로 요청을 전달합니다.
@@ -33,39 +174,208 @@ class ServiceProxyFactory:
             json: JSON 데이터
             data: raw 데이터
             files: 파일 데이터
+            content: raw 본문 (bytes 또는 비동기 스트림)
         """
-        if path == "titanic":
-            path = "titanic/predict"
-        elif path == "matzip":
-            path = "matzip/predict"
-        elif path == "crime":
-            path = "crime/predict"
-        elif path == "nlp":
-            path = "nlp/wordcloud"
-        url = f"{self.base_url}/{path}"
+        async def attempt() -> httpx.Response:
+            return await self._send(method, path, headers, json, data, files, content)
+
+        try:
+            # 멱등 메서드는 hedging / 예산 내 재시도 대상
+            with self._deadline(path, headers):
+                return await hedger.run(self.service_type, method, path, attempt)
+        except HTTPException:
+            raise
+        except httpx.TimeoutException as e:
+            logger.error(f"⏱️ 업스트림 응답 시간 초과: {self.service_type.value}/{path}")
+            raise HTTPException(status_code=504, detail=f"업스트림 응답 시간을 초과했습니다: {str(e) or type(e).__name__}")
+        except Exception as e:
+            logger.error(f"❌ 요청 실패: {str(e)}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        headers: list = None,
+        json: dict = None,
+        data: bytes = None,
+        files: dict = None,
+        content: Any = None
+    ) -> httpx.Response:
+        """복제본 하나에 요청을 한 번 보냅니다 (bulkhead / circuit breaker 적용)."""
+        replica, url, timeout, route_key, left = self._target(path)
         logger.info(f"🌐 요청 전송: {method} {url}")
-        print(f"🔍 Requesting URL: {url}")
-        # 헤더 설정
-        headers_dict = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-        async with httpx.AsyncClient() as client:
+        client = client_pool.get_client(self.service_type)
+        status_code = None
+        started = None
+        timed_out = False
+        try:
+            async with client_pool.track(self.service_type):
+                async with service_guard.protect(self.service_type) as call:
+                    started = time.perf_counter()
+                    try:
+                        response = await deadline.within(client.request(
+                            method=method,
+                            url=url,
+                            headers=deadline.with_deadline_header(headers, left),
+                            json=json,
+                            data=data,
+                            files=files,
+                            content=content,
+                            timeout=timeout
+                        ), left)
+                    except httpx.TimeoutException:
+                        timed_out = True
+                        raise
+                    status_code = response.status_code
+                    call.mark_response(response.status_code)
+            logger.info(f"📥 응답 수신: {response.status_code}")
+            return response
+        finally:
+            if started is not None:
+                elapsed = time.perf_counter() - started
+                gateway_metrics.observe_upstream(self.service_type, method, status_code, elapsed)
+                if timed_out or (status_code is not None and status_code < 500):
+                    adaptive_timeouts.record(self.service_type, route_key, elapsed, timed_out)
+            if replica is not None:
+                upstream_balancer.release(replica)
+
+    async def fetch(self, path: str, headers: list = None) -> BufferedResponse:
+        """
+        GET 응답 본문 전체를 읽어 BufferedResponse 로 반환합니다 (캐시, coalescing 용).
+
+        Args:
+            path: 요청 경로
+            headers: HTTP 헤더
+        """
+        request_headers = [
+            (key, value) for key, value in (filter_request_headers(headers) or [])
+            if key.lower() not in CONDITIONAL_HEADERS
+        ]
+        response = await self.request(method="GET", path=path, headers=request_headers)
+        response_headers = filter_response_headers(response.headers)
+        # response.content 는 이미 디코딩된 본문이고, 길이는 Response 가 다시 계산합니다.
+        response_headers.pop("content-encoding", None)
+        response_headers.pop("content-length", None)
+        return BufferedResponse(
+            status_code=response.status_code,
+            headers=response_headers,
+            body=response.content
+        )
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        headers: list = None,
+        json: dict = None,
+        content: Any = None,
+        files: dict = None
+    ) -> StreamingResponse:
+        """
+        서비스 응답을 파싱하지 않고 그대로 스트리밍합니다 (passthrough 모드).
+
+        상태 코드와 content-type 등 응답 헤더를 유지하며, 본문은 업스트림에서
+        도착하는 대로 raw 바이트로 전달합니다 (디코딩/재인코딩 없음).
+
+        Args:
+            method: HTTP 메서드 (GET, POST, 등)
+            path: 요청 경로
+            headers: HTTP 헤더
+            json: JSON 데이터
+            content: raw 본문 (bytes 또는 비동기 스트림)
+            files: 파일 데이터
+        """
+        async def attempt():
+            return await self._open_stream(method, path, headers, json, content, files)
+
+        async def discard(opened):
+            await opened[1].aclose()
+
+        try:
+            with self._deadline(path, headers, streaming=True):
+                response, stack = await hedger.run(self.service_type, method, path, attempt, discard)
+        except HTTPException:
+            raise
+        except httpx.TimeoutException as e:
+            logger.error(f"⏱️ 업스트림 응답 시간 초과: {self.service_type.value}/{path}")
+            raise HTTPException(status_code=504, detail=f"업스트림 응답 시간을 초과했습니다: {str(e) or type(e).__name__}")
+        except Exception as e:
+            logger.error(f"❌ 요청 실패: {str(e)}")
+            raise HTTPException(status_code=500, detail=str(e))
+        logger.info(f"📥 응답 수신: {response.status_code}")
+
+        async def body():
             try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=dict(headers) if headers else None,
-                    json=json,
-                    data=data,
-                    files=files
-                )
-                logger.info(f"📥 응답 수신: {response.status_code}")
-                print(f"Response status: {response.status_code}")
-                print(f"Request URL: {url}")
-                print(f"Request body: {data}")
-                return response
+                async for chunk in response.aiter_raw():
+                    yield chunk
             except Exception as e:
-                logger.error(f"❌ 요청 실패: {str(e)}")
-                print(f"Request failed: {str(e)}")
-                raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+                # 본문 도중 끊긴 업스트림은 circuit breaker 에 실패로 기록 (클라이언트 연결 종료는 제외)
+                await stack.__aexit__(type(e), e, e.__traceback__)
+                raise
+            finally:
+                await stack.aclose()
+
+        return StreamingResponse(
+            body(),
+            status_code=response.status_code,
+            headers=filter_response_headers(response.headers),
+            background=BackgroundTask(stack.aclose)
+        )
+
+    async def _open_stream(
+        self,
+        method: str,
+        path: str,
+        headers: list = None,
+        json: dict = None,
+        content: Any = None,
+        files: dict = None
+    ) -> Tuple[httpx.Response, AsyncExitStack]:
+        """복제본 하나에 스트리밍 요청을 보내고 응답 헤더까지 받습니다.
+
+        반환된 AsyncExitStack 을 닫으면 응답과 복제본/bulkhead 슬롯이 정리됩니다.
+        """
+        replica, url, timeout, route_key, left = self._target(path, streaming=True)
+        logger.info(f"🌐 스트리밍 요청 전송: {method} {url}")
+        client = client_pool.get_client(self.service_type)
+        stack = AsyncExitStack()
+        if replica is not None:
+            stack.callback(upstream_balancer.release, replica)
+        request_headers = deadline.with_deadline_header(filter_request_headers(headers), left) or []
+        if not any(key.lower() == "accept-encoding" for key, _ in request_headers):
+            # 본문을 그대로 전달하므로 클라이언트가 요청하지 않은 압축을 받지 않도록 함
+            request_headers.append(("accept-encoding", "identity"))
+        try:
+            request = client.build_request(
+                method=method,
+                url=url,
+                headers=request_headers,
+                json=json,
+                content=content,
+                files=files,
+                timeout=timeout
+            )
+            await stack.enter_async_context(client_pool.track(self.service_type))
+            # bulkhead 슬롯은 본문 스트리밍이 끝날 때까지 유지됩니다.
+            call = await stack.enter_async_context(service_guard.protect(self.service_type))
+            started = time.perf_counter()
+            try:
+                response = await deadline.within(client.send(request, stream=True), left)
+            except BaseException as e:
+                elapsed = time.perf_counter() - started
+                gateway_metrics.observe_upstream(self.service_type, method, None, elapsed)
+                if isinstance(e, httpx.TimeoutException):
+                    adaptive_timeouts.record(self.service_type, route_key, elapsed, timed_out=True)
+                raise
+            elapsed = time.perf_counter() - started
+            gateway_metrics.observe_upstream(self.service_type, method, response.status_code, elapsed)
+            if response.status_code < 500:
+                # 스트리밍은 응답 헤더까지의 시간을 기록
+                adaptive_timeouts.record(self.service_type, route_key, elapsed)
+            call.mark_response(response.status_code)
+        except BaseException as e:
+            await stack.__aexit__(type(e), e, e.__traceback__)
+            raise
+        stack.push_async_callback(response.aclose)
+        return response, stack
@@ -9,6 +9,7 @@ class ServiceType(str, Enum):
     TF = "tf"
 
 # ✅ 환경 변수에서 서비스 URL 가져오기
+# 복제본이 여러 개면 쉼표로 구분합니다 (예: http://titanic-1:9000,http://titanic-2:9000)
 TITANIC_SERVICE_URL = os.getenv("TITANIC_SERVICE_URL")
 CRIME_SERVICE_URL = os.getenv("CRIME_SERVICE_URL")
 NLP_SERVICE_URL = os.getenv("NLP_SERVICE_URL")
@@ -0,0 +1,121 @@
+import os
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger("gateway_api")
+
+# ✅ 기본 coalescing 대상 GET 경로 - 고정된 입력 파일에서 같은 결과물(지도 HTML, 전처리 CSV, 워드클라우드)을
+# 다시 만드는 무거운 재계산. 파일을 쓰더라도 한 번 실행하나 여러 번 실행하나 결과가 같으므로 동시 요청이
+# 한 번의 실행을 공유해도 되고, 같은 파일을 동시에 덮어쓰는 경합도 사라짐.
+# titanic/csv 는 요청마다 학습·튜닝 작업을 한 번씩 실행하라는 작업 트리거이므로 넣지 않음.
+DEFAULT_COALESCE_ROUTES: Set[Tuple[str, str]] = {
+    ("crime", "map"),
+    ("crime", "preprocess"),
+    ("crime", "view-map"),
+    ("nlp", "wordcloud"),
+    ("titanic", "predict"),
+}
+
+
+def parse_routes(value: str) -> Set[Tuple[str, str]]:
+    """`crime/map,nlp/wordcloud` 형식의 경로 목록을 읽습니다."""
+    routes = set()
+    for item in value.split(","):
+        service, _, path = item.strip().partition("/")
+        if service:
+            routes.add((service, path.strip("/")))
+    return routes
+
+
+class Flight:
+    """진행 중인 업스트림 호출 하나"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """같은 키의 동시 요청을 하나의 업스트림 호출로 합치는 single-flight 그룹
+
+    첫 요청(leader)이 호출을 별도 Task 로 시작하고, 같은 키로 들어온 요청은
+    그 Task 결과(또는 예외)를 함께 받습니다. Task 는 shield 로 감싸서 기다리므로
+    한 클라이언트가 연결을 끊어도 다른 대기자의 호출은 취소되지 않습니다.
+    """
+
+    def __init__(self, max_waiters: Optional[int] = None, routes: Optional[Set[Tuple[str, str]]] = None):
+        """초기화
+
+        Args:
+            max_waiters: 호출 하나에 합류할 수 있는 최대 대기자 수 (기본 GATEWAY_SINGLE_FLIGHT_MAX_WAITERS 또는 100)
+            routes: coalescing 대상 (서비스, 경로) (기본 DEFAULT_COALESCE_ROUTES 또는 GATEWAY_COALESCE_ROUTES)
+        """
+        self.max_waiters = max_waiters or int(os.getenv("GATEWAY_SINGLE_FLIGHT_MAX_WAITERS", "100"))
+        if routes is None:
+            env_routes = os.getenv("GATEWAY_COALESCE_ROUTES")
+            routes = parse_routes(env_routes) if env_routes is not None else set(DEFAULT_COALESCE_ROUTES)
+        self.routes = routes
+        self._flights: Dict[Any, Flight] = {}
+        self.flights = 0
+        self.coalesced = 0
+        self.overflow = 0
+        self.errors = 0
+        self.max_waiters_seen = 0
+
+    def coalesces(self, service: str, path: str) -> bool:
+        """경로가 coalescing 대상인지 확인합니다."""
+        return (service, path.strip("/")) in self.routes
+
+    async def do(self, key: Any, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """키에 대해 진행 중인 호출이 있으면 합류하고, 없으면 fn 을 실행합니다.
+
+        Args:
+            key: 요청 식별 키
+            fn: 업스트림 호출 코루틴 함수
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            if flight.waiters >= self.max_waiters:
+                # 대기자 한도 초과 시 합류하지 않고 독립적으로 호출
+                self.overflow += 1
+                return await fn()
+            flight.waiters += 1
+            self.coalesced += 1
+            self.max_waiters_seen = max(self.max_waiters_seen, flight.waiters)
+            return await asyncio.shield(flight.task)
+
+        flight = Flight(asyncio.ensure_future(fn()))
+        self._flights[key] = flight
+        self.flights += 1
+        flight.task.add_done_callback(lambda task: self._finish(key, flight))
+        return await asyncio.shield(flight.task)
+
+    def _finish(self, key: Any, flight: Flight):
+        """호출이 끝나면 그룹에서 제거하고 결과를 집계합니다."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if flight.task.cancelled():
+            self.errors += 1
+        elif flight.task.exception() is not None:
+            self.errors += 1
+            logger.warning(f"⚠️ coalesced 호출 실패 ({flight.waiters}명 대기): {flight.task.exception()}")
+        elif flight.waiters:
+            logger.info(f"🔗 업스트림 호출 1회를 {flight.waiters + 1}개 요청이 공유")
+
+    def stats(self) -> dict:
+        """coalescing 통계를 반환합니다."""
+        return {
+            "in_flight": len(self._flights),
+            "flights": self.flights,
+            "coalesced": self.coalesced,
+            "overflow": self.overflow,
+            "errors": self.errors,
+            "max_waiters": self.max_waiters,
+            "max_waiters_seen": self.max_waiters_seen,
+            "routes": sorted(f"{service}/{path}" for service, path in self.routes),
+        }
+
+
+# ✅ 게이트웨이 전역 single-flight 그룹
+single_flight = SingleFlight()
@@ -0,0 +1,186 @@
+import hmac
+import json
+import time
+import base64
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def peek_claims(token: str) -> Optional[Dict[str, Any]]:
+    """서명 검증 없이 JWT 페이로드를 읽습니다 (캐시/폐기 필터 조회용)."""
+    try:
+        claims = json.loads(_b64decode(token.split(".")[1]))
+    except (IndexError, ValueError):
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+class HS256Verifier:
+    """HS256 JWT 서명/기한 검증기 (배치 검증용)
+
+    키를 넣은 HMAC 상태를 한 번만 만들고 토큰마다 복사해 사용합니다.
+    jose 의 jwt.decode 와 같이 alg, 서명, exp, nbf 를 확인합니다 (leeway 없음).
+    """
+
+    def __init__(self, secret_key: str):
+        self._mac = hmac.new(secret_key.encode(), digestmod=hashlib.sha256)
+
+    def verify(self, token: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """유효하면 페이로드를, 아니면 None 을 반환합니다."""
+        try:
+            header_segment, payload_segment, signature_segment = token.split(".")
+            header = json.loads(_b64decode(header_segment))
+            claims = json.loads(_b64decode(payload_segment))
+            signature = _b64decode(signature_segment)
+        except ValueError:
+            return None
+        if not isinstance(header, dict) or header.get("alg") != "HS256" or not isinstance(claims, dict):
+            return None
+        mac = self._mac.copy()
+        mac.update(f"{header_segment}.{payload_segment}".encode())
+        if not hmac.compare_digest(mac.digest(), signature):
+            return None
+        now = now if now is not None else time.time()
+        try:
+            if "exp" in claims and float(claims["exp"]) < int(now):
+                return None
+            if "nbf" in claims and float(claims["nbf"]) > now:
+                return None
+        except (TypeError, ValueError):
+            return None
+        return claims
+
+
+class VerifiedToken:
+    """검증이 끝난 토큰 (원문, 사용자, 페이로드, 만료 시각)"""
+    __slots__ = ("token", "user_id", "payload", "expires_at")
+
+    def __init__(self, token: str, user_id: str, payload: Dict[str, Any], expires_at: float):
+        self.token = token
+        self.user_id = user_id
+        self.payload = payload
+        self.expires_at = expires_at
+
+
+class VerifiedTokenCache:
+    """jti 를 키로 하는 검증된 토큰 LRU 캐시
+
+    항목은 토큰의 exp 시각에 만료되고, 같은 jti 라도 토큰 원문이 다르면
+    (서명이 다른 위조 토큰) 캐시를 사용하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, VerifiedToken]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, jti: str, token: str, now: Optional[float] = None) -> Optional[VerifiedToken]:
+        entry = self._entries.get(jti)
+        if entry is None or not hmac.compare_digest(entry.token, token):
+            self.misses += 1
+            return None
+        if entry.expires_at <= (now if now is not None else time.time()):
+            del self._entries[jti]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(jti)
+        self.hits += 1
+        return entry
+
+    def peek(self, jti: str, token: str, now: Optional[float] = None) -> Optional[VerifiedToken]:
+        """통계와 LRU 순서를 바꾸지 않고 유효한 항목만 조회합니다."""
+        entry = self._entries.get(jti)
+        if entry is None or not hmac.compare_digest(entry.token, token):
+            return None
+        return entry if entry.expires_at > (now if now is not None else time.time()) else None
+
+    def put(self, jti: str, entry: VerifiedToken):
+        if self.max_entries <= 0:
+            return
+        self._entries[jti] = entry
+        self._entries.move_to_end(jti)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, jti: str):
+        self._entries.pop(jti, None)
+
+    def discard_user(self, user_id: str):
+        for jti in [jti for jti, entry in self._entries.items() if entry.user_id == user_id]:
+            del self._entries[jti]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+class RevocationFilter:
+    """폐기된 토큰 필터
+
+    개별 폐기는 jti → exp 로, 사용자 전체 폐기는 사용자별 기준 시각(iat 이 그 이전인
+    토큰은 모두 폐기)으로 기록합니다. iat 은 초 단위이므로 기준 시각과 같은 초에 발급된
+    토큰은 필터에서 거르지 않고 저장소의 폐기 표시로 판단합니다.
+    만료된 jti 와, token_lifetime 보다 오래된 사용자 기준 시각(그 전에 발급된 토큰은 이미
+    모두 만료)은 prune 에서 제거되므로 크기는 아직 유효할 수 있는 폐기 기록 수를 넘지 않습니다.
+    """
+
+    def __init__(self, token_lifetime: float = 30 * 60):
+        """초기화
+
+        Args:
+            token_lifetime: 액세스 토큰 유효 기간 초 (사용자 기준 시각 보관 기간)
+        """
+        self.token_lifetime = token_lifetime
+        self._revoked: Dict[str, float] = {}
+        self._user_cutoff: Dict[str, float] = {}
+        self._next_prune = 0.0
+
+    def revoke(self, jti: str, expires_at: float):
+        self._revoked[jti] = expires_at
+
+    def revoke_user(self, user_id: str, before: Optional[float] = None):
+        self._user_cutoff[user_id] = int(before if before is not None else time.time())
+
+    def is_revoked(self, claims: Dict[str, Any], now: Optional[float] = None) -> bool:
+        now = now if now is not None else time.time()
+        if now >= self._next_prune:
+            self.prune(now)
+        # 서명 검증 전 페이로드이므로 jti/sub/iat 형식이 잘못되면 폐기된 것으로 봅니다.
+        try:
+            if claims.get("jti") in self._revoked:
+                return True
+            cutoff = self._user_cutoff.get(claims.get("sub"))
+            return cutoff is not None and float(claims.get("iat", 0)) < cutoff
+        except (TypeError, ValueError):
+            return True
+
+    def prune(self, now: Optional[float] = None):
+        """만료된 폐기 기록을 제거합니다 (60초마다 한 번)."""
+        now = now if now is not None else time.time()
+        self._next_prune = now + 60.0
+        self._revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+        self._user_cutoff = {
+            user_id: cutoff for user_id, cutoff in self._user_cutoff.items()
+            if cutoff + self.token_lifetime > now
+        }
+
+    def stats(self) -> dict:
+        return {"revoked_tokens": len(self._revoked), "revoked_users": len(self._user_cutoff)}
@@ -0,0 +1,204 @@
+import os
+import time
+import logging
+from typing import AsyncIterator, Iterator, Optional
+from fastapi import HTTPException, Request
+from starlette.datastructures import FormData
+
+logger = logging.getLogger("gateway_api")
+
+class UploadTooLarge(HTTPException):
+    """업로드 크기 제한 초과"""
+
+    def __init__(self, limit: int):
+        super().__init__(status_code=413, detail=f"업로드 크기 제한({limit} bytes)을 초과했습니다.")
+
+
+class UploadStream:
+    """클라이언트 multipart 본문을 그대로 업스트림으로 흘려보내는 스트림
+
+    Starlette 가 파일을 스풀링하기 전에 `request.stream()` 을 직접 읽어서,
+    도착한 청크를 바로 업스트림에 전달합니다. 크기 제한을 넘으면 413 으로 중단합니다.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        forwarder: "UploadForwarder",
+        prefix: bytes,
+        chunks: AsyncIterator[bytes],
+        done: bool,
+        has_file: bool
+    ):
+        self.request = request
+        self.forwarder = forwarder
+        self.prefix = prefix
+        self.has_file = has_file
+        self._chunks = chunks
+        self._done = done
+        self.bytes_sent = 0
+        self.client_wait = 0.0
+        self.upstream_wait = 0.0
+
+    def _count(self, size: int):
+        self.bytes_sent += size
+        if self.bytes_sent > self.forwarder.limit:
+            self.forwarder.rejected += 1
+            raise UploadTooLarge(self.forwarder.limit)
+
+    async def _rest(self) -> AsyncIterator[bytes]:
+        """아직 읽지 않은 청크를 읽어옵니다 (클라이언트 대기 시간 집계)."""
+        if self._done:
+            return
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                self.client_wait += time.perf_counter() - start
+            if chunk:
+                yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """업스트림으로 보낼 청크를 생성합니다.
+
+        yield 후 다음 청크를 요청받기까지 걸린 시간이 업스트림 back-pressure 입니다.
+        """
+        self.forwarder.in_flight += 1
+        try:
+            if self.prefix:
+                self._count(len(self.prefix))
+                start = time.perf_counter()
+                yield self.prefix
+                self.upstream_wait += time.perf_counter() - start
+            async for chunk in self._rest():
+                self._count(len(chunk))
+                start = time.perf_counter()
+                yield chunk
+                self.upstream_wait += time.perf_counter() - start
+            self.forwarder.record(self)
+        finally:
+            self.forwarder.in_flight -= 1
+
+    async def form(self) -> FormData:
+        """파일이 없는 multipart 요청은 본문을 모아서 폼으로 파싱합니다."""
+        body = bytearray(self.prefix)
+        self._count(len(self.prefix))
+        async for chunk in self._rest():
+            self._count(len(chunk))
+            body.extend(chunk)
+        # Request.stream() 은 _body 가 있으면 그것을 사용합니다.
+        self.request._body = bytes(body)
+        return await self.request.form()
+
+
+class UploadForwarder:
+    """multipart 업로드 스트리밍 전달 및 통계"""
+
+    def __init__(self, max_upload_bytes: Optional[int] = None):
+        """초기화
+
+        Args:
+            max_upload_bytes: 업로드 크기 제한 (없으면 GATEWAY_MAX_UPLOAD_BYTES, 기본 20MB)
+        """
+        self._limit = max_upload_bytes
+        self.in_flight = 0
+        self.uploads = 0
+        self.rejected = 0
+        self.bytes_total = 0
+        self.upstream_wait_total = 0.0
+        self.upstream_wait_max = 0.0
+        self.client_wait_total = 0.0
+
+    @property
+    def limit(self) -> int:
+        if self._limit is None:
+            self._limit = int(os.getenv("GATEWAY_MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+        return self._limit
+
+    @staticmethod
+    def is_multipart(request: Request) -> bool:
+        return request.headers.get("content-type", "").startswith("multipart/form-data")
+
+    async def open(self, request: Request) -> UploadStream:
+        """파일 part 의 헤더가 나올 때까지(없으면 본문 끝까지) 읽고 UploadStream 을 반환합니다.
+
+        파일 앞에 오는 json_data 같은 폼 필드는 작으므로, 파일 part 를 찾을 때까지만 미리 읽습니다.
+        """
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.limit:
+            self.rejected += 1
+            raise UploadTooLarge(self.limit)
+
+        boundary = _boundary(request.headers.get("content-type", ""))
+        chunks = request.stream()
+        prefix = bytearray()
+        done = False
+        has_file = False
+        while boundary is not None:
+            if any(b"filename=" in headers for headers in _part_headers(prefix, boundary)):
+                has_file = True
+                break
+            if len(prefix) > self.limit:
+                self.rejected += 1
+                raise UploadTooLarge(self.limit)
+            try:
+                prefix.extend(await chunks.__anext__())
+            except StopAsyncIteration:
+                done = True
+                break
+        if done:
+            has_file = any(b"filename=" in headers for headers in _part_headers(prefix, boundary))
+        return UploadStream(request, self, bytes(prefix), chunks, done, has_file)
+
+    def record(self, upload: UploadStream):
+        """완료된 업로드 통계를 반영합니다."""
+        self.uploads += 1
+        self.bytes_total += upload.bytes_sent
+        self.upstream_wait_total += upload.upstream_wait
+        self.upstream_wait_max = max(self.upstream_wait_max, upload.upstream_wait)
+        self.client_wait_total += upload.client_wait
+        logger.info(
+            f"📤 업로드 전달 완료: {upload.bytes_sent} bytes, "
+            f"업스트림 대기 {upload.upstream_wait * 1000:.1f}ms, 클라이언트 대기 {upload.client_wait * 1000:.1f}ms"
+        )
+
+    def stats(self) -> dict:
+        """업로드 전달 통계를 반환합니다."""
+        return {
+            "max_upload_bytes": self.limit,
+            "in_flight": self.in_flight,
+            "uploads": self.uploads,
+            "rejected": self.rejected,
+            "bytes_total": self.bytes_total,
+            "upstream_wait_ms_total": round(self.upstream_wait_total * 1000, 2),
+            "upstream_wait_ms_max": round(self.upstream_wait_max * 1000, 2),
+            "client_wait_ms_total": round(self.client_wait_total * 1000, 2),
+        }
+
+
+def _boundary(content_type: str) -> Optional[bytes]:
+    """multipart Content-Type 의 boundary 값"""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary" and value:
+            return value.strip('"').encode("latin-1")
+    return None
+
+
+def _part_headers(body: bytes, boundary: bytes) -> Iterator[bytes]:
+    """읽은 본문에서 헤더가 모두 도착한 part 들의 헤더 영역을 차례로 반환합니다."""
+    delimiter = b"--" + boundary
+    start = body.find(delimiter)
+    while start >= 0:
+        end = body.find(b"\r\n\r\n", start)
+        if end < 0:
+            return
+        yield body[start + len(delimiter):end]
+        start = body.find(delimiter, end)
+
+
+# ✅ 게이트웨이 전역 업로드 전달기
+upload_forwarder = UploadForwarder()
@@ -0,0 +1,257 @@
+import os
+import time
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+import asyncpg
+from pydantic import BaseModel
+from app.domain.model.gateway_metrics import Gauge, Histogram
+
+logger = logging.getLogger("gateway_api")
+
+# ✅ DB 지연 시간 버킷 (초) - 풀 대기와 쿼리는 대부분 ms 단위
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+class DatabaseSettings(BaseModel):
+    """PostgreSQL 연결 풀 설정"""
+    host: str = "localhost"
+    port: int = 5432
+    database: str = "gateway"
+    user: str = "postgres"
+    password: str = "postgres"
+    min_size: int = 2
+    max_size: int = 10
+    statement_cache_size: int = 100
+    max_cached_statement_lifetime: float = 300.0
+    max_inactive_connection_lifetime: float = 300.0
+    command_timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        """환경 변수(DB_HOST, DB_POOL_MIN_SIZE 등)에서 설정을 읽어옵니다."""
+        return cls(
+            host=os.getenv("DB_HOST", "localhost"),
+            port=int(os.getenv("DB_PORT", "5432")),
+            database=os.getenv("DB_NAME", "gateway"),
+            user=os.getenv("DB_USER", "postgres"),
+            password=os.getenv("DB_PASS", "postgres"),
+            min_size=int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100")),
+            max_cached_statement_lifetime=float(os.getenv("DB_STATEMENT_CACHE_LIFETIME", "300")),
+            max_inactive_connection_lifetime=float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", "300")),
+            command_timeout=float(os.getenv("DB_COMMAND_TIMEOUT", "10")),
+        )
+
+
+class PreparedConnection(asyncpg.Connection):
+    """등록된 SQL 을 연결마다 한 번만 prepare 해 재사용하는 연결"""
+
+    async def prepared(self, name: str, sql: str) -> asyncpg.prepared_stmt.PreparedStatement:
+        statements = self.__dict__.setdefault("_named_statements", {})
+        statement = statements.get(name)
+        if statement is None:
+            statement = statements[name] = await self.prepare(sql)
+        return statement
+
+    def forget(self, name: str):
+        """스키마 변경 등으로 무효가 된 statement 를 버립니다."""
+        self.__dict__.get("_named_statements", {}).pop(name, None)
+
+
+class DatabasePool:
+    """asyncpg 연결 풀 (게이트웨이 lifespan 에서 한 번 생성)
+
+    쿼리는 이름으로 등록한 SQL 만 실행하며, 연결별로 prepare 한 statement 를 재사용합니다.
+    풀 대기 시간과 statement 별 쿼리 시간을 기록해 stats/Prometheus 로 노출합니다.
+    """
+
+    def __init__(self, settings: Optional[DatabaseSettings] = None, pool=None):
+        """초기화
+
+        Args:
+            settings: 풀 설정 (없으면 startup 시 환경 변수에서 읽음)
+            pool: 이미 만든 풀 (테스트용 대역)
+        """
+        self.settings = settings
+        self._pool = pool
+        self.statements: Dict[str, str] = {}
+        self.acquire_wait = Histogram(
+            "gateway_db_pool_wait_seconds", "DB 연결을 얻기까지 기다린 시간", (), DB_BUCKETS)
+        self.query_duration = Histogram(
+            "gateway_db_query_duration_seconds", "statement 별 쿼리 시간", ("statement",), DB_BUCKETS)
+        self.max_wait = 0.0
+        self.errors: Dict[str, int] = {}
+
+    @property
+    def started(self) -> bool:
+        return self._pool is not None
+
+    def register(self, statements: Dict[str, str]):
+        """이름 → SQL 을 등록합니다."""
+        self.statements.update(statements)
+
+    async def startup(self):
+        """연결 풀을 생성합니다."""
+        if self._pool is not None:
+            return
+        if self.settings is None:
+            self.settings = DatabaseSettings.from_env()
+        settings = self.settings
+        self._pool = await asyncpg.create_pool(
+            host=settings.host,
+            port=settings.port,
+            database=settings.database,
+            user=settings.user,
+            password=settings.password,
+            min_size=settings.min_size,
+            max_size=settings.max_size,
+            max_inactive_connection_lifetime=settings.max_inactive_connection_lifetime,
+            statement_cache_size=settings.statement_cache_size,
+            max_cached_statement_lifetime=settings.max_cached_statement_lifetime,
+            command_timeout=settings.command_timeout,
+            connection_class=PreparedConnection,
+        )
+        logger.info(f"🗄️ DB 연결 풀 생성: {settings.host}:{settings.port}/{settings.database} "
+                    f"(min={settings.min_size}, max={settings.max_size})")
+
+    async def shutdown(self):
+        """연결 풀을 닫습니다."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await pool.close()
+            logger.info("🗄️ DB 연결 풀 종료")
+
+    @asynccontextmanager
+    async def acquire(self):
+        """풀에서 연결을 얻고 대기 시간을 기록합니다 (블록을 벗어나면 한 번만 반환)."""
+        if self._pool is None:
+            raise RuntimeError("DB 연결 풀이 시작되지 않았습니다.")
+        started = time.perf_counter()
+        async with self._pool.acquire() as conn:
+            waited = time.perf_counter() - started
+            self.acquire_wait.observe((), waited)
+            self.max_wait = max(self.max_wait, waited)
+            yield conn
+
+    async def fetch(self, name: str, *args) -> List[Any]:
+        return await self._run(name, "fetch", args)
+
+    async def fetchrow(self, name: str, *args) -> Optional[Any]:
+        return await self._run(name, "fetchrow", args)
+
+    async def fetchval(self, name: str, *args) -> Any:
+        return await self._run(name, "fetchval", args)
+
+    async def execute(self, name: str, *args) -> str:
+        """결과 행 없이 실행하고 상태 메시지(예: 'DELETE 1')를 반환합니다."""
+        return await self._run(name, "execute", args)
+
+    async def stream(self, name: str, *args, prefetch: int = 100) -> AsyncIterator[Any]:
+        """서버 측 커서로 prefetch 행씩 받아 한 행씩 넘겨줍니다 (읽는 동안 연결 하나를 사용).
+
+        기록되는 쿼리 시간에는 호출한 쪽이 행을 처리하는 시간도 포함됩니다.
+        """
+        async with self.acquire() as conn:
+            started = time.perf_counter()
+            try:
+                statement = await conn.prepared(name, self.statements[name])
+                async with conn.transaction():
+                    async for row in statement.cursor(*args, prefetch=prefetch):
+                        yield row
+            except Exception:
+                self.errors[name] = self.errors.get(name, 0) + 1
+                raise
+            finally:
+                self.query_duration.observe((name,), time.perf_counter() - started)
+
+    async def copy_and_execute(
+        self, name: str, table: str, columns: Sequence[str], records: List[tuple], setup: Optional[str] = None
+    ) -> str:
+        """records 를 COPY 로 table 에 넣은 뒤 같은 트랜잭션에서 name statement 를 실행합니다.
+
+        Args:
+            setup: COPY 전에 실행할 SQL (예: 임시 테이블 생성)
+
+        Returns:
+            statement 의 상태 메시지 (예: 'INSERT 0 5000')
+        """
+        async with self.acquire() as conn:
+            started = time.perf_counter()
+            try:
+                async with conn.transaction():
+                    if setup:
+                        await conn.execute(setup)
+                    await conn.copy_records_to_table(table, records=records, columns=list(columns))
+                    statement = await conn.prepared(name, self.statements[name])
+                    await statement.fetch()
+                    return statement.get_statusmsg()
+            except Exception:
+                self.errors[name] = self.errors.get(name, 0) + 1
+                raise
+            finally:
+                self.query_duration.observe((name,), time.perf_counter() - started)
+
+    async def _run(self, name: str, method: str, args: tuple):
+        async with self.acquire() as conn:
+            started = time.perf_counter()
+            try:
+                try:
+                    return await self._call(conn, name, method, args)
+                except asyncpg.InvalidCachedStatementError:
+                    # 테이블 변경 등으로 prepare 결과가 무효가 되면 한 번만 다시 prepare
+                    conn.forget(name)
+                    return await self._call(conn, name, method, args)
+            except Exception:
+                # 다시 prepare 한 시도의 실패도 함께 집계
+                self.errors[name] = self.errors.get(name, 0) + 1
+                raise
+            finally:
+                self.query_duration.observe((name,), time.perf_counter() - started)
+
+    async def _call(self, conn, name: str, method: str, args: tuple):
+        statement = await conn.prepared(name, self.statements[name])
+        if method == "execute":
+            await statement.fetch(*args)
+            return statement.get_statusmsg()
+        return await getattr(statement, method)(*args)
+
+    def stats(self) -> dict:
+        """풀 크기, 대기 시간, statement 별 쿼리 시간 통계를 반환합니다."""
+        waits = self.acquire_wait._series.get(())
+        acquires = self.acquire_wait.count(())
+        queries = {}
+        for (name,), series in self.query_duration._series.items():
+            count = sum(series[:-1])
+            queries[name] = {
+                "count": count,
+                "avg_ms": round(series[-1] / count * 1000, 3) if count else 0.0,
+                "errors": self.errors.get(name, 0),
+            }
+        pool = self._pool
+        return {
+            "started": pool is not None,
+            "size": pool.get_size() if pool is not None else 0,
+            "idle": pool.get_idle_size() if pool is not None else 0,
+            "min_size": self.settings.min_size if self.settings else None,
+            "max_size": self.settings.max_size if self.settings else None,
+            "statement_cache_size": self.settings.statement_cache_size if self.settings else None,
+            "acquires": acquires,
+            "avg_wait_ms": round(waits[-1] / acquires * 1000, 3) if acquires else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "queries": queries,
+        }
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식 지표 줄"""
+        connections = Gauge("gateway_db_pool_connections", "DB 연결 수", ("state",))
+        if self._pool is not None:
+            size, idle = self._pool.get_size(), self._pool.get_idle_size()
+            connections.set(("active",), size - idle)
+            connections.set(("idle",), idle)
+        return connections.render() + self.acquire_wait.render() + self.query_duration.render()
+
+
+# ✅ 게이트웨이 전역 DB 연결 풀
+database_pool = DatabasePool()
@@ -1,198 +1,393 @@
-
-from typing import Optional, List, Dict
-import asyncpg
-from datetime import datetime
+from contextlib import aclosing
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Optional, List, Tuple, Union
+from datetime import datetime, timedelta
 import os
+import json
+import time
+import base64
+import logging
 
 from app.domain.model.login_model import LoginEntity
+from app.domain.model.login_cache import INVALIDATE_ALL, LoginCache, create_invalidation_bus, login_cache
+from app.domain.repository.database import DatabasePool, database_pool
+
+logger = logging.getLogger("gateway_api")
+
+# ✅ 대량 가져오기 한 번(COPY + INSERT)에 넣을 최대 행 수
+LOGIN_IMPORT_CHUNK = int(os.getenv("LOGIN_IMPORT_CHUNK", "5000"))
+
+LOGIN_COLUMNS = ("id", "provider", "access_token", "refresh_token", "expires_at", "created_at")
+
+# 연결별 임시 테이블 - 커밋하면 비워지므로 청크마다 다시 만들지 않음
+LOGIN_IMPORT_TABLE = '''
+    CREATE TEMP TABLE IF NOT EXISTS login_import (
+        id VARCHAR(50) NOT NULL,
+        provider VARCHAR(50) NOT NULL,
+        access_token TEXT NOT NULL,
+        refresh_token TEXT,
+        expires_at TIMESTAMP,
+        created_at TIMESTAMP NOT NULL
+    ) ON COMMIT DELETE ROWS
+'''
+
+LOGIN_TABLE = '''
+    CREATE TABLE IF NOT EXISTS login_entities (
+        id VARCHAR(50) PRIMARY KEY,
+        provider VARCHAR(50) NOT NULL,
+        access_token TEXT NOT NULL,
+        refresh_token TEXT,
+        expires_at TIMESTAMP,
+        created_at TIMESTAMP NOT NULL DEFAULT NOW()
+    );
+    ALTER TABLE login_entities ADD COLUMN IF NOT EXISTS renewal_claimed_until TIMESTAMP;
+    CREATE INDEX IF NOT EXISTS login_entities_expires_at_idx
+        ON login_entities (expires_at) WHERE refresh_token IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS login_entities_provider_created_idx
+        ON login_entities (provider, created_at, id);
+'''
+
+# ✅ LoginRepository 가 실행하는 쿼리 (연결마다 한 번 prepare)
+LOGIN_STATEMENTS = {
+    "login.save": '''
+        INSERT INTO login_entities(id, provider, access_token, refresh_token, expires_at, created_at)
+        VALUES($1, $2, $3, $4, $5, $6)
+        ON CONFLICT (id) DO UPDATE
+        SET provider = $2,
+            access_token = $3,
+            refresh_token = $4,
+            expires_at = $5
+    ''',
+    "login.find_by_id": '''
+        SELECT id, provider, access_token, refresh_token, expires_at, created_at
+        FROM login_entities WHERE id = $1
+    ''',
+    # 제공자별 목록은 (provider, created_at, id) 인덱스 순서로 keyset 페이지네이션
+    "login.provider_first_page": '''
+        SELECT id, provider, access_token, refresh_token, expires_at, created_at
+        FROM login_entities WHERE provider = $1
+        ORDER BY created_at, id
+        LIMIT $2
+    ''',
+    "login.provider_next_page": '''
+        SELECT id, provider, access_token, refresh_token, expires_at, created_at
+        FROM login_entities WHERE provider = $1 AND (created_at, id) > ($2, $3)
+        ORDER BY created_at, id
+        LIMIT $4
+    ''',
+    "login.provider_stream": '''
+        SELECT id, provider, access_token, refresh_token, expires_at, created_at
+        FROM login_entities WHERE provider = $1
+        ORDER BY created_at, id
+    ''',
+    "login.delete": "DELETE FROM login_entities WHERE id = $1",
+    # 임시 테이블로 COPY 한 청크를 한 번에 반영
+    "login.import_merge": '''
+        INSERT INTO login_entities(id, provider, access_token, refresh_token, expires_at, created_at)
+        SELECT id, provider, access_token, refresh_token, expires_at, created_at FROM login_import
+        ON CONFLICT (id) DO UPDATE
+        SET provider = EXCLUDED.provider,
+            access_token = EXCLUDED.access_token,
+            refresh_token = EXCLUDED.refresh_token,
+            expires_at = EXCLUDED.expires_at
+    ''',
+    # 곧 만료될 토큰을 갱신 담당으로 선점 (다른 워커가 선점한 행과 오래전에 만료된 행은 건너뜀)
+    "login.claim_expiring": '''
+        UPDATE login_entities SET renewal_claimed_until = $3
+        WHERE id IN (
+            SELECT id FROM login_entities
+            WHERE refresh_token IS NOT NULL AND expires_at < $1 AND expires_at >= $5
+              AND (renewal_claimed_until IS NULL OR renewal_claimed_until < $2)
+            ORDER BY expires_at
+            LIMIT $4
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING id, provider, access_token, refresh_token, expires_at, created_at
+    ''',
+}
+
+
+def to_entity(row) -> LoginEntity:
+    return LoginEntity(
+        id=row['id'],
+        provider=row['provider'],
+        access_token=row['access_token'],
+        refresh_token=row['refresh_token'],
+        expires_at=row['expires_at'],
+        created_at=row['created_at']
+    )
+
+
+class LoginImportError(Exception):
+    """대량 가져오기 도중 실패 (progress 는 실패 전까지 반영된 결과)"""
+
+    def __init__(self, message: str, progress: dict):
+        super().__init__(message)
+        self.progress = progress
+
+
+def encode_cursor(entity: LoginEntity) -> str:
+    """다음 페이지 커서 (마지막 항목의 created_at, id)"""
+    raw = json.dumps([entity.created_at.isoformat(), entity.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """커서를 (created_at, id) 로 읽습니다. 형식이 틀리면 ValueError."""
+    try:
+        created_at, id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(created_at), str(id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
 
 
 class LoginRepository:
-    """Login 데이터 관리를 위한 레포지토리 클래스"""
-    
-    def __init__(self, pool: asyncpg.Pool = None):
+    """Login 데이터 관리를 위한 레포지토리 클래스
+
+    연결 풀은 게이트웨이 lifespan 에서 시작한 DatabasePool 을 사용합니다.
+    ID 조회는 LoginCache 를 먼저 보고(read-through), 저장은 DB 와 캐시에 함께
+    반영합니다(write-through). 저장/삭제한 ID 는 무효화 채널로 다른 워커에 알립니다.
+    풀이 시작되지 않았으면 캐시에만 저장합니다 (개발용, 최대 항목 수까지).
+    """
+
+    def __init__(self, db: Optional[DatabasePool] = None, cache: Optional[LoginCache] = None, bus=None):
         """레포지토리 초기화
-        
+
         Args:
-            pool: 데이터베이스 연결 풀
+            db: 데이터베이스 연결 풀 (기본 전역 database_pool)
+            cache: Login 캐시 (기본 전역 login_cache)
+            bus: 캐시 무효화 전파 (기본 LOGIN_CACHE_INVALIDATION 에 따라 생성)
         """
-        self.pool = pool
-        self._entities: Dict[str, LoginEntity] = {}  # 메모리 캐시 (개발용)
-    
-    async def _get_connection(self):
-        """데이터베이스 연결을 가져옵니다."""
-        if not self.pool:
-            # 환경 변수에서 DB 연결 정보 가져오기
-            db_host = os.getenv('DB_HOST', 'localhost')
-            db_port = int(os.getenv('DB_PORT', '5432'))
-            db_name = os.getenv('DB_NAME', 'gateway')
-            db_user = os.getenv('DB_USER', 'postgres')
-            db_pass = os.getenv('DB_PASS', 'postgres')
-            
-            # 연결 풀 생성
-            self.pool = await asyncpg.create_pool(
-                host=db_host,
-                port=db_port,
-                database=db_name,
-                user=db_user,
-                password=db_pass
-            )
-        
-        return await self.pool.acquire()
-    
-    async def _release_connection(self, conn):
-        """데이터베이스 연결을 반환합니다."""
-        if self.pool and conn:
-            await self.pool.release(conn)
+        self.db = db or database_pool
+        self.db.register(LOGIN_STATEMENTS)
+        self.cache = cache if cache is not None else login_cache
+        self.bus = bus if bus is not None else create_invalidation_bus()
+        # DB 없이 실행할 때의 갱신 선점 기록 (id → 선점 만료 시각)
+        self._claims: Dict[str, datetime] = {}
 
     async def init_table(self):
         """Login 테이블을 초기화합니다."""
-        conn = None
-        try:
-            conn = await self._get_connection()
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS login_entities (
-                    id VARCHAR(50) PRIMARY KEY,
-                    provider VARCHAR(50) NOT NULL,
-                    access_token TEXT NOT NULL,
-                    refresh_token TEXT,
-                    expires_at TIMESTAMP,
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW()
-                )
-            ''')
-        finally:
-            if conn:
-                await self._release_connection(conn)
+        async with self.db.acquire() as conn:
+            await conn.execute(LOGIN_TABLE)
 
     async def save_login(self, login: LoginEntity) -> LoginEntity:
         """Login 정보를 저장합니다"""
-        conn = None
         try:
-            # 개발환경에서는 메모리에 저장
-            self._entities[login.id] = login
-            
-            # 데이터베이스에 저장
-            if self.pool:
-                conn = await self._get_connection()
-                try:
-                    await conn.execute('''
-                        INSERT INTO login_entities(id, provider, access_token, refresh_token, expires_at, created_at)
-                        VALUES($1, $2, $3, $4, $5, $6)
-                        ON CONFLICT (id) DO UPDATE 
-                        SET provider = $2, 
-                            access_token = $3, 
-                            refresh_token = $4,
-                            expires_at = $5
-                    ''', login.id, login.provider, login.access_token, login.refresh_token, 
-                    login.expires_at, login.created_at)
-                finally:
-                    await self._release_connection(conn)
-            
+            # 데이터베이스에 저장한 뒤 캐시에 반영
+            if self.db.started:
+                await self.db.execute(
+                    "login.save", login.id, login.provider, login.access_token, login.refresh_token,
+                    login.expires_at, login.created_at
+                )
+                self.cache.put(login)
+                await self._publish(login.id)
+            else:
+                self.cache.put(login, persistent=True)
+
             return login
         except Exception as e:
-            print(f"Error saving Login: {e}")
+            logger.error(f"❌ Login 저장 실패: {e}")
             raise
-        finally:
-            if conn:
-                await self._release_connection(conn)
 
     async def find_login_by_id(self, id: str) -> Optional[LoginEntity]:
         """ID로 Login 정보를 조회합니다"""
-        conn = None
         try:
-            # 개발환경에서는 메모리에서 조회
-            if id in self._entities:
-                return self._entities[id]
-            
-            # 데이터베이스에서 조회
-            if self.pool:
-                conn = await self._get_connection()
-                try:
-                    row = await conn.fetchrow(
-                        'SELECT * FROM login_entities WHERE id = $1', id
-                    )
-                    
-                    if row:
-                        return LoginEntity(
-                            id=row['id'],
-                            provider=row['provider'],
-                            access_token=row['access_token'],
-                            refresh_token=row['refresh_token'],
-                            expires_at=row['expires_at'],
-                            created_at=row['created_at']
-                        )
-                finally:
-                    await self._release_connection(conn)
-            
-            return None
+            hit, entity = self.cache.get(id)
+            if hit or not self.db.started:
+                return entity
+
+            # 캐시에 없으면 데이터베이스에서 조회 (없는 ID 도 잠시 기억)
+            row = await self.db.fetchrow("login.find_by_id", id)
+            if not row:
+                self.cache.put_missing(id)
+                return None
+            entity = to_entity(row)
+            self.cache.put(entity)
+            return entity
         except Exception as e:
-            print(f"Error finding Login by ID: {e}")
+            logger.error(f"❌ Login ID 조회 실패: {e}")
             return None
-        finally:
-            if conn:
-                await self._release_connection(conn)
-        
+
     async def find_login_by_provider(self, provider: str) -> List[LoginEntity]:
-        """제공자별로 Login 정보를 조회합니다"""
-        conn = None
+        """제공자별로 Login 정보를 모두 조회합니다 (많으면 find_login_page / stream_login_by_provider 사용)"""
         try:
-            # 개발환경에서는 메모리에서 조회
-            result = [
-                entity for entity in self._entities.values()
-                if entity.provider == provider
-            ]
-            
-            # 데이터베이스에서 조회
-            if self.pool and not result:
-                conn = await self._get_connection()
-                try:
-                    rows = await conn.fetch(
-                        'SELECT * FROM login_entities WHERE provider = $1', provider
-                    )
-                    
-                    for row in rows:
-                        result.append(LoginEntity(
-                            id=row['id'],
-                            provider=row['provider'],
-                            access_token=row['access_token'],
-                            refresh_token=row['refresh_token'],
-                            expires_at=row['expires_at'],
-                            created_at=row['created_at']
-                        ))
-                finally:
-                    await self._release_connection(conn)
-            
-            return result
+            return [entity async for entity in self.stream_login_by_provider(provider)]
         except Exception as e:
-            print(f"Error finding Login by provider: {e}")
+            logger.error(f"❌ 제공자별 Login 조회 실패: {e}")
             return []
-        finally:
-            if conn:
-                await self._release_connection(conn)
-        
+
+    async def find_login_page(
+        self, provider: str, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[LoginEntity], Optional[str]]:
+        """제공자별 Login 을 (created_at, id) 순서로 limit 개 조회합니다.
+
+        Returns:
+            (항목, 다음 페이지 커서 - 마지막 페이지면 None)
+        """
+        after = decode_cursor(cursor) if cursor else None
+        if not self.db.started:
+            entities = sorted(
+                (entity for entity in self.cache.values() if entity.provider == provider
+                 and (after is None or (entity.created_at, entity.id) > after)),
+                key=lambda entity: (entity.created_at, entity.id)
+            )[:limit + 1]
+        elif after is None:
+            rows = await self.db.fetch("login.provider_first_page", provider, limit + 1)
+            entities = [to_entity(row) for row in rows]
+        else:
+            rows = await self.db.fetch("login.provider_next_page", provider, after[0], after[1], limit + 1)
+            entities = [to_entity(row) for row in rows]
+
+        # 한 행을 더 읽어 다음 페이지가 있는지 확인
+        if len(entities) > limit:
+            entities = entities[:limit]
+            return entities, encode_cursor(entities[-1])
+        return entities, None
+
+    async def stream_login_by_provider(self, provider: str, prefetch: int = 500) -> AsyncIterator[LoginEntity]:
+        """제공자별 Login 을 서버 측 커서로 prefetch 행씩 읽으며 하나씩 넘겨줍니다.
+
+        중간에 그만 읽을 때는 contextlib.aclosing 으로 감싸야 연결이 바로 반환됩니다.
+        """
+        if not self.db.started:
+            for entity in sorted(self.cache.values(), key=lambda entity: (entity.created_at, entity.id)):
+                if entity.provider == provider:
+                    yield entity
+            return
+        async with aclosing(self.db.stream("login.provider_stream", provider, prefetch=prefetch)) as rows:
+            async for row in rows:
+                yield to_entity(row)
+
+    async def bulk_upsert(
+        self,
+        logins: Union[Iterable[LoginEntity], AsyncIterable[LoginEntity]],
+        chunk_size: Optional[int] = None
+    ) -> dict:
+        """Login 정보를 chunk_size 개씩 COPY 로 임시 테이블에 넣고 INSERT ... ON CONFLICT 한 번으로 반영합니다.
+
+        청크마다 별도 트랜잭션이므로 중간에 실패하면 앞선 청크는 반영된 상태로 남습니다.
+        같은 청크 안에서 ID 가 겹치면 뒤의 항목을 사용합니다.
+        가져온 ID 는 이 워커의 캐시에서 지우고, 다른 워커에는 청크마다 캐시 전체 무효화를 한 번 보냅니다.
+
+        Returns:
+            rows, chunks, seconds, rows_per_second
+
+        Raises:
+            LoginImportError: 입력 또는 DB 오류 (실패 전까지의 progress 포함)
+        """
+        chunk_size = chunk_size or LOGIN_IMPORT_CHUNK
+        started = time.perf_counter()
+        rows = 0
+        chunks = 0
+        chunk: Dict[str, LoginEntity] = {}
+
+        async def flush():
+            nonlocal rows, chunks
+            if not chunk:
+                return
+            if self.db.started:
+                records = [tuple(getattr(login, column) for column in LOGIN_COLUMNS) for login in chunk.values()]
+                await self.db.copy_and_execute(
+                    "login.import_merge", "login_import", LOGIN_COLUMNS, records, setup=LOGIN_IMPORT_TABLE
+                )
+                for id in chunk:
+                    self.cache.invalidate(id)
+                await self._publish(INVALIDATE_ALL)
+            else:
+                for login in chunk.values():
+                    self.cache.put(login, persistent=True)
+            rows += len(chunk)
+            chunks += 1
+            chunk.clear()
+
+        def progress() -> dict:
+            seconds = time.perf_counter() - started
+            return {
+                "rows": rows,
+                "chunks": chunks,
+                "seconds": round(seconds, 4),
+                "rows_per_second": round(rows / seconds) if seconds > 0 else rows,
+            }
+
+        try:
+            if hasattr(logins, "__aiter__"):
+                async for login in logins:
+                    chunk[login.id] = login
+                    if len(chunk) >= chunk_size:
+                        await flush()
+            else:
+                for login in logins:
+                    chunk[login.id] = login
+                    if len(chunk) >= chunk_size:
+                        await flush()
+            await flush()
+        except Exception as e:
+            logger.error(f"❌ Login 가져오기 실패 ({rows}건 반영 후): {e}")
+            raise LoginImportError(str(e), progress()) from e
+
+        result = progress()
+        logger.info(f"📥 Login {rows}건 가져오기 완료 ({chunks}개 청크, {result['rows_per_second']} rows/s)")
+        return result
+
     async def delete_login(self, id: str) -> bool:
         """Login 정보를 삭제합니다"""
-        conn = None
         try:
-            # 개발환경에서는 메모리에서 삭제
-            if id in self._entities:
-                del self._entities[id]
-            
+            self.cache.invalidate(id)
+
             # 데이터베이스에서 삭제
-            if self.pool:
-                conn = await self._get_connection()
-                try:
-                    result = await conn.execute(
-                        'DELETE FROM login_entities WHERE id = $1', id
-                    )
-                    return "DELETE" in result
-                finally:
-                    await self._release_connection(conn)
-            
+            if self.db.started:
+                result = await self.db.execute("login.delete", id)
+                self.cache.invalidate(id)
+                await self._publish(id)
+                return "DELETE" in result
+
             return True
         except Exception as e:
-            print(f"Error deleting Login: {e}")
+            logger.error(f"❌ Login 삭제 실패: {e}")
             return False
-        finally:
-            if conn:
-                await self._release_connection(conn) 
\ No newline at end of file
+
+    async def claim_expiring(
+        self,
+        before: datetime,
+        limit: int,
+        claim_for: float,
+        after: Optional[datetime] = None
+    ) -> List[LoginEntity]:
+        """expires_at 이 [after, before) 인 갱신 대상을 limit 개까지 claim_for 초 동안 선점합니다.
+
+        선점한 행은 다른 워커(와 다음 주기)가 다시 가져가지 않으므로,
+        갱신에 실패한 행은 선점이 끝난 뒤에 다시 시도됩니다. after 보다 먼저 만료된 행은
+        버려진 Login 으로 보고 더 이상 선점하지 않습니다 (사용자 요청 시 갱신은 그대로 가능).
+        """
+        now = datetime.now()
+        after = after or datetime.min
+        claimed_until = now + timedelta(seconds=claim_for)
+        if self.db.started:
+            rows = await self.db.fetch("login.claim_expiring", before, now, claimed_until, limit, after)
+            return [to_entity(row) for row in rows]
+
+        candidates = sorted(
+            (entity for entity in self.cache.values()
+             if entity.refresh_token and entity.expires_at and after <= entity.expires_at < before
+             and self._claims.get(entity.id, now) <= now),
+            key=lambda entity: entity.expires_at
+        )[:limit]
+        for entity in candidates:
+            self._claims[entity.id] = claimed_until
+        return candidates
+
+    async def _publish(self, id: str):
+        if self.bus is not None:
+            await self.bus.publish(id)
+
+    async def start(self):
+        """다른 워커의 무효화 메시지 구독을 시작합니다."""
+        if self.bus is not None:
+            await self.bus.start(self.cache)
+
+    async def close(self):
+        if self.bus is not None:
+            await self.bus.close()
+
+    def cache_stats(self) -> dict:
+        """캐시 적중률과 무효화 전파 통계"""
+        return {**self.cache.stats(), "invalidation": self.bus.stats() if self.bus is not None else None}
@@ -0,0 +1,145 @@
+from typing import Dict, List, Optional
+import os
+import time
+import hashlib
+import logging
+from app.domain.model.token_model import TokenModel
+from app.domain.repository.token_repository import to_timestamp
+
+logger = logging.getLogger("gateway_api")
+
+
+class RedisTokenRepository:
+    """Redis 토큰 저장소 (여러 게이트웨이 워커가 공유)
+
+    키 구조:
+        {prefix}token:{sha256(token)}   TokenModel JSON, 토큰 만료 시각에 맞춘 PX TTL
+        {prefix}user:{user_id}          사용자별 hash (필드: 토큰 해시, 값: 만료 시각 ms)
+
+    만료는 Redis 키 TTL 에 맡기므로 별도 정리 작업이 없습니다. 사용자 hash 에 남은
+    만료 토큰 필드는 조회할 때 정리합니다. 토큰 수명이 고정이므로 사용자 hash 의 만료
+    시각은 마지막으로 저장한 토큰의 만료 시각으로 맞춥니다.
+    """
+
+    # 다른 워커와 상태를 공유하는 저장소 (TokenService 가 캐시 유지 시간을 제한함)
+    shared = True
+
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = "gateway:"):
+        """저장소 초기화
+
+        Args:
+            client: redis.asyncio 호환 클라이언트 (없으면 url 로 생성)
+            url: Redis URL (기본 TOKEN_REDIS_URL, GATEWAY_REDIS_URL 또는 redis://localhost:6379/0)
+            prefix: 키 접두사
+        """
+        if client is None:
+            import redis.asyncio as redis
+            url = url or os.getenv("TOKEN_REDIS_URL", os.getenv("GATEWAY_REDIS_URL", "redis://localhost:6379/0"))
+            client = redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+        self.saves = 0
+        self.lookups = 0
+        self.stale_fields_removed = 0
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _token_key(self, token: str) -> str:
+        return f"{self.prefix}token:{self._digest(token)}"
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{self.prefix}user:{user_id}"
+
+    @staticmethod
+    def _ttl_ms(token: TokenModel) -> int:
+        return max(1, int((to_timestamp(token.expires_at) - time.time()) * 1000))
+
+    async def save(self, token: TokenModel) -> TokenModel:
+        """토큰 저장 (토큰 키, 사용자 hash, 만료 설정을 한 번의 왕복으로 전송)"""
+        expires_ms = int(to_timestamp(token.expires_at) * 1000)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(self._token_key(token.token), token.model_dump_json(), px=self._ttl_ms(token))
+            pipe.hset(self._user_key(token.user_id), self._digest(token.token), expires_ms)
+            pipe.pexpireat(self._user_key(token.user_id), expires_ms)
+            await pipe.execute()
+        self.saves += 1
+        return token
+
+    async def find_by_token(self, token: str) -> Optional[TokenModel]:
+        """토큰으로 조회"""
+        self.lookups += 1
+        value = await self.client.get(self._token_key(token))
+        return TokenModel.model_validate_json(value) if value else None
+
+    async def find_many_by_token(self, tokens: List[str]) -> Dict[str, TokenModel]:
+        """여러 토큰을 MGET 한 번으로 조회"""
+        if not tokens:
+            return {}
+        self.lookups += 1
+        values = await self.client.mget([self._token_key(token) for token in tokens])
+        return {
+            token: TokenModel.model_validate_json(value)
+            for token, value in zip(tokens, values) if value
+        }
+
+    async def find_by_user_id(self, user_id: str) -> List[TokenModel]:
+        """사용자 ID로 토큰 조회"""
+        fields = await self.client.hgetall(self._user_key(user_id))
+        if not fields:
+            return []
+        digests = list(fields.keys())
+        values = await self.client.mget([f"{self.prefix}token:{self._decode(d)}" for d in digests])
+        tokens = []
+        stale = []
+        for digest, value in zip(digests, values):
+            if value:
+                tokens.append(TokenModel.model_validate_json(value))
+            else:
+                stale.append(digest)
+        if stale:
+            # TTL 로 사라진 토큰의 필드 정리
+            await self.client.hdel(self._user_key(user_id), *stale)
+            self.stale_fields_removed += len(stale)
+        return tokens
+
+    async def revoke(self, token: str) -> Optional[TokenModel]:
+        """토큰 폐기 (남은 TTL 유지)"""
+        token_model = await self.find_by_token(token)
+        if token_model:
+            token_model.is_revoked = True
+            await self.client.set(self._token_key(token), token_model.model_dump_json(), xx=True, keepttl=True)
+        return token_model
+
+    async def revoke_all_for_user(self, user_id: str) -> List[TokenModel]:
+        """사용자의 모든 토큰 폐기"""
+        revoked_tokens = await self.find_by_user_id(user_id)
+        if not revoked_tokens:
+            return []
+        async with self.client.pipeline(transaction=False) as pipe:
+            for token_model in revoked_tokens:
+                token_model.is_revoked = True
+                pipe.set(self._token_key(token_model.token), token_model.model_dump_json(), xx=True, keepttl=True)
+            await pipe.execute()
+        return revoked_tokens
+
+    @staticmethod
+    def _decode(value) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def close(self):
+        """Redis 연결을 닫습니다."""
+        close = getattr(self.client, "aclose", None) or getattr(self.client, "close", None)
+        if close is not None:
+            await close()
+
+    def stats(self) -> dict:
+        """클라이언트 측 호출 통계를 반환합니다."""
+        return {
+            "backend": "redis",
+            "prefix": self.prefix,
+            "saves": self.saves,
+            "lookups": self.lookups,
+            "stale_fields_removed": self.stale_fields_removed,
+        }
@@ -1,52 +1,232 @@
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+import os
+import sys
+import time
+import heapq
+import asyncio
+import logging
 from app.domain.model.token_model import TokenModel
 
+logger = logging.getLogger("gateway_api")
+
+# ✅ 저장소 설정
+TOKEN_REPOSITORY_MAX_ENTRIES = int(os.getenv("TOKEN_REPOSITORY_MAX_ENTRIES", "100000"))
+TOKEN_SWEEP_INTERVAL = float(os.getenv("TOKEN_SWEEP_INTERVAL", "30"))
+TOKEN_SWEEP_BATCH = int(os.getenv("TOKEN_SWEEP_BATCH", "1000"))
+# 폐기된 토큰을 저장소에 남겨 두는 시간 (초) - 그 뒤에는 '없는 토큰'으로 검증 실패, 다시 폐기해도 성공
+TOKEN_REVOKED_RETENTION = float(os.getenv("TOKEN_REVOKED_RETENTION", "300"))
+
+
+def to_timestamp(value: datetime) -> float:
+    """UTC 기준 naive datetime 을 unix 시각으로 변환합니다."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
 class TokenRepository:
-    """토큰 저장소 클래스"""
-    
-    def __init__(self):
-        """저장소 초기화"""
+    """토큰 저장소 클래스
+
+    만료 시각 min-heap 을 함께 유지하고, 백그라운드 sweeper 가 만료되었거나
+    폐기 후 보존 시간이 지난 토큰을 sweep_batch 개씩 제거합니다.
+    heap 항목은 지연 삭제 방식이라 이미 지워졌거나 기한이 바뀐 항목은 꺼낼 때 건너뜁니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+        sweep_batch: Optional[int] = None,
+        revoked_retention: Optional[float] = None
+    ):
+        """저장소 초기화
+
+        Args:
+            max_entries: 최대 토큰 수 (기본 TOKEN_REPOSITORY_MAX_ENTRIES)
+            sweep_interval: 정리 주기 초 (기본 TOKEN_SWEEP_INTERVAL, 0 이면 백그라운드 정리 안 함)
+            sweep_batch: 한 번에 제거할 최대 항목 수 (기본 TOKEN_SWEEP_BATCH)
+            revoked_retention: 폐기된 토큰 보존 시간 초 (기본 TOKEN_REVOKED_RETENTION)
+        """
         self._tokens: Dict[str, TokenModel] = {}
-        self._user_tokens: Dict[str, List[str]] = {}
-    
+        self._user_tokens: Dict[str, Dict[str, None]] = {}
+        # (제거 기한, 토큰) min-heap
+        self._expiry: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        self.max_entries = max_entries or TOKEN_REPOSITORY_MAX_ENTRIES
+        self.sweep_interval = TOKEN_SWEEP_INTERVAL if sweep_interval is None else sweep_interval
+        self.sweep_batch = sweep_batch or TOKEN_SWEEP_BATCH
+        self.revoked_retention = TOKEN_REVOKED_RETENTION if revoked_retention is None else revoked_retention
+        self._sweeper: Optional[asyncio.Task] = None
+        self._token_bytes = 0
+        self.expired_removed = 0
+        self.revoked_removed = 0
+        self.capacity_evictions = 0
+
     async def save(self, token: TokenModel) -> TokenModel:
         """토큰 저장"""
+        self._ensure_sweeper()
+        if token.token in self._tokens:
+            self._remove(token.token)
+        elif len(self._tokens) >= self.max_entries:
+            self._make_room()
+
         self._tokens[token.token] = token
-        
-        if token.user_id not in self._user_tokens:
-            self._user_tokens[token.user_id] = []
-        
-        self._user_tokens[token.user_id].append(token.token)
+        self._token_bytes += len(token.token)
+        self._user_tokens.setdefault(token.user_id, {})[token.token] = None
+        self._schedule(token.token, to_timestamp(token.expires_at))
         return token
-    
+
     async def find_by_token(self, token: str) -> Optional[TokenModel]:
         """토큰으로 조회"""
         return self._tokens.get(token)
-    
+
+    async def find_many_by_token(self, tokens: List[str]) -> Dict[str, TokenModel]:
+        """여러 토큰을 한 번에 조회 (저장소에 있는 토큰만 반환)"""
+        return {token: self._tokens[token] for token in tokens if token in self._tokens}
+
     async def find_by_user_id(self, user_id: str) -> List[TokenModel]:
         """사용자 ID로 토큰 조회"""
-        token_ids = self._user_tokens.get(user_id, [])
+        token_ids = self._user_tokens.get(user_id, {})
         return [self._tokens[token_id] for token_id in token_ids if token_id in self._tokens]
-    
+
     async def revoke(self, token: str) -> Optional[TokenModel]:
         """토큰 폐기"""
         token_model = self._tokens.get(token)
         if token_model:
             token_model.is_revoked = True
             self._tokens[token] = token_model
+            self._schedule_revoked(token)
         return token_model
-    
+
     async def revoke_all_for_user(self, user_id: str) -> List[TokenModel]:
         """사용자의 모든 토큰 폐기"""
         revoked_tokens = []
-        token_ids = self._user_tokens.get(user_id, [])
-        
+        token_ids = self._user_tokens.get(user_id, {})
+
         for token_id in token_ids:
             if token_id in self._tokens:
                 token_model = self._tokens[token_id]
                 token_model.is_revoked = True
                 self._tokens[token_id] = token_model
+                self._schedule_revoked(token_id)
                 revoked_tokens.append(token_model)
-                
-        return revoked_tokens
\ No newline at end of file
+
+        return revoked_tokens
+
+    def _schedule(self, token: str, deadline: float):
+        self._deadlines[token] = deadline
+        heapq.heappush(self._expiry, (deadline, token))
+
+    def _schedule_revoked(self, token: str):
+        """폐기된 토큰은 만료 전이라도 보존 시간이 지나면 제거합니다."""
+        deadline = time.time() + self.revoked_retention
+        if deadline < self._deadlines.get(token, float("inf")):
+            self._schedule(token, deadline)
+
+    def _remove(self, token: str) -> Optional[TokenModel]:
+        token_model = self._tokens.pop(token, None)
+        self._deadlines.pop(token, None)
+        if token_model is None:
+            return None
+        self._token_bytes -= len(token)
+        user_tokens = self._user_tokens.get(token_model.user_id)
+        if user_tokens is not None:
+            user_tokens.pop(token, None)
+            if not user_tokens:
+                del self._user_tokens[token_model.user_id]
+        return token_model
+
+    def _make_room(self):
+        """최대 항목 수에 도달하면 만료된 항목부터, 없으면 가장 먼저 만료될 항목을 제거합니다."""
+        if self.sweep(self.sweep_batch):
+            if len(self._tokens) < self.max_entries:
+                return
+        while self._expiry and len(self._tokens) >= self.max_entries:
+            deadline, token = heapq.heappop(self._expiry)
+            if self._deadlines.get(token) != deadline:
+                continue
+            self._remove(token)
+            self.capacity_evictions += 1
+        if self.capacity_evictions and self.capacity_evictions % 1000 == 1:
+            logger.warning(f"⚠️ 토큰 저장소 최대 크기({self.max_entries}) 도달 - 만료 전 토큰 제거 {self.capacity_evictions}건")
+
+    def sweep(self, limit: Optional[int] = None, now: Optional[float] = None) -> int:
+        """기한이 지난 항목을 최대 limit 개 제거하고 제거한 수를 반환합니다."""
+        now = now if now is not None else time.time()
+        limit = limit or self.sweep_batch
+        removed = 0
+        while self._expiry and removed < limit and self._expiry[0][0] <= now:
+            deadline, token = heapq.heappop(self._expiry)
+            if self._deadlines.get(token) != deadline:
+                continue  # 이미 제거되었거나 기한이 바뀐 항목
+            token_model = self._remove(token)
+            if token_model is None:
+                continue
+            if token_model.is_revoked and to_timestamp(token_model.expires_at) > now:
+                self.revoked_removed += 1
+            else:
+                self.expired_removed += 1
+            removed += 1
+        # 지연 삭제로 쌓인 heap 항목이 너무 많아지면 다시 만듦
+        if len(self._expiry) > 2 * len(self._deadlines) + 1024:
+            self._expiry = [(deadline, token) for token, deadline in self._deadlines.items()]
+            heapq.heapify(self._expiry)
+        return removed
+
+    async def _sweep_loop(self):
+        while True:
+            try:
+                # 한 배치마다 이벤트 루프에 양보해 요청 처리를 막지 않음
+                while self.sweep(self.sweep_batch) >= self.sweep_batch:
+                    await asyncio.sleep(0)
+            except Exception as e:
+                logger.error(f"❌ 토큰 정리 실패: {str(e)}")
+            await asyncio.sleep(self.sweep_interval)
+
+    def _ensure_sweeper(self):
+        """실행 중인 이벤트 루프가 있으면 백그라운드 정리 작업을 시작합니다."""
+        if self._sweeper is not None or self.sweep_interval <= 0:
+            return
+        try:
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+        except RuntimeError:
+            pass
+
+    async def close(self):
+        """백그라운드 정리 작업을 중지합니다."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    def stats(self) -> dict:
+        """항목 수와 메모리 사용량(추정) 통계를 반환합니다."""
+        container_bytes = (
+            sys.getsizeof(self._tokens) + sys.getsizeof(self._user_tokens)
+            + sys.getsizeof(self._expiry) + sys.getsizeof(self._deadlines)
+        )
+        return {
+            "entries": len(self._tokens),
+            "users": len(self._user_tokens),
+            "max_entries": self.max_entries,
+            "expiry_index_size": len(self._expiry),
+            "token_bytes": self._token_bytes,
+            "estimated_bytes": container_bytes + self._token_bytes,
+            "expired_removed": self.expired_removed,
+            "revoked_removed": self.revoked_removed,
+            "capacity_evictions": self.capacity_evictions,
+            "sweep_interval": self.sweep_interval,
+            "sweep_batch": self.sweep_batch,
+        }
+
+
+def create_token_repository():
+    """TOKEN_REPOSITORY_BACKEND 에 따라 저장소를 만듭니다 (memory 또는 redis)."""
+    if os.getenv("TOKEN_REPOSITORY_BACKEND", "memory") == "redis":
+        from app.domain.repository.redis_token_repository import RedisTokenRepository
+        return RedisTokenRepository()
+    return TokenRepository()
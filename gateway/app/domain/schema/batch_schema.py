@@ -0,0 +1,45 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from app.domain.model.service_type import ServiceType
+
+class BatchItemSchema(BaseModel):
+    """배치 안의 개별 하위 요청"""
+    id: Optional[str] = Field(None, description="응답에서 요청을 구분하기 위한 ID (없으면 순번)")
+    service: ServiceType = Field(..., description="대상 서비스")
+    method: str = Field("GET", description="HTTP 메서드")
+    path: str = Field(..., description="서비스 내 경로")
+    headers: Optional[Dict[str, str]] = Field(None, description="추가 요청 헤더")
+    body: Optional[Any] = Field(None, description="JSON 본문 (GET 이외)")
+    timeout: Optional[float] = Field(None, gt=0, description="개별 요청 마감 시간(초)")
+
+class BatchRequestSchema(BaseModel):
+    """배치 요청 스키마"""
+    requests: List[BatchItemSchema] = Field(..., description="동시에 실행할 하위 요청 목록")
+    timeout: Optional[float] = Field(None, gt=0, description="전체 배치 마감 시간(초)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "requests": [
+                    {"id": "passengers", "service": "titanic", "path": "predict"},
+                    {"id": "map", "service": "crime", "path": "view-map"},
+                    {"id": "wordcloud", "service": "nlp", "path": "wordcloud", "timeout": 5}
+                ],
+                "timeout": 10
+            }
+        }
+
+class BatchItemResultSchema(BaseModel):
+    """하위 요청 결과"""
+    id: str = Field(..., description="요청 ID")
+    status_code: int = Field(..., description="HTTP 상태 코드 (마감 초과 시 504)")
+    content_type: Optional[str] = Field(None, description="응답 content-type")
+    body: Optional[Any] = Field(None, description="응답 본문 (JSON, 텍스트 또는 base64)")
+    encoding: Optional[str] = Field(None, description="본문이 base64 이면 'base64'")
+    error: Optional[str] = Field(None, description="오류 메시지")
+    elapsed_ms: float = Field(..., description="소요 시간(ms)")
+
+class BatchResponseSchema(BaseModel):
+    """배치 응답 스키마"""
+    results: List[BatchItemResultSchema] = Field(..., description="요청 순서대로 정렬된 결과")
+    elapsed_ms: float = Field(..., description="전체 소요 시간(ms)")
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class LoginSchema(BaseModel):
@@ -22,4 +22,19 @@ class LoginResponseSchema(BaseModel):
     expires_in: int
     refresh_token: Optional[str] = None
     scope: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.now) 
\ No newline at end of file
+    created_at: datetime = Field(default_factory=datetime.now) 
+
+class LoginSummarySchema(BaseModel):
+    """조회 API 로 돌려주는 Login 정보 (access/refresh 토큰 제외)"""
+    id: str
+    provider: str
+    expires_at: Optional[datetime] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class LoginPageSchema(BaseModel):
+    """제공자별 Login 목록 한 페이지"""
+    items: List[LoginSummarySchema] = Field(..., description="Login 정보 (created_at, id 순서, 토큰 제외)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 없음)")
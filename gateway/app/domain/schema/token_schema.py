@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 class TokenSchema(BaseModel):
     """클라이언트로부터 받은 토큰을 검증하기 위한 스키마"""
@@ -15,4 +15,12 @@ class TokenVerifyResponseSchema(BaseModel):
     """토큰 검증 결과 스키마"""
     is_valid: bool = Field(..., description="토큰 유효성")
     user_id: Optional[str] = Field(None, description="사용자 ID")
-    payload: Optional[Dict[str, Any]] = Field(None, description="토큰 페이로드")
\ No newline at end of file
+    payload: Optional[Dict[str, Any]] = Field(None, description="토큰 페이로드")
+
+class TokenBatchVerifySchema(BaseModel):
+    """여러 토큰을 한 번에 검증하기 위한 스키마"""
+    tokens: List[str] = Field(..., description="검증할 인증 토큰 목록")
+
+class TokenBatchVerifyResponseSchema(BaseModel):
+    """배치 토큰 검증 결과 스키마 (요청한 순서와 같은 순서)"""
+    results: List[TokenVerifyResponseSchema] = Field(..., description="토큰별 검증 결과")
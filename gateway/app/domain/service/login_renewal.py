@@ -0,0 +1,123 @@
+import os
+import time
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+logger = logging.getLogger("gateway_api")
+
+
+class LoginRenewalScheduler:
+    """만료가 가까운 OAuth 토큰을 미리 갱신하는 백그라운드 작업
+
+    interval 초마다 expires_at 이 margin 초 안으로 다가온 Login 을 batch_size 개씩
+    선점해 최대 concurrency 개 동시에 갱신합니다. 만료된 지 max_stale 초가 넘은 Login 은
+    버려진 것으로 보고 더 이상 갱신하지 않으므로, 갱신이 계속 실패하는 Login 도 제공자 호출이
+    (margin + max_stale) / claim_for 번 안에서 끝납니다. 갱신은 LoginService 의 single-flight
+    경로를 그대로 사용하므로 같은 Login 에 대한 사용자 요청과 겹쳐도 제공자 호출은 한 번입니다.
+    """
+
+    def __init__(
+        self,
+        service,
+        margin: Optional[float] = None,
+        interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        max_stale: Optional[float] = None
+    ):
+        """초기화
+
+        Args:
+            service: 갱신을 수행할 LoginService
+            margin: 만료 몇 초 전에 갱신할지 (기본 LOGIN_RENEWAL_MARGIN 또는 300)
+            interval: 확인 주기 초 (기본 LOGIN_RENEWAL_INTERVAL 또는 30)
+            batch_size: 한 번에 선점할 최대 Login 수 (기본 LOGIN_RENEWAL_BATCH 또는 100)
+            concurrency: 동시에 진행할 최대 갱신 수 (기본 LOGIN_RENEWAL_CONCURRENCY 또는 10)
+            max_stale: 만료 후 몇 초까지 갱신을 시도할지 (기본 LOGIN_RENEWAL_MAX_STALE 또는 3600)
+        """
+        self.service = service
+        self.margin = margin if margin is not None else float(os.getenv("LOGIN_RENEWAL_MARGIN", "300"))
+        self.interval = interval if interval is not None else float(os.getenv("LOGIN_RENEWAL_INTERVAL", "30"))
+        self.batch_size = batch_size or int(os.getenv("LOGIN_RENEWAL_BATCH", "100"))
+        self.concurrency = concurrency or int(os.getenv("LOGIN_RENEWAL_CONCURRENCY", "10"))
+        self.max_stale = max_stale if max_stale is not None else float(os.getenv("LOGIN_RENEWAL_MAX_STALE", "3600"))
+        # 선점 유지 시간 - 갱신에 실패한 Login 은 이 시간이 지난 뒤 다시 시도
+        self.claim_for = max(self.interval * 2, 60.0)
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.renewed = 0
+        self.failed = 0
+        self.last_run_seconds = 0.0
+
+    async def run_once(self) -> int:
+        """갱신 대상이 남지 않을 때까지 배치 단위로 갱신하고 성공한 수를 반환합니다."""
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        renewed = 0
+
+        async def renew(login_id: str) -> bool:
+            async with semaphore:
+                try:
+                    return await self.service.refresh_login_token(login_id) is not None
+                except Exception as e:
+                    logger.error(f"❌ Login 토큰 사전 갱신 실패 ({login_id}): {str(e)}")
+                    return False
+
+        while True:
+            now = datetime.now()
+            batch = await self.service.repository.claim_expiring(
+                now + timedelta(seconds=self.margin), self.batch_size, self.claim_for,
+                after=now - timedelta(seconds=self.max_stale)
+            )
+            if not batch:
+                break
+            results = await asyncio.gather(*(renew(login.id) for login in batch))
+            succeeded = sum(results)
+            renewed += succeeded
+            self.renewed += succeeded
+            self.failed += len(results) - succeeded
+            if len(batch) < self.batch_size:
+                break
+        self.runs += 1
+        self.last_run_seconds = time.perf_counter() - started
+        if renewed:
+            logger.info(f"🔄 Login 토큰 {renewed}개 사전 갱신 ({self.last_run_seconds:.2f}s)")
+        return renewed
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"❌ Login 토큰 사전 갱신 주기 실패: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+            logger.info(f"🔄 Login 토큰 사전 갱신 시작 (만료 {self.margin:.0f}s 전, {self.interval:.0f}s 주기)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "margin": self.margin,
+            "interval": self.interval,
+            "batch_size": self.batch_size,
+            "concurrency": self.concurrency,
+            "max_stale": self.max_stale,
+            "runs": self.runs,
+            "renewed": self.renewed,
+            "failed": self.failed,
+            "last_run_seconds": round(self.last_run_seconds, 4),
+        }
@@ -1,24 +1,99 @@
 from app.domain.repository.login_repository import LoginRepository
 from app.domain.model.login_model import LoginEntity
-from app.domain.schema.login_schema import LoginResponseSchema, LoginSchema
+from app.domain.model.single_flight import SingleFlight
+from app.domain.schema.login_schema import LoginPageSchema, LoginResponseSchema, LoginSchema, LoginSummarySchema
+from app.domain.service.login_renewal import LoginRenewalScheduler
 import httpx
 import os
 import shortuuid
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional, List, Union
+
+# ✅ 제공자 토큰 엔드포인트 호출 설정 (공유 클라이언트)
+LOGIN_PROVIDER_TIMEOUT = float(os.getenv("LOGIN_PROVIDER_TIMEOUT", "10"))
+LOGIN_PROVIDER_MAX_CONNECTIONS = int(os.getenv("LOGIN_PROVIDER_MAX_CONNECTIONS", "20"))
+# ✅ 만료 전 토큰 사전 갱신 (DB 사용 시 initialize 에서 시작)
+LOGIN_RENEWAL_ENABLED = os.getenv("LOGIN_RENEWAL", "true").lower() == "true"
+
+
+async def parse_ndjson_logins(chunks: AsyncIterable[bytes]) -> AsyncIterator[LoginEntity]:
+    """NDJSON 바이트 스트림을 읽는 대로 한 줄씩 LoginEntity 로 변환합니다 (빈 줄은 무시)."""
+    buffer = b""
+    line_number = 0
+
+    def parse(line: bytes) -> Optional[LoginEntity]:
+        if not line.strip():
+            return None
+        try:
+            return LoginEntity.model_validate_json(line)
+        except ValueError as e:
+            raise ValueError(f"{line_number}번째 줄을 읽을 수 없습니다: {e}") from e
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            entity = parse(line)
+            if entity is not None:
+                yield entity
+    line_number += 1
+    entity = parse(buffer)
+    if entity is not None:
+        yield entity
 
 
 class LoginService:
     """Login 인증 서비스 클래스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = LoginRepository()
+    def __init__(self, repository: Optional[LoginRepository] = None, http_client: Optional[httpx.AsyncClient] = None):
+        """서비스 초기화
+
+        Args:
+            repository: Login 레포지토리 (기본 새 LoginRepository)
+            http_client: 제공자 호출용 클라이언트 (기본 처음 호출할 때 생성)
+        """
+        self.repository = repository or LoginRepository()
+        self._http = http_client
+        # 같은 Login 의 동시 갱신은 제공자 호출 한 번으로 합침
+        self.refresh_flight = SingleFlight(routes=set())
+        self.renewal = LoginRenewalScheduler(self)
         
     async def initialize(self):
         """서비스 초기화 작업"""
         # 테이블 초기화
         await self.repository.init_table()
+        # 다른 워커의 캐시 무효화 메시지 구독
+        await self.repository.start()
+        if LOGIN_RENEWAL_ENABLED:
+            self.renewal.start()
+
+    async def close(self):
+        """서비스 종료 작업"""
+        await self.renewal.stop()
+        await self.repository.close()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """제공자 호출용 공유 클라이언트 (커넥션 재사용)"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=LOGIN_PROVIDER_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=LOGIN_PROVIDER_MAX_CONNECTIONS,
+                    max_keepalive_connections=LOGIN_PROVIDER_MAX_CONNECTIONS
+                )
+            )
+        return self._http
+
+    def stats(self) -> dict:
+        """토큰 갱신 coalescing 과 사전 갱신 통계"""
+        flight = self.refresh_flight.stats()
+        flight.pop("routes", None)
+        return {"refresh": flight, "renewal": self.renewal.stats()}
     
     async def get_login_by_id(self, id: str) -> Optional[LoginEntity]:
         """ID로 Login 정보를 조회합니다"""
@@ -27,7 +102,27 @@ class LoginService:
     async def get_login_by_provider(self, provider: str) -> List[LoginEntity]:
         """제공자별 Login 정보를 조회합니다"""
         return await self.repository.find_login_by_provider(provider)
+
+    async def get_login_page(self, provider: str, limit: int, cursor: Optional[str] = None) -> LoginPageSchema:
+        """제공자별 Login 정보를 한 페이지 조회합니다"""
+        items, next_cursor = await self.repository.find_login_page(provider, limit, cursor)
+        return LoginPageSchema(
+            items=[LoginSummarySchema.model_validate(item) for item in items],
+            next_cursor=next_cursor
+        )
+
+    def stream_login_by_provider(self, provider: str) -> AsyncIterator[LoginEntity]:
+        """제공자별 Login 정보를 DB 에서 읽는 대로 넘겨줍니다"""
+        return self.repository.stream_login_by_provider(provider)
     
+    async def import_logins(
+        self,
+        logins: Union[Iterable[LoginEntity], AsyncIterable[LoginEntity]],
+        chunk_size: Optional[int] = None
+    ) -> dict:
+        """Login 정보를 대량으로 가져옵니다 (기존 ID 는 갱신)"""
+        return await self.repository.bulk_upsert(logins, chunk_size)
+
     async def create_login(self, login_data: LoginSchema) -> LoginResponseSchema:
         """Login 인증 정보를 생성합니다"""
         provider = login_data.provider
@@ -64,7 +159,10 @@ class LoginService:
         )
     
     async def refresh_login_token(self, id: str) -> Optional[LoginResponseSchema]:
-        """토큰을 갱신합니다"""
+        """토큰을 갱신합니다 (같은 ID 의 동시 요청은 갱신 한 번의 결과를 공유)"""
+        return await self.refresh_flight.do(("refresh", id), lambda: self._refresh_login_token(id))
+
+    async def _refresh_login_token(self, id: str) -> Optional[LoginResponseSchema]:
         # 기존 토큰 조회
         login_entity = await self.repository.find_login_by_id(id)
         
@@ -122,14 +220,13 @@ class LoginService:
                 data['redirect_uri'] = redirect_uri
             
             # 토큰 요청
-            async with httpx.AsyncClient() as client:
-                response = await client.post(token_url, data=data)
-                
-                if response.status_code != 200:
-                    print(f"Error exchanging code for token: {response.text}")
-                    return {}
-                
-                return response.json()
+            response = await self.http.post(token_url, data=data)
+            
+            if response.status_code != 200:
+                print(f"Error exchanging code for token: {response.text}")
+                return {}
+            
+            return response.json()
                 
         except Exception as e:
             print(f"Error exchanging code for token: {e}")
@@ -150,14 +247,13 @@ class LoginService:
             }
             
             # 토큰 요청
-            async with httpx.AsyncClient() as client:
-                response = await client.post(token_url, data=data)
-                
-                if response.status_code != 200:
-                    print(f"Error refreshing token: {response.text}")
-                    return {}
-                
-                return response.json()
+            response = await self.http.post(token_url, data=data)
+            
+            if response.status_code != 200:
+                print(f"Error refreshing token: {response.text}")
+                return {}
+            
+            return response.json()
                 
         except Exception as e:
             print(f"Error refreshing token: {e}")
@@ -1,11 +1,14 @@
-from typing import Dict, Optional, Any
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta, timezone
+import os
+import time
 import uuid
 from jose import jwt, JWTError
 from fastapi import HTTPException, status
 
-from app.domain.repository.token_repository import TokenRepository
+from app.domain.repository.token_repository import create_token_repository
 from app.domain.model.token_model import TokenModel
+from app.domain.model.token_cache import HS256Verifier, RevocationFilter, VerifiedToken, VerifiedTokenCache, peek_claims
 from app.domain.schema.token_schema import TokenSchema, TokenResponseSchema, TokenVerifyResponseSchema
 
 # 토큰 설정
@@ -13,12 +16,29 @@ SECRET_KEY = "your-secret-key-for-testing-only-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# ✅ 검증된 토큰 캐시 크기 (0 이면 캐시 사용 안 함)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+# ✅ 공유 저장소(Redis) 사용 시 캐시 유지 시간 상한 (초) - 다른 워커의 폐기가 반영되는 최대 지연
+TOKEN_CACHE_SHARED_TTL = float(os.getenv("TOKEN_CACHE_SHARED_TTL", "5"))
+# ✅ 배치 검증 한 번에 받을 최대 토큰 수
+TOKEN_VERIFY_BATCH_MAX = int(os.getenv("TOKEN_VERIFY_BATCH_MAX", "1000"))
+
+INVALID = TokenVerifyResponseSchema(is_valid=False, user_id=None, payload=None)
+
 class TokenService:
     """토큰 서비스"""
     
-    def __init__(self):
-        """서비스 초기화"""
-        self.repository = TokenRepository()
+    def __init__(self, cache_size: Optional[int] = None, repository=None):
+        """서비스 초기화
+
+        Args:
+            cache_size: 검증된 토큰 캐시 크기 (기본 TOKEN_CACHE_SIZE)
+            repository: 토큰 저장소 (기본 TOKEN_REPOSITORY_BACKEND 에 따라 생성)
+        """
+        self.repository = repository or create_token_repository()
+        self.cache = VerifiedTokenCache(TOKEN_CACHE_SIZE if cache_size is None else cache_size)
+        self.revocations = RevocationFilter(ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+        self.verifier = HS256Verifier(SECRET_KEY)
     
     async def create_token(self, user_id: str) -> TokenResponseSchema:
         """새 토큰 생성"""
@@ -52,19 +72,37 @@ class TokenService:
         )
     
     async def verify_token(self, token_schema: TokenSchema) -> TokenVerifyResponseSchema:
-        """토큰 검증"""
+        """토큰 검증
+
+        이미 검증된 토큰은 캐시(jti 키, exp 까지 유효)에서 바로 응답하고,
+        폐기 필터에 걸린 토큰은 저장소 조회 없이 거부합니다.
+        """
         token = token_schema.token
+        claims = peek_claims(token)
+        if claims is None:
+            return INVALID.model_copy()
+
+        # 폐기된 토큰은 캐시보다 먼저 거부
+        now = time.time()
+        if self.revocations.is_revoked(claims, now):
+            return INVALID.model_copy()
+
+        jti = claims.get("jti")
+        if jti:
+            cached = self.cache.get(jti, token, now)
+            if cached is not None:
+                return TokenVerifyResponseSchema(
+                    is_valid=True,
+                    user_id=cached.user_id,
+                    payload=dict(cached.payload)
+                )
         
         # 토큰 모델 조회
         token_model = await self.repository.find_by_token(token)
         
         # 토큰이 저장소에 없거나 폐기된 경우
         if not token_model or token_model.is_revoked:
-            return TokenVerifyResponseSchema(
-                is_valid=False,
-                user_id=None,
-                payload=None
-            )
+            return INVALID.model_copy()
         
         try:
             # JWT 토큰 검증
@@ -78,6 +116,9 @@ class TokenService:
                     user_id=user_id,
                     payload=None
                 )
+
+            if jti:
+                self._remember(jti, token, token_model, payload, now)
             
             return TokenVerifyResponseSchema(
                 is_valid=True,
@@ -86,23 +127,116 @@ class TokenService:
             )
             
         except JWTError:
-            return TokenVerifyResponseSchema(
-                is_valid=False,
-                user_id=None,
-                payload=None
-            )
+            return INVALID.model_copy()
     
+    async def verify_many(self, tokens: List[str]) -> List[TokenVerifyResponseSchema]:
+        """여러 토큰을 한 번에 검증 (결과는 입력 순서)
+
+        중복 토큰은 한 번만 검증하고, 캐시에 없는 토큰은 HMAC 키 상태를 재사용해 서명을
+        확인한 뒤 저장소에서 한 번에 조회합니다. 결과는 verify_token 과 같습니다.
+        """
+        if len(tokens) > TOKEN_VERIFY_BATCH_MAX:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"한 번에 최대 {TOKEN_VERIFY_BATCH_MAX}개의 토큰만 검증할 수 있습니다."
+            )
+
+        now = time.time()
+        results: Dict[str, TokenVerifyResponseSchema] = {}
+        pending: Dict[str, Dict[str, Any]] = {}
+        for token in dict.fromkeys(tokens):
+            claims = peek_claims(token)
+            if claims is None or self.revocations.is_revoked(claims, now):
+                results[token] = INVALID
+                continue
+            jti = claims.get("jti")
+            cached = self.cache.get(jti, token, now) if jti else None
+            if cached is not None:
+                results[token] = TokenVerifyResponseSchema(
+                    is_valid=True,
+                    user_id=cached.user_id,
+                    payload=dict(cached.payload)
+                )
+                continue
+            # 서명이 틀린 토큰은 저장소 조회 대상에서 제외
+            payload = self.verifier.verify(token, now)
+            if payload is None:
+                results[token] = INVALID
+            else:
+                pending[token] = payload
+
+        token_models = await self.repository.find_many_by_token(list(pending)) if pending else {}
+        utcnow = datetime.utcnow()
+        for token, payload in pending.items():
+            token_model = token_models.get(token)
+            if not token_model or token_model.is_revoked:
+                results[token] = INVALID
+                continue
+            user_id = payload.get("sub")
+            if utcnow > token_model.expires_at:
+                results[token] = TokenVerifyResponseSchema(is_valid=False, user_id=user_id, payload=None)
+                continue
+            jti = payload.get("jti")
+            if jti:
+                self._remember(jti, token, token_model, payload, now)
+            results[token] = TokenVerifyResponseSchema(is_valid=True, user_id=user_id, payload=payload)
+
+        return [results[token].model_copy() for token in tokens]
+
+    def _remember(self, jti: str, token: str, token_model: TokenModel, payload: Dict[str, Any], now: float):
+        """검증된 토큰을 exp 까지 캐시합니다."""
+        expires_at = min(
+            float(payload.get("exp", 0)),
+            token_model.expires_at.replace(tzinfo=timezone.utc).timestamp()
+        )
+        if getattr(self.repository, "shared", False):
+            # 다른 워커에서 폐기된 토큰은 이 워커의 폐기 필터에 없으므로 캐시를 짧게 유지
+            expires_at = min(expires_at, now + TOKEN_CACHE_SHARED_TTL)
+        self.cache.put(jti, VerifiedToken(token, user_id=payload.get("sub"), payload=dict(payload), expires_at=expires_at))
+
     async def revoke_token(self, token: str) -> Dict[str, Any]:
         """토큰 폐기"""
         token_model = await self.repository.revoke(token)
         
-        if not token_model:
+        # 보존 시간이 지나 저장소에서 제거된 폐기 토큰은 서명과 exp 가 맞으면 다시 폐기해도 성공
+        if not token_model and self.verifier.verify(token) is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="토큰을 찾을 수 없습니다."
             )
+
+        # 캐시와 폐기 필터에 즉시 반영
+        claims = peek_claims(token) or {}
+        jti = claims.get("jti")
+        if jti:
+            self.revocations.revoke(jti, float(claims.get("exp", time.time() + ACCESS_TOKEN_EXPIRE_MINUTES * 60)))
+            self.cache.discard(jti)
         
         return {"message": "토큰이 폐기되었습니다."}
+
+    async def revoke_all_for_user(self, user_id: str) -> Dict[str, Any]:
+        """사용자의 모든 토큰 폐기"""
+        revoked = await self.repository.revoke_all_for_user(user_id)
+        self.revocations.revoke_user(user_id)
+        self.cache.discard_user(user_id)
+        return {"message": f"{len(revoked)}개의 토큰이 폐기되었습니다."}
+
+    async def close(self):
+        """저장소의 백그라운드 작업과 연결을 정리합니다."""
+        await self.repository.close()
+
+    def cached_subject(self, token: str) -> Optional[str]:
+        """검증 캐시에 있는 토큰의 사용자 (서명 검증 없이 조회, 없으면 None)"""
+        claims = peek_claims(token)
+        jti = claims.get("jti") if claims else None
+        if not isinstance(jti, str):
+            return None
+        entry = self.cache.peek(jti, token)
+        return entry.user_id if entry is not None else None
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """검증 캐시, 폐기 필터, 저장소 통계"""
+        return {**self.cache.stats(), **self.revocations.stats(), "repository": self.repository.stats()}
     
     async def test_dummy_token(self, user_id: str = "test-user") -> TokenResponseSchema:
         """테스트용 더미 토큰 생성"""
@@ -1,5 +1,5 @@
 import json
-from fastapi import APIRouter, FastAPI, Request, Response, File, UploadFile, Form
+from fastapi import APIRouter, Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import os
@@ -7,6 +7,21 @@ import logging
 import sys
 from dotenv import load_dotenv
 from app.domain.model.service_proxy_factory import ServiceProxyFactory
+from app.domain.model.service_client_pool import client_pool
+from app.domain.model.load_balancer import upstream_balancer
+from app.domain.model.upload_forwarder import upload_forwarder
+from app.domain.model.response_cache import response_cache
+from app.domain.model.single_flight import single_flight
+from app.domain.model.batch_dispatcher import batch_dispatcher
+from app.domain.model.gateway_metrics import MetricsMiddleware, gateway_metrics
+from app.domain.model.response_compression import CompressionMiddleware
+from app.domain.model.rate_limiter import enforce_rate_limit, rate_limiter
+from app.domain.schema.batch_schema import BatchRequestSchema, BatchResponseSchema
+from app.api.admin_router import router as admin_router
+from app.api.token_router import router as token_router, token_controller
+from app.domain.controller.login_controller import router as login_router, login_service
+from app.domain.repository.database import database_pool
+from app.domain.model.readiness import readiness
 from contextlib import asynccontextmanager
 from app.domain.model.request_model import FinanceRequest
 from app.domain.model.service_type import ServiceType
@@ -23,11 +38,36 @@ logger = logging.getLogger("gateway_api")
 # .env 파일 로드
 load_dotenv()
 
+# ✅ passthrough 모드: 업스트림 응답을 파싱하지 않고 그대로 스트리밍
+PROXY_PASSTHROUGH = os.getenv("GATEWAY_PASSTHROUGH", "true").lower() == "true"
+
+# ✅ 요청 지표 수집 (Prometheus /metrics)
+METRICS_ENABLED = os.getenv("GATEWAY_METRICS", "true").lower() == "true"
+
+# ✅ 응답 압축 (Accept-Encoding 협상)
+COMPRESSION_ENABLED = os.getenv("GATEWAY_COMPRESSION", "true").lower() == "true"
+
+# ✅ Login 정보 PostgreSQL 저장 (끄면 메모리에만 저장)
+DATABASE_ENABLED = os.getenv("GATEWAY_DATABASE", "false").lower() == "true"
+
 # ✅ 애플리케이션 시작 시 실행
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 Gateway API 서비스 시작")
+    await client_pool.startup()
+    await upstream_balancer.start_health_checks()
+    if DATABASE_ENABLED:
+        await database_pool.startup()
+        await login_service.initialize()
+    await readiness.start()
+    readiness.install_signal_handlers()
     yield
+    await readiness.drain()
+    await upstream_balancer.stop_health_checks()
+    await login_service.close()
+    await token_controller.service.close()
+    await database_pool.shutdown()
+    await client_pool.shutdown()
     logger.info("🛑 Gateway API 서비스 종료")
 
 
@@ -48,6 +88,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 응답 압축 미들웨어 (지표 미들웨어 안쪽에 두어 실제 전송 바이트가 기록되도록 함)
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# ✅ 지표 미들웨어 (CORS 처리까지 포함한 전체 시간을 측정하도록 마지막에 추가)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# ✅ Prometheus 지표 엔드포인트
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    content = gateway_metrics.render() + "\n".join(database_pool.render()) + "\n"
+    return Response(content=content, media_type="text/plain; version=0.0.4; charset=utf-8")
+
+# ✅ 준비 상태 엔드포인트 (기동 완료 전과 드레인 중에는 503)
+@app.get("/ready", include_in_schema=False)
+async def ready():
+    return JSONResponse(content=readiness.status(), status_code=200 if readiness.ready else 503)
+
 # ✅ 메인 라우터 생성
 gateway_router = APIRouter(prefix="/ai/v1", tags=["Gateway API"])
 
@@ -56,16 +115,41 @@ gateway_router = APIRouter(prefix="/ai/v1", tags=["Gateway API"])
 async def health_check():
     return {"status": "healthy!"}
 
+# ✅ 배치 fan-out 엔드포인트 (프록시 경로보다 먼저 등록)
+@gateway_router.post("/batch", summary="여러 서비스 요청 동시 실행", response_model=BatchResponseSchema)
+async def proxy_batch(batch: BatchRequestSchema, request: Request):
+    """
+    여러 서비스로 가는 하위 요청을 동시에 실행하고 요청별 상태 코드와 본문을 반환합니다.
+    """
+    return await batch_dispatcher.dispatch(batch, client=rate_limiter.client_key(request))
+
 # ✅ 메인 라우터 실행
 
+# ✅ 클라이언트 × 서비스 별 요청 제한 (초과 시 429 + Retry-After)
+RATE_LIMITED = Depends(enforce_rate_limit)
+
 # GET
-@gateway_router.get("/{service}/{path:path}", summary="GET 프록시")
+@gateway_router.get("/{service}/{path:path}", summary="GET 프록시", dependencies=[RATE_LIMITED])
 async def proxy_get(
     service: ServiceType, 
     path: str, 
     request: Request
 ):
-    factory = ServiceProxyFactory(service_type=service)
+    factory = ServiceProxyFactory.for_service(service)
+    ttl = response_cache.ttl_for(service.value, path)
+    if ttl:
+        return await response_cache.fetch(factory, service.value, path, request, ttl)
+    if single_flight.coalesces(service.value, path):
+        # 동시에 들어온 같은 GET 은 업스트림 호출 하나의 결과를 함께 받음
+        key = response_cache.make_key(service.value, path, request)
+        result = await single_flight.do(key, lambda: factory.fetch(path, request.headers.raw))
+        return result.to_response()
+    if PROXY_PASSTHROUGH:
+        return await factory.stream(
+            method="GET",
+            path=path,
+            headers=request.headers.raw
+        )
     response = await factory.request(
         method="GET",
         path=path,
@@ -83,23 +167,54 @@ async def proxy_get(
     return JSONResponse(content=response.json(), status_code=response.status_code)
 
 # POST
-@gateway_router.post("/{service}/{path:path}", summary="POST 프록시")
+UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                        "json_data": {"type": "string"}
+                    }
+                }
+            }
+        }
+    }
+}
+
+@gateway_router.post("/{service}/{path:path}", summary="POST 프록시", dependencies=[RATE_LIMITED], openapi_extra=UPLOAD_REQUEST_BODY)
 async def proxy_post(
     service: ServiceType,
     path: str,
-    file: Optional[UploadFile] = File(None),
-    json_data: Optional[str] = Form(None)
+    request: Request
 ):
     logger.info(f"🌈Received request for service: {service}, path: {path}")
-    factory = ServiceProxyFactory(service_type=service)
+    factory = ServiceProxyFactory.for_service(service)
+
+    upload = None
+    json_data = None
+    if upload_forwarder.is_multipart(request):
+        upload = await upload_forwarder.open(request)
+        if not upload.has_file:
+            json_data = (await upload.form()).get("json_data")
+    else:
+        json_data = (await request.form()).get("json_data")
 
-    if file:
-        # 파일 업로드 처리
-        files = {'file': (file.filename, file.file, file.content_type)}
+    if upload and upload.has_file:
+        # 파일 업로드는 multipart 본문을 스풀링 없이 그대로 스트리밍 전달
+        if PROXY_PASSTHROUGH:
+            return await factory.stream(
+                method="POST",
+                path=path,
+                headers=request.headers.raw,
+                content=upload
+            )
         response = await factory.request(
             method="POST",
             path=path,
-            files=files
+            headers=request.headers.raw,
+            content=upload
         )
     elif json_data:
         # JSON 문자열 파싱
@@ -107,6 +222,12 @@ async def proxy_post(
             data = json.loads(json_data)
         except Exception:
             return JSONResponse(content={"error": "Invalid JSON string"}, status_code=400)
+        if PROXY_PASSTHROUGH:
+            return await factory.stream(
+                method="POST",
+                path=path,
+                json=data
+            )
         response = await factory.request(
             method="POST",
             path=path,
@@ -134,45 +255,69 @@ async def proxy_post(
         )
 
 # PUT
-@gateway_router.put("/{service}/{path:path}", summary="PUT 프록시")
+@gateway_router.put("/{service}/{path:path}", summary="PUT 프록시", dependencies=[RATE_LIMITED])
 async def proxy_put(service: ServiceType, path: str, request: Request):
-    factory = ServiceProxyFactory(service_type=service)
+    factory = ServiceProxyFactory.for_service(service)
+    if PROXY_PASSTHROUGH:
+        return await factory.stream(
+            method="PUT",
+            path=path,
+            headers=request.headers.raw,
+            content=await request.body()
+        )
     response = await factory.request(
         method="PUT",
         path=path,
         headers=request.headers.raw,
-        body=await request.body()
+        data=await request.body()
     )
     return JSONResponse(content=response.json(), status_code=response.status_code)
 
 # DELETE
-@gateway_router.delete("/{service}/{path:path}", summary="DELETE 프록시")
+@gateway_router.delete("/{service}/{path:path}", summary="DELETE 프록시", dependencies=[RATE_LIMITED])
 async def proxy_delete(service: ServiceType, path: str, request: Request):
-    factory = ServiceProxyFactory(service_type=service)
+    factory = ServiceProxyFactory.for_service(service)
+    if PROXY_PASSTHROUGH:
+        return await factory.stream(
+            method="DELETE",
+            path=path,
+            headers=request.headers.raw,
+            content=await request.body()
+        )
     response = await factory.request(
         method="DELETE",
         path=path,
         headers=request.headers.raw,
-        body=await request.body()
+        data=await request.body()
     )
     return JSONResponse(content=response.json(), status_code=response.status_code)
 
 # PATCH
-@gateway_router.patch("/{service}/{path:path}", summary="PATCH 프록시")
+@gateway_router.patch("/{service}/{path:path}", summary="PATCH 프록시", dependencies=[RATE_LIMITED])
 async def proxy_patch(service: ServiceType, path: str, request: Request):
-    factory = ServiceProxyFactory(service_type=service)
+    factory = ServiceProxyFactory.for_service(service)
+    if PROXY_PASSTHROUGH:
+        return await factory.stream(
+            method="PATCH",
+            path=path,
+            headers=request.headers.raw,
+            content=await request.body()
+        )
     response = await factory.request(
         method="PATCH",
         path=path,
         headers=request.headers.raw,
-        body=await request.body()
+        data=await request.body()
     )
     return JSONResponse(content=response.json(), status_code=response.status_code)
 
-# ✅ 라우터 등록
+# ✅ 라우터 등록 (관리자 라우터는 프록시 경로보다 먼저 등록)
+app.include_router(admin_router)
+app.include_router(token_router)
+app.include_router(login_router)
 app.include_router(gateway_router)
 
-# ✅ 서버 실행
+# ✅ 서버 실행 (개발용 단일 프로세스 - 운영은 gunicorn.conf.py 로 워커 여러 개 실행)
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 9090))
@@ -0,0 +1,62 @@
+import pytest
+import pytest_asyncio
+import httpx
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.domain.model.service_client_pool import client_pool
+from app.domain.model.service_proxy_factory import ServiceProxyFactory
+from app.domain.model.rate_limiter import rate_limiter
+from app.domain.model.deadline import adaptive_timeouts
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    """실제 네트워크 응답처럼 청크 단위로 읽히는 스트림"""
+
+    def __init__(self, content: bytes, chunk_size: int = 4096):
+        self.content = content
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for start in range(0, len(self.content), self.chunk_size):
+            yield self.content[start:start + self.chunk_size]
+
+
+def as_streamed(handler):
+    """MockTransport 핸들러의 응답을 미리 읽지 않은 스트림 응답으로 바꿉니다."""
+    async def wrapped(request: httpx.Request) -> httpx.Response:
+        response = handler(request)
+        if not isinstance(response, httpx.Response):
+            response = await response
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=ChunkedStream(response.content)
+        )
+    return wrapped
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """테스트 간에 클라이언트 요청 허용량과 지연 표본이 이어지지 않도록 비웁니다."""
+    rate_limiter.reset()
+    adaptive_timeouts.reset()
+    yield
+
+
+@pytest.fixture
+def mock_upstream(monkeypatch):
+    """업스트림 서비스를 httpx.MockTransport 핸들러로 대체합니다."""
+    def install(handler):
+        for service in ServiceType:
+            monkeypatch.setitem(SERVICE_URLS, service, f"http://{service.value}-service")
+        monkeypatch.setattr(ServiceProxyFactory, "_instances", {})
+        monkeypatch.setattr(client_pool, "_clients", {})
+        monkeypatch.setattr(client_pool, "_transport", httpx.MockTransport(as_streamed(handler)))
+    return install
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """게이트웨이 앱 비동기 클라이언트 픽스처"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
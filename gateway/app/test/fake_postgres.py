@@ -0,0 +1,187 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List
+
+
+class FakeStatement:
+    """prepare 된 statement 대역 (이름별 처리 함수로 실행)"""
+
+    def __init__(self, db: "FakePostgres", name: str):
+        self.db = db
+        self.name = name
+        self.status = ""
+
+    async def fetch(self, *args) -> List[dict]:
+        await asyncio.sleep(0)
+        rows, self.status = self.db.handlers[self.name](*args)
+        return rows
+
+    async def fetchrow(self, *args):
+        rows = await self.fetch(*args)
+        return rows[0] if rows else None
+
+    async def fetchval(self, *args):
+        row = await self.fetchrow(*args)
+        return next(iter(row.values())) if row else None
+
+    def cursor(self, *args, prefetch: int = 100) -> "FakeCursor":
+        return FakeCursor(self, args, prefetch)
+
+    def get_statusmsg(self) -> str:
+        return self.status
+
+
+class FakeCursor:
+    """서버 측 커서 대역 - prefetch 행씩 가져온 횟수를 기록합니다."""
+
+    def __init__(self, statement: FakeStatement, args: tuple, prefetch: int):
+        self.statement = statement
+        self.args = args
+        self.prefetch = prefetch
+
+    async def __aiter__(self):
+        rows, self.statement.status = self.statement.db.handlers[self.statement.name](*self.args)
+        for start in range(0, len(rows), self.prefetch):
+            self.statement.db.cursor_fetches += 1
+            await asyncio.sleep(0)
+            for row in rows[start:start + self.prefetch]:
+                yield row
+
+
+class FakeConnection:
+    """PreparedConnection 대역"""
+
+    def __init__(self, db: "FakePostgres"):
+        self.db = db
+        self._named_statements: Dict[str, FakeStatement] = {}
+
+    async def prepared(self, name: str, sql: str) -> FakeStatement:
+        if name not in self._named_statements:
+            self.db.prepares += 1
+            self._named_statements[name] = FakeStatement(self.db, name)
+        return self._named_statements[name]
+
+    def forget(self, name: str):
+        self._named_statements.pop(name, None)
+
+    async def execute(self, sql: str) -> str:
+        self.db.ddl.append(sql)
+        return "CREATE TABLE"
+
+    async def copy_records_to_table(self, table: str, records, columns):
+        self.db.copies += 1
+        self.db.staging.extend(dict(zip(columns, record)) for record in records)
+
+    @asynccontextmanager
+    async def transaction(self):
+        try:
+            yield
+        finally:
+            self.db.staging.clear()  # ON COMMIT DELETE ROWS
+
+
+class FakePostgres:
+    """asyncpg 풀 대역 - login_entities 테이블을 메모리 dict 로 흉내냅니다.
+
+    DatabasePool(pool=FakePostgres()) 로 사용하며, 연결 수가 max_size 로 제한되고
+    acquire/release 횟수와 prepare 횟수를 기록합니다.
+    """
+
+    def __init__(self, max_size: int = 2):
+        self.max_size = max_size
+        self._semaphore = asyncio.Semaphore(max_size)
+        self._idle: List[FakeConnection] = []
+        self._created = 0
+        self.acquired = 0
+        self.released = 0
+        self.prepares = 0
+        self.cursor_fetches = 0
+        self.copies = 0
+        self.staging: List[dict] = []
+        self.ddl: List[str] = []
+        self.logins: Dict[str, dict] = {}
+        self.handlers: Dict[str, Callable] = {
+            "login.save": self._save,
+            "login.find_by_id": self._find_by_id,
+            "login.provider_first_page": self._provider_first_page,
+            "login.provider_next_page": self._provider_next_page,
+            "login.provider_stream": self._provider_stream,
+            "login.delete": self._delete,
+            "login.claim_expiring": self._claim_expiring,
+            "login.import_merge": self._import_merge,
+        }
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self._semaphore:
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = FakeConnection(self)
+                self._created += 1
+            self.acquired += 1
+            try:
+                yield conn
+            finally:
+                self.released += 1
+                self._idle.append(conn)
+
+    def get_size(self) -> int:
+        return self._created
+
+    def get_idle_size(self) -> int:
+        return len(self._idle)
+
+    async def close(self):
+        self._idle.clear()
+
+    def _save(self, id, provider, access_token, refresh_token, expires_at, created_at):
+        row = self.logins.get(id)
+        self.logins[id] = {
+            "id": id, "provider": provider, "access_token": access_token, "refresh_token": refresh_token,
+            "expires_at": expires_at, "created_at": row["created_at"] if row else created_at,
+            "renewal_claimed_until": row["renewal_claimed_until"] if row else None,
+        }
+        return [], "INSERT 0 1"
+
+    def _find_by_id(self, id):
+        row = self.logins.get(id)
+        return ([dict(row)] if row else []), "SELECT"
+
+    def _provider_rows(self, provider):
+        rows = [dict(row) for row in self.logins.values() if row["provider"] == provider]
+        return sorted(rows, key=lambda row: (row["created_at"], row["id"]))
+
+    def _provider_first_page(self, provider, limit):
+        rows = self._provider_rows(provider)[:limit]
+        return rows, f"SELECT {len(rows)}"
+
+    def _provider_next_page(self, provider, created_at, id, limit):
+        rows = [row for row in self._provider_rows(provider) if (row["created_at"], row["id"]) > (created_at, id)][:limit]
+        return rows, f"SELECT {len(rows)}"
+
+    def _provider_stream(self, provider):
+        rows = self._provider_rows(provider)
+        return rows, f"SELECT {len(rows)}"
+
+    def _delete(self, id):
+        return [], f"DELETE {1 if self.logins.pop(id, None) else 0}"
+
+    def _claim_expiring(self, before, now, claimed_until, limit, after):
+        rows = sorted(
+            (row for row in self.logins.values()
+             if row["refresh_token"] and after <= row["expires_at"] < before
+             and (row["renewal_claimed_until"] is None or row["renewal_claimed_until"] < now)),
+            key=lambda row: row["expires_at"]
+        )[:limit]
+        for row in rows:
+            row["renewal_claimed_until"] = claimed_until
+        return [dict(row) for row in rows], f"UPDATE {len(rows)}"
+
+    def _import_merge(self):
+        ids = [row["id"] for row in self.staging]
+        if len(ids) != len(set(ids)):
+            raise ValueError("ON CONFLICT DO UPDATE command cannot affect row a second time")
+        for row in self.staging:
+            self._save(*(row[column] for column in ("id", "provider", "access_token", "refresh_token", "expires_at", "created_at")))
+        return [], f"INSERT 0 {len(self.staging)}"
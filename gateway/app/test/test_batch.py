@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+import httpx
+from app.domain.model.batch_dispatcher import decode_body
+
+
+async def fan_out_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path == "/slow":
+        await asyncio.sleep(1.0)
+        return httpx.Response(200, json={"late": True})
+    if path == "/echo":
+        return httpx.Response(200, content=request.content, headers={"content-type": "application/json"})
+    if path == "/mosaic":
+        return httpx.Response(200, content=b"\x89PNG\r\n", headers={"content-type": "image/png"})
+    if path == "/test":
+        return httpx.Response(500, text="boom")
+    return httpx.Response(200, text=f"<html>{path}</html>", headers={"content-type": "text/html"})
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_per_item_results_in_order(mock_upstream, async_client):
+    """하위 요청 결과는 요청 순서대로, 각자의 상태와 본문을 담아야 합니다."""
+    mock_upstream(fan_out_handler)
+    response = await async_client.post("/ai/v1/batch", json={"requests": [
+        {"id": "echo", "service": "titanic", "method": "POST", "path": "echo", "body": {"name": "Jack"}},
+        {"id": "png", "service": "tf", "path": "mosaic"},
+        {"id": "html", "service": "crime", "path": "map"},
+        {"service": "nlp", "path": "test"},
+    ]})
+    assert response.status_code == 200
+    results = {r["id"]: r for r in response.json()["results"]}
+    assert list(results) == ["echo", "png", "html", "3"]
+    assert results["echo"]["body"] == {"name": "Jack"}
+    assert results["png"]["encoding"] == "base64"
+    assert results["html"]["body"] == "<html>/map</html>"
+    assert results["3"]["status_code"] == 500
+
+
+@pytest.mark.asyncio
+async def test_item_and_batch_deadlines(mock_upstream, async_client):
+    """느린 하위 요청은 마감 시간에 504 로 끝나고 나머지 결과는 그대로 반환되어야 합니다."""
+    mock_upstream(fan_out_handler)
+    response = await async_client.post("/ai/v1/batch", json={"requests": [
+        {"id": "item", "service": "titanic", "path": "slow", "timeout": 0.05},
+        {"id": "fast", "service": "crime", "path": "map"},
+    ], "timeout": 0.5})
+    results = {r["id"]: r for r in response.json()["results"]}
+    assert results["item"]["status_code"] == 504
+    assert results["fast"]["status_code"] == 200
+
+    response = await async_client.post("/ai/v1/batch", json={"requests": [
+        {"id": "overall", "service": "titanic", "path": "slow"},
+    ], "timeout": 0.05})
+    assert response.json()["results"][0]["status_code"] == 504
+    assert response.json()["elapsed_ms"] < 900
+
+
+def test_decode_body():
+    assert decode_body("application/json", b'{"a": 1}') == ({"a": 1}, None)
+    assert decode_body("text/plain; charset=utf-8", "한글".encode()) == ("한글", None)
+    assert decode_body("image/png", b"\x00\x01") == ("AAE=", "base64")
+    assert decode_body("", b"") == (None, None)
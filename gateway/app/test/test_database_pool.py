@@ -0,0 +1,117 @@
+import os
+import asyncio
+from datetime import datetime, timedelta
+import asyncpg
+import pytest
+from app.domain.model.login_cache import LoginCache
+from app.domain.model.login_model import LoginEntity
+from app.domain.repository.database import DatabasePool, DatabaseSettings
+from app.domain.repository.login_repository import LoginRepository
+from app.test.fake_postgres import FakePostgres
+
+
+def login(id: str, provider: str = "google") -> LoginEntity:
+    now = datetime.now()
+    return LoginEntity(
+        id=id, provider=provider, access_token=f"access-{id}", refresh_token=f"refresh-{id}",
+        expires_at=now + timedelta(hours=1), created_at=now
+    )
+
+
+@pytest.mark.asyncio
+async def test_repository_round_trip_releases_each_connection_once():
+    postgres = FakePostgres()
+    repository = LoginRepository(DatabasePool(pool=postgres), LoginCache())
+    await repository.init_table()
+    await repository.save_login(login("a"))
+    repository.cache.clear()
+
+    found = await repository.find_login_by_id("a")
+    assert found.access_token == "access-a"
+    assert [e.id for e in await repository.find_login_by_provider("google")] == ["a"]
+    assert await repository.delete_login("a")
+    assert await repository.find_login_by_id("a") is None
+    # save_login 이 같은 연결을 두 번 반환하지 않아야 함
+    assert postgres.acquired == postgres.released == 6
+
+
+@pytest.mark.asyncio
+async def test_statements_are_prepared_once_per_connection():
+    postgres = FakePostgres(max_size=1)
+    repository = LoginRepository(DatabasePool(pool=postgres), LoginCache())
+    for i in range(20):
+        await repository.save_login(login(str(i)))
+    assert postgres.prepares == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_wait_and_query_latency_are_recorded():
+    db = DatabasePool(pool=FakePostgres(max_size=1))
+    repository = LoginRepository(db, LoginCache())
+
+    async def slow_hold():
+        async with db.acquire():
+            await asyncio.sleep(0.05)
+
+    holder = asyncio.create_task(slow_hold())
+    await asyncio.sleep(0)
+    await repository.save_login(login("a"))
+    await holder
+
+    stats = db.stats()
+    assert stats["acquires"] == 2
+    assert stats["max_wait_ms"] >= 40
+    assert stats["queries"]["login.save"]["count"] == 1
+    lines = "\n".join(db.render())
+    assert 'gateway_db_query_duration_seconds_count{statement="login.save"} 1' in lines
+    assert "gateway_db_pool_wait_seconds_count 2" in lines
+
+
+@pytest.mark.asyncio
+async def test_repository_without_pool_keeps_memory_only():
+    repository = LoginRepository(DatabasePool(), LoginCache())
+    await repository.save_login(login("a"))
+    assert (await repository.find_login_by_id("a")).id == "a"
+    with pytest.raises(RuntimeError):
+        await repository.init_table()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(os.getenv("GATEWAY_TEST_POSTGRES", "false") != "true",
+                    reason="GATEWAY_TEST_POSTGRES=true 와 DB_* 환경 변수로 로컬 PostgreSQL 지정 시 실행")
+async def test_real_postgres_round_trip():
+    db = DatabasePool(DatabaseSettings.from_env())
+    await db.startup()
+    try:
+        repository = LoginRepository(db, LoginCache())
+        await repository.init_table()
+        await repository.save_login(login("pg-test"))
+        repository.cache.clear()
+        assert (await repository.find_login_by_id("pg-test")).provider == "google"
+        assert await repository.delete_login("pg-test")
+        assert db.stats()["queries"]["login.find_by_id"]["count"] == 1
+    finally:
+        await db.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_reprepare_is_counted_as_error():
+    """무효가 된 statement 를 다시 prepare 한 시도가 실패해도 오류로 집계되어야 합니다."""
+    postgres = FakePostgres()
+    db = DatabasePool(pool=postgres)
+    LoginRepository(db, LoginCache())  # login statement 등록
+    name = next(iter(db.statements))
+    attempts = []
+
+    def broken(*args):
+        attempts.append(args)
+        if len(attempts) == 1:
+            raise asyncpg.InvalidCachedStatementError("cached statement plan is invalid")
+        raise asyncpg.UndefinedTableError("relation does not exist")
+
+    postgres.handlers[name] = broken
+    with pytest.raises(asyncpg.UndefinedTableError):
+        await db.fetch(name)
+    assert len(attempts) == 2
+    assert db.stats()["queries"][name]["errors"] == 1
+    assert postgres.acquired == postgres.released
@@ -0,0 +1,123 @@
+import time
+import asyncio
+import pytest
+import httpx
+from app.domain.model.deadline import AdaptiveTimeouts, adaptive_timeouts, DEADLINE_HEADER, with_deadline_header
+from app.domain.model.service_client_pool import client_pool
+from app.domain.model.service_proxy_factory import ServiceProxyFactory
+from app.domain.model.service_type import ServiceType
+
+forwarded = []
+
+
+def record_handler(request: httpx.Request) -> httpx.Response:
+    forwarded.append(request.headers.get(DEADLINE_HEADER))
+    return httpx.Response(200, json={"ok": True})
+
+
+def test_adaptive_timeout_follows_latency_percentile():
+    """표본이 쌓이면 p99 × 배수로 줄고, 상한을 넘지 않으며, 타임아웃이 나면 다시 늘어나야 합니다."""
+    timeouts = AdaptiveTimeouts(percentile=99, multiplier=3, min_timeout=0.1, min_samples=5)
+    assert timeouts.timeout_for(ServiceType.CRIME, "map", ceiling=10) == 10
+
+    for _ in range(10):
+        timeouts.record(ServiceType.CRIME, "map", 0.1)
+    assert timeouts.timeout_for(ServiceType.CRIME, "map", ceiling=10) == pytest.approx(0.3)
+    assert timeouts.timeout_for(ServiceType.CRIME, "map", ceiling=0.2) == 0.2
+    # 다른 경로는 표본이 없으므로 상한 그대로
+    assert timeouts.timeout_for(ServiceType.CRIME, "preprocess", ceiling=10) == 10
+
+    for _ in range(5):
+        timeouts.record(ServiceType.CRIME, "map", 5.0, timed_out=True)
+    assert timeouts.timeout_for(ServiceType.CRIME, "map", ceiling=10) == 10
+    assert timeouts.stats()["timeouts"] == 5
+
+
+def test_route_keys_are_bounded():
+    """클라이언트가 정하는 경로로 상한/표본 기록이 끝없이 늘지 않아야 합니다."""
+    timeouts = AdaptiveTimeouts(min_samples=1, max_routes=2)
+    for i in range(10):
+        timeouts.timeout_for(ServiceType.TF, f"path-{i}", ceiling=5)
+        timeouts.record(ServiceType.TF, f"path-{i}", 0.1)
+    assert len(timeouts.stats()["routes"]) == 2
+    assert timeouts.timeout_for(ServiceType.TF, "path-9", ceiling=5) == 5
+
+
+def test_deadline_header_keeps_repeated_headers():
+    headers = [(b"cookie", b"a=1"), (b"cookie", b"b=2"), (b"x-deadline-ms", b"99999")]
+    result = with_deadline_header(headers, 1.5)
+    assert [value for key, value in result if key == b"cookie"] == [b"a=1", b"b=2"]
+    assert (DEADLINE_HEADER, "1500") in result and len(result) == 3
+
+
+@pytest.mark.asyncio
+async def test_remaining_budget_is_forwarded(mock_upstream, async_client):
+    """업스트림 요청에 남은 시간이 x-deadline-ms 로 실리고, 클라이언트 마감이 더 짧으면 그것을 따라야 합니다."""
+    mock_upstream(record_handler)
+    forwarded.clear()
+
+    response = await async_client.put("/ai/v1/tf/mosaic", content=b"{}")
+    assert response.status_code == 200
+    ceiling_ms = client_pool.timeout_ceiling(ServiceType.TF) * 1000
+    assert ceiling_ms - 1000 < int(forwarded[-1]) <= ceiling_ms
+
+    response = await async_client.put("/ai/v1/tf/mosaic", content=b"{}", headers={DEADLINE_HEADER: "800"})
+    assert response.status_code == 200
+    assert 500 < int(forwarded[-1]) <= 800
+
+
+@pytest.mark.asyncio
+async def test_budget_shrinks_with_observed_latency(mock_upstream, async_client):
+    """빠른 경로는 관측 지연에 맞춰 마감이 최소 타임아웃까지 줄어야 합니다."""
+    mock_upstream(record_handler)
+    forwarded.clear()
+    for _ in range(adaptive_timeouts.min_samples):
+        adaptive_timeouts.record(ServiceType.TF, "mosaic", 0.01)
+
+    response = await async_client.put("/ai/v1/tf/mosaic", content=b"{}")
+    assert response.status_code == 200
+    assert int(forwarded[-1]) <= adaptive_timeouts.min_timeout * 1000
+    assert adaptive_timeouts.stats()["routes"]["tf/mosaic"]["samples"] == adaptive_timeouts.min_samples + 1
+
+
+@pytest.mark.asyncio
+async def test_streaming_and_buffered_latency_use_separate_windows(mock_upstream):
+    """헤더까지의 시간(스트리밍)과 본문 끝까지의 시간(버퍼링)은 같은 경로의 표본으로 섞이지 않아야 합니다."""
+    mock_upstream(record_handler)
+    factory = ServiceProxyFactory.for_service(ServiceType.CRIME)
+    await factory.fetch("map")
+    response = await factory.stream("GET", "map")
+    async for _ in response.body_iterator:
+        pass
+    await response.background()
+
+    routes = adaptive_timeouts.stats()["routes"]
+    assert routes["crime/map"]["samples"] == 1
+    assert routes["crime/map:full"]["samples"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_is_not_sent_upstream(mock_upstream, async_client):
+    """이미 마감이 지난 요청은 업스트림을 부르지 않고 504 를 돌려줘야 합니다."""
+    mock_upstream(record_handler)
+    forwarded.clear()
+
+    response = await async_client.put("/ai/v1/tf/mosaic", content=b"{}", headers={DEADLINE_HEADER: "0"})
+    assert response.status_code == 504
+    assert forwarded == []
+    assert adaptive_timeouts.expired == 1
+
+
+@pytest.mark.asyncio
+async def test_hung_upstream_is_cut_at_deadline(mock_upstream, async_client):
+    """응답하지 않는 업스트림은 마감에서 끊고 504 를 돌려주며, 그 시간을 표본으로 남겨야 합니다."""
+    async def hung_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(2)
+        return httpx.Response(200, json={"ok": True})
+
+    mock_upstream(hung_handler)
+    started = time.perf_counter()
+    response = await async_client.put("/ai/v1/crime/map", content=b"{}", headers={DEADLINE_HEADER: "200"})
+    assert response.status_code == 504
+    assert time.perf_counter() - started < 1.5
+    assert adaptive_timeouts.timeouts == 1
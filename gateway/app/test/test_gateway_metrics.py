@@ -0,0 +1,50 @@
+import pytest
+import httpx
+from app.domain.model.gateway_metrics import GatewayMetrics, Histogram, gateway_metrics, service_label
+
+
+def predict_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"survived": [0, 1, 1]})
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "지연", ("service",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(("titanic",), value)
+    lines = histogram.render()
+    assert 'latency_seconds_bucket{service="titanic",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{service="titanic",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{service="titanic",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{service="titanic"} 4' in lines
+
+
+def test_service_label():
+    assert service_label("/ai/v1/crime/view-map") == "crime"
+    assert service_label("/ai/v1/admin/pool") == "gateway"
+    assert service_label("/metrics") == "gateway"
+
+
+def test_metrics_record_overhead():
+    metrics = GatewayMetrics(buckets=(1.0,))
+    metrics.begin_request("nlp")
+    metrics.end_request("nlp", "GET", 200, 0.2, 1024)
+    text = metrics.render()
+    assert 'gateway_requests_total{service="nlp",method="GET",status="200"} 1' in text
+    assert 'gateway_response_bytes_total{service="nlp",method="GET"} 1024' in text
+    assert 'gateway_in_flight_requests{service="nlp"} 0' in text
+    assert "gateway_metrics_observations_total 1" in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_counts_proxied_requests(mock_upstream, async_client):
+    """프록시 요청 후 /metrics 에 게이트웨이/업스트림 지표가 나타나야 합니다."""
+    mock_upstream(predict_handler)
+    before = gateway_metrics.upstream_requests.get(("titanic", "PUT", "200"))
+    response = await async_client.put("/ai/v1/titanic/predict", content=b"{}")
+    assert response.status_code == 200
+
+    metrics = await async_client.get("/metrics")
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert gateway_metrics.upstream_requests.get(("titanic", "PUT", "200")) == before + 1
+    assert 'gateway_request_duration_seconds_bucket{service="titanic",method="PUT",le="+Inf"}' in metrics.text
+    assert "gateway_pool_utilization_ratio" in metrics.text
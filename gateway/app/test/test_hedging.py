@@ -0,0 +1,144 @@
+import asyncio
+import pytest
+import httpx
+from app.domain.model.service_type import ServiceType
+from app.domain.model.hedging import Hedger, RetryBudget
+
+
+def make_hedger(**overrides) -> Hedger:
+    options = dict(
+        routes={("titanic", "predict")},
+        percentile=50,
+        min_delay=0.01,
+        min_samples=3,
+        retry_attempts={service: 2 for service in ServiceType},
+        budget=RetryBudget(ratio=0.1, min_per_second=0, max_tokens=10),
+    )
+    options.update(overrides)
+    hedger = Hedger(**options)
+    hedger.budget.balance = 10
+    return hedger
+
+
+async def warm_up(hedger: Hedger, seconds: float = 0.01):
+    async def fast():
+        await asyncio.sleep(seconds)
+        return "fast"
+    for _ in range(3):
+        await hedger.run(ServiceType.TITANIC, "GET", "predict", fast)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_first_answer_wins():
+    """응답이 백분위 지연보다 늦으면 hedge 요청의 응답을 사용해야 합니다."""
+    hedger = make_hedger()
+    await warm_up(hedger)
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        await asyncio.sleep(1.0 if len(calls) == 1 else 0.01)
+        return f"answer-{len(calls)}"
+
+    result = await asyncio.wait_for(hedger.run(ServiceType.TITANIC, "GET", "predict", attempt), 0.5)
+    assert result == "answer-2"
+    assert hedger.hedges == 1
+    assert hedger.hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_methods_are_never_hedged_or_retried():
+    """POST 는 hedge 나 재시도 없이 한 번만 호출되어야 합니다."""
+    hedger = make_hedger()
+    await warm_up(hedger)
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        raise httpx.ConnectError("connection refused")
+
+    with pytest.raises(httpx.ConnectError):
+        await hedger.run(ServiceType.TITANIC, "POST", "predict", attempt)
+    assert len(calls) == 1
+    assert hedger.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_connect_errors_are_retried_within_budget():
+    """연결 오류는 재시도되지만 예산이 바닥나면 멈춰야 합니다."""
+    hedger = make_hedger(routes=set())
+    hedger.budget.balance = 1
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        raise httpx.ConnectError("connection refused")
+
+    with pytest.raises(httpx.ConnectError):
+        await hedger.run(ServiceType.CRIME, "GET", "view-map", attempt)
+    assert len(calls) == 2
+    assert hedger.retries == 1
+    assert hedger.budget.exhausted == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_recovers_from_transient_error():
+    """첫 연결 실패 후 재시도가 성공하면 그 응답을 반환해야 합니다."""
+    hedger = make_hedger(routes=set())
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused")
+        return "ok"
+
+    assert await hedger.run(ServiceType.CRIME, "GET", "view-map", attempt) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_losing_attempt_latency_is_recorded():
+    """hedge 에 진 느린 시도의 지연도 표본에 남아 hedge 지연이 낮게 치우치지 않아야 합니다."""
+    hedger = make_hedger()
+    await warm_up(hedger)
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        await asyncio.sleep(1.0 if len(calls) == 1 else 0.05)
+        return "ok"
+
+    await hedger.run(ServiceType.TITANIC, "GET", "predict", attempt)
+    samples = sorted(hedger._latency[("titanic", "predict")]._samples)
+    assert len(samples) == 5
+    # 진 primary 는 hedge 지연 + hedge 응답 시간 이상, 이긴 hedge 는 자기 시작 시점부터 잰 시간
+    assert samples[-1] >= 0.05 + hedger.min_delay
+    assert 0.05 <= samples[-2] < samples[-1]
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_instead_of_cancelled_attempt():
+    """취소된 시도가 섞여 있어도 실제로 실패한 시도의 예외를 전달해야 합니다."""
+    hedger = make_hedger()
+    await warm_up(hedger)
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(0.1)
+            raise asyncio.CancelledError()
+        raise httpx.ReadError("connection reset")
+
+    with pytest.raises(httpx.ReadError):
+        await hedger.run(ServiceType.TITANIC, "GET", "predict", attempt)
+
+
+def test_budget_limits_retries_to_ratio_of_requests():
+    """예산은 요청 수 대비 ratio 만큼만 재시도를 허용해야 합니다."""
+    budget = RetryBudget(ratio=0.1, min_per_second=0, max_tokens=100)
+    budget.balance = 0
+    for _ in range(50):
+        budget.deposit()
+    allowed = sum(1 for _ in range(50) if budget.withdraw())
+    assert allowed == 5
@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from collections import Counter
+from app.benchmark.stub_backend import StubServer, create_stub_app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.domain.model.service_client_pool import client_pool
+from app.domain.model.service_proxy_factory import ServiceProxyFactory
+from app.domain.model.load_balancer import POWER_OF_TWO, UpstreamBalancer
+
+
+@pytest.fixture
+def balancer(monkeypatch):
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.TF, "http://tf-1:9004, http://tf-2:9004,http://tf-3:9004")
+    return UpstreamBalancer(interval=1, unhealthy_threshold=1, healthy_threshold=1)
+
+
+def test_replicas_are_parsed_from_service_urls(balancer):
+    """쉼표로 구분된 URL 은 각각 복제본이 되어야 합니다."""
+    urls = [replica.url for replica in balancer.replicas(ServiceType.TF)]
+    assert urls == ["http://tf-1:9004", "http://tf-2:9004", "http://tf-3:9004"]
+
+
+def test_least_outstanding_prefers_idle_replica(balancer):
+    """진행 중 요청이 가장 적은 복제본을 선택해야 합니다."""
+    busy = [balancer.acquire(ServiceType.TF) for _ in range(2)]
+    assert balancer.pick(ServiceType.TF) not in busy
+    for replica in busy:
+        balancer.release(replica)
+
+
+def test_power_of_two_choices_spreads_load(monkeypatch):
+    """p2c 정책도 요청을 모든 복제본에 분산해야 합니다."""
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.TF, "http://tf-1,http://tf-2,http://tf-3")
+    balancer = UpstreamBalancer(policy=POWER_OF_TWO, interval=1)
+    counts = Counter()
+    held = []
+    for _ in range(30):
+        replica = balancer.acquire(ServiceType.TF)
+        counts[replica.url] += 1
+        held.append(replica)
+    assert set(counts) == {"http://tf-1", "http://tf-2", "http://tf-3"}
+    assert max(counts.values()) - min(counts.values()) <= 2
+
+
+@pytest.mark.asyncio
+async def test_health_check_ejects_and_readmits_stub_server(monkeypatch):
+    """죽은 복제본은 헬스 체크로 제외되고, 살아나면 다시 투입되어야 합니다."""
+    monkeypatch.setattr(client_pool, "_clients", {})
+    monkeypatch.setattr(client_pool, "_transport", None)
+    monkeypatch.setattr(ServiceProxyFactory, "_instances", {})
+    balancer = UpstreamBalancer(interval=1, unhealthy_threshold=1, healthy_threshold=1)
+    monkeypatch.setattr("app.domain.model.service_proxy_factory.upstream_balancer", balancer)
+
+    with StubServer(create_stub_app(name="alive")) as alive:
+        dead = StubServer(create_stub_app(name="dead"))
+        monkeypatch.setitem(SERVICE_URLS, ServiceType.TITANIC, f"{alive.url},{dead.url}")
+
+        await balancer.check_all()
+        healthy = {r.url: r.healthy for r in balancer.replicas(ServiceType.TITANIC)}
+        assert healthy == {alive.url: True, dead.url: False}
+
+        factory = ServiceProxyFactory.for_service(ServiceType.TITANIC)
+        responses = await asyncio.gather(*(factory.request("GET", "predict") for _ in range(10)))
+        assert {r.headers["x-stub-name"] for r in responses} == {"alive"}
+
+        with dead:
+            await balancer.check_all()
+            assert all(r.healthy for r in balancer.replicas(ServiceType.TITANIC))
+    await client_pool.shutdown()
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+import pytest
+from app.domain.model.login_cache import LoginCache, RedisInvalidationBus
+from app.domain.model.login_model import LoginEntity
+from app.domain.repository.database import DatabasePool
+from app.domain.repository.login_repository import LoginRepository
+from app.test.fake_postgres import FakePostgres
+
+
+def login(id: str, seconds: float = 3600, provider: str = "google") -> LoginEntity:
+    now = datetime.now()
+    return LoginEntity(
+        id=id, provider=provider, access_token=f"access-{id}", refresh_token=f"refresh-{id}",
+        expires_at=now + timedelta(seconds=seconds), created_at=now
+    )
+
+
+class FakePubSubRedis:
+    """publish / pubsub().subscribe / listen 만 지원하는 Redis 대역 (클라이언트 여러 개가 공유)"""
+
+    def __init__(self):
+        self.subscribers = []
+        self.clients = []
+
+    def client(self):
+        client = FakePubSubClient(self)
+        self.clients.append(client)
+        return client
+
+    def disconnect(self):
+        """모든 구독 연결을 끊습니다 (listen 이 ConnectionError 를 냄)."""
+        for _, queue in self.subscribers:
+            queue.put_nowait(ConnectionError("connection lost"))
+        self.subscribers = []
+
+
+class FakePubSubClient:
+    def __init__(self, server: FakePubSubRedis):
+        self.server = server
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+    async def publish(self, channel, message):
+        for subscribed, queue in self.server.subscribers:
+            if subscribed == channel:
+                queue.put_nowait({"type": "message", "data": message.encode()})
+
+    def pubsub(self):
+        return FakePubSub(self.server)
+
+
+class FakePubSub:
+    def __init__(self, server: FakePubSubRedis):
+        self.server = server
+        self.queue = asyncio.Queue()
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.server.subscribers.append((channel, self.queue))
+        self.queue.put_nowait({"type": "subscribe", "data": 1})
+
+    async def unsubscribe(self):
+        self.server.subscribers = [(c, q) for c, q in self.server.subscribers if q is not self.queue]
+
+    async def aclose(self):
+        self.closed = True
+
+    async def listen(self):
+        while True:
+            message = await self.queue.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+
+def test_cache_is_bounded_lru_and_expires_with_token():
+    cache = LoginCache(max_entries=2, ttl=60)
+    cache.put(login("a"))
+    cache.put(login("b"))
+    assert cache.get("a")[0]
+    cache.put(login("c"))
+    assert not cache.get("b")[0]  # 가장 오래 안 쓴 항목 제거
+    assert cache.stats()["evictions"] == 1
+
+    cache.put(login("soon", seconds=1))
+    assert cache.get("soon", now=time.time() + 2) == (False, None)
+    cache.put(login("late"))
+    assert not cache.get("late", now=time.time() + 61)[0]  # ttl 상한
+
+
+def test_cached_entity_is_a_copy():
+    cache = LoginCache()
+    cache.put(login("a"))
+    _, entity = cache.get("a")
+    entity.access_token = "changed"
+    assert cache.get("a")[1].access_token == "access-a"
+
+
+@pytest.mark.asyncio
+async def test_read_through_and_negative_caching():
+    postgres = FakePostgres()
+    cache = LoginCache()
+    repository = LoginRepository(DatabasePool(pool=postgres), cache)
+    await repository.save_login(login("a"))
+    cache.clear()
+
+    for _ in range(5):
+        assert (await repository.find_login_by_id("a")).id == "a"
+        assert await repository.find_login_by_id("missing") is None
+    assert postgres.acquired == 1 + 2  # 저장 1 + 각 ID 첫 조회 1
+    stats = repository.cache_stats()
+    assert stats["hits"] == 4 and stats["negative_hits"] == 4
+    assert stats["hit_ratio"] == 0.8
+
+    # 저장하면 없는 ID 기록을 덮어씀
+    await repository.save_login(login("missing"))
+    assert (await repository.find_login_by_id("missing")).id == "missing"
+
+
+@pytest.mark.asyncio
+async def test_delete_and_refresh_invalidate_other_workers():
+    postgres = FakePostgres()
+    redis = FakePubSubRedis()
+    workers = [
+        LoginRepository(DatabasePool(pool=postgres), LoginCache(), RedisInvalidationBus(client=redis.client()))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        await worker.start()
+    first, second = workers
+    try:
+        await first.save_login(login("a"))
+        assert (await second.find_login_by_id("a")).access_token == "access-a"
+
+        refreshed = login("a")
+        refreshed.access_token = "refreshed"
+        await first.save_login(refreshed)
+        await asyncio.sleep(0.01)
+        assert (await second.find_login_by_id("a")).access_token == "refreshed"
+
+        await first.delete_login("a")
+        await asyncio.sleep(0.01)
+        assert await second.find_login_by_id("a") is None
+        assert second.cache_stats()["invalidation"]["received"] == 3  # 저장 2 + 삭제 1
+    finally:
+        for worker in workers:
+            await worker.close()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_listener_resubscribes_after_redis_error():
+    """구독이 끊기면 backoff 후 다시 구독하고, 놓친 메시지 대신 캐시를 비워야 합니다."""
+    redis = FakePubSubRedis()
+    sender = RedisInvalidationBus(client=redis.client())
+    receiver = RedisInvalidationBus(client=redis.client(), resubscribe_delay=0.01)
+    cache = LoginCache()
+    cache.put(login("a"))
+    cache.put(login("b"))
+    await receiver.start(cache)
+    try:
+        redis.disconnect()
+        await asyncio.sleep(0.05)
+        assert receiver.stats()["errors"] == 1 and receiver.stats()["resubscribes"] == 1
+        assert cache.get("b") == (False, None)
+
+        cache.put(login("a"))
+        await sender.publish("a")
+        await asyncio.sleep(0.01)
+        assert cache.get("a") == (False, None)
+        assert receiver.stats()["received"] == 1
+    finally:
+        await receiver.close()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_bus_close_releases_pubsub_and_client():
+    redis = FakePubSubRedis()
+    client = redis.client()
+    bus = RedisInvalidationBus(client=client)
+    await bus.start(LoginCache())
+    pubsub = bus._pubsub
+    await bus.close()
+    assert pubsub.closed and client.closed
+    assert redis.subscribers == []
@@ -0,0 +1,137 @@
+import json
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from app.domain.controller.login_controller import login_service
+from app.domain.model.login_cache import LoginCache
+from app.domain.model.login_model import LoginEntity
+from app.domain.repository.database import DatabasePool
+from app.domain.repository.login_repository import LoginImportError, LoginRepository
+from app.domain.service.login_service import parse_ndjson_logins
+from app.test.fake_postgres import FakePostgres
+
+
+def record(i: int, token: str = "a") -> dict:
+    return {
+        "id": f"user-{i}", "provider": "google", "access_token": token, "refresh_token": None,
+        "expires_at": (datetime(2030, 1, 1) + timedelta(seconds=i)).isoformat(),
+        "created_at": datetime(2024, 1, 1).isoformat(),
+    }
+
+
+def repository() -> LoginRepository:
+    return LoginRepository(DatabasePool(pool=FakePostgres()), LoginCache())
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_copies_in_bounded_chunks():
+    repo = repository()
+    await repo.save_login(LoginEntity(**record(0, token="old")))
+    logins = [LoginEntity(**record(i, token="new")) for i in range(12)]
+    # 같은 청크 안의 중복 ID 는 뒤의 항목 사용
+    logins.insert(0, LoginEntity(**record(1, token="stale")))
+
+    result = await repo.bulk_upsert(logins, chunk_size=5)
+    postgres = repo.db._pool
+    assert result["rows"] == 12 and result["chunks"] == 3
+    assert result["rows_per_second"] > 0
+    assert postgres.copies == 3
+    assert {row["access_token"] for row in postgres.logins.values()} == {"new"}
+    assert (await repo.find_login_by_id("user-0")).access_token == "new"
+    assert repo.db.stats()["queries"]["login.import_merge"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_reports_progress_on_failure():
+    async def source():
+        for i in range(7):
+            yield LoginEntity(**record(i))
+        raise ValueError("broken input")
+
+    repo = repository()
+    with pytest.raises(LoginImportError) as error:
+        await repo.bulk_upsert(source(), chunk_size=5)
+    assert error.value.progress["rows"] == 5
+    assert len(repo.db._pool.logins) == 5
+
+
+@pytest.mark.asyncio
+async def test_ndjson_parser_handles_lines_split_across_chunks():
+    text = "\n".join(json.dumps(record(i)) for i in range(3)) + "\n\n"
+
+    async def chunks():
+        for start in range(0, len(text), 7):
+            yield text[start:start + 7].encode()
+
+    assert [login.id async for login in parse_ndjson_logins(chunks())] == ["user-0", "user-1", "user-2"]
+
+
+@pytest.mark.asyncio
+async def test_import_endpoint_accepts_json_and_ndjson(async_client, monkeypatch):
+    repo = repository()
+    monkeypatch.setattr(login_service, "repository", repo)
+    monkeypatch.setenv("GATEWAY_ADMIN_TOKEN", "admin-secret")
+    async_client.headers["x-admin-token"] = "admin-secret"
+
+    response = await async_client.post("/ai/v1/admin/logins/import", json=[record(i) for i in range(3)])
+    assert response.status_code == 200 and response.json()["rows"] == 3
+
+    body = "\n".join(json.dumps(record(i)) for i in range(3, 10))
+    response = await async_client.post(
+        "/ai/v1/admin/logins/import?chunk_size=4", content=body,
+        headers={"content-type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.json()["rows"] == 7 and response.json()["chunks"] == 2
+    assert len(repo.db._pool.logins) == 10
+
+    response = await async_client.post(
+        "/ai/v1/admin/logins/import?chunk_size=2", content=json.dumps(record(20)) + "\n" + json.dumps(record(21)) + "\n{oops",
+        headers={"content-type": "application/x-ndjson"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"]["rows"] == 2
+    assert "3번째 줄" in response.json()["detail"]["error"]
+
+
+@pytest.mark.asyncio
+async def test_import_endpoint_requires_admin_token(async_client, monkeypatch):
+    """관리자 토큰이 설정되지 않았거나 틀리면 아무것도 쓰지 않아야 합니다."""
+    repo = repository()
+    monkeypatch.setattr(login_service, "repository", repo)
+    monkeypatch.delenv("GATEWAY_ADMIN_TOKEN", raising=False)
+    response = await async_client.post("/ai/v1/admin/logins/import", json=[record(1)])
+    assert response.status_code == 403
+
+    monkeypatch.setenv("GATEWAY_ADMIN_TOKEN", "admin-secret")
+    response = await async_client.post(
+        "/ai/v1/admin/logins/import", json=[record(1)], headers={"x-admin-token": "wrong"}
+    )
+    assert response.status_code == 401
+    assert repo.db._pool.logins == {}
+
+
+@pytest.mark.asyncio
+async def test_import_invalidates_other_workers_once_per_chunk():
+    from app.domain.model.login_cache import RedisInvalidationBus
+    from app.test.test_login_cache import FakePubSubRedis
+    postgres = FakePostgres()
+    redis = FakePubSubRedis()
+    workers = [
+        LoginRepository(DatabasePool(pool=postgres), LoginCache(), RedisInvalidationBus(client=redis.client()))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        await worker.start()
+    first, second = workers
+    try:
+        await first.save_login(LoginEntity(**record(1, token="old")))
+        assert (await second.find_login_by_id("user-1")).access_token == "old"
+
+        await first.bulk_upsert([LoginEntity(**record(i, token="new")) for i in range(6)], chunk_size=3)
+        await asyncio.sleep(0.01)
+        assert (await second.find_login_by_id("user-1")).access_token == "new"
+        assert first.cache_stats()["invalidation"]["published"] == 1 + 2  # 저장 1 + 청크 2
+    finally:
+        for worker in workers:
+            await worker.close()
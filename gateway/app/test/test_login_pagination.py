@@ -0,0 +1,125 @@
+import json
+from contextlib import aclosing
+from datetime import datetime, timedelta
+import pytest
+from app.domain.controller.login_controller import login_service
+from app.domain.model.login_cache import LoginCache
+from app.domain.model.login_model import LoginEntity
+from app.domain.repository.database import DatabasePool
+from app.domain.repository.login_repository import LoginRepository
+from app.test.fake_postgres import FakePostgres
+
+BASE = datetime(2024, 1, 1)
+
+
+async def seeded_repository(db: bool = True) -> LoginRepository:
+    repository = LoginRepository(DatabasePool(pool=FakePostgres()) if db else DatabasePool(), LoginCache())
+    for i in range(25):
+        # 같은 created_at 이 두 개씩 있어 id 로 순서가 정해져야 함
+        created_at = BASE + timedelta(seconds=i // 2)
+        await repository.save_login(LoginEntity(
+            id=f"g{i:02d}", provider="google", access_token="a", created_at=created_at,
+            expires_at=datetime.now() + timedelta(hours=1)
+        ))
+    for i in range(5):
+        await repository.save_login(LoginEntity(id=f"h{i}", provider="github", access_token="a", created_at=BASE))
+    return repository
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("db", [True, False])
+async def test_keyset_pages_cover_every_row_once(db):
+    repository = await seeded_repository(db)
+    seen, cursor, pages = [], None, 0
+    while True:
+        items, cursor = await repository.find_login_page("google", 10, cursor)
+        seen.extend(item.id for item in items)
+        pages += 1
+        if cursor is None:
+            break
+    assert pages == 3
+    assert seen == [f"g{i:02d}" for i in range(25)]
+
+
+@pytest.mark.asyncio
+async def test_pages_use_keyset_statements():
+    repository = await seeded_repository()
+    _, cursor = await repository.find_login_page("google", 10)
+    await repository.find_login_page("google", 10, cursor)
+    queries = repository.db.stats()["queries"]
+    assert queries["login.provider_first_page"]["count"] == 1
+    assert queries["login.provider_next_page"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_fetches_in_batches_and_releases_connection_early():
+    repository = await seeded_repository()
+    postgres = repository.db._pool
+    ids = [entity.id async for entity in repository.stream_login_by_provider("google", prefetch=10)]
+    assert ids == [f"g{i:02d}" for i in range(25)]
+    assert postgres.cursor_fetches == 3
+
+    async with aclosing(repository.stream_login_by_provider("google", prefetch=10)) as stream:
+        async for entity in stream:
+            break
+    assert postgres.acquired == postgres.released
+
+
+@pytest.mark.asyncio
+async def test_provider_listing_api(async_client, monkeypatch):
+    monkeypatch.setattr(login_service, "repository", await seeded_repository())
+    monkeypatch.setenv("GATEWAY_ADMIN_TOKEN", "admin-secret")
+    admin = {"x-admin-token": "admin-secret"}
+
+    response = await async_client.get("/login/", params={"provider": "google", "limit": 20}, headers=admin)
+    assert response.status_code == 200
+    page = response.json()
+    assert len(page["items"]) == 20 and page["next_cursor"]
+    # 목록 API 는 OAuth 토큰을 돌려주지 않음
+    assert "access_token" not in page["items"][0] and "refresh_token" not in page["items"][0]
+
+    response = await async_client.get("/login/", params={"provider": "google", "limit": 20, "cursor": page["next_cursor"]}, headers=admin)
+    assert [item["id"] for item in response.json()["items"]] == ["g20", "g21", "g22", "g23", "g24"]
+    assert response.json()["next_cursor"] is None
+
+    response = await async_client.get("/login/", params={"provider": "google", "cursor": "broken"}, headers=admin)
+    assert response.status_code == 400
+
+    response = await async_client.get("/login/export", params={"provider": "github"}, headers=admin)
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [f"h{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_login_api_requires_admin_token(async_client, monkeypatch):
+    """OAuth 토큰을 다루는 /login API 는 관리자 토큰 없이는 호출할 수 없어야 합니다."""
+    monkeypatch.setattr(login_service, "repository", await seeded_repository())
+    monkeypatch.delenv("GATEWAY_ADMIN_TOKEN", raising=False)
+    assert (await async_client.get("/login/export", params={"provider": "github"})).status_code == 403
+    assert (await async_client.get("/login/g00")).status_code == 403
+
+    monkeypatch.setenv("GATEWAY_ADMIN_TOKEN", "admin-secret")
+    for method, path in (("GET", "/login/g00"), ("GET", "/login/?provider=google"), ("DELETE", "/login/g00"),
+                         ("POST", "/login/g00/refresh"), ("GET", "/login/export?provider=github")):
+        response = await async_client.request(method, path, headers={"x-admin-token": "wrong"})
+        assert response.status_code == 401, path
+
+    response = await async_client.get("/login/g00", headers={"x-admin-token": "admin-secret"})
+    assert response.status_code == 200
+    assert response.json()["id"] == "g00" and "access_token" not in response.json()
+
+
+@pytest.mark.asyncio
+async def test_export_releases_connection_when_client_disconnects(monkeypatch):
+    """내보내기 도중 응답 스트림이 닫히면 커서의 연결도 바로 반환되어야 합니다."""
+    from app.domain.controller.login_controller import export_login_by_provider
+    repository = await seeded_repository()
+    monkeypatch.setattr(login_service, "repository", repository)
+    postgres = repository.db._pool
+
+    response = await export_login_by_provider("google")
+    body = response.body_iterator
+    assert json.loads(await body.__anext__())["id"] == "g00"
+    assert postgres.acquired == postgres.released + 1
+    await body.aclose()
+    assert postgres.acquired == postgres.released
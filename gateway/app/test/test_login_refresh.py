@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime, timedelta
+import httpx
+import pytest
+from fastapi import FastAPI, Form
+from fastapi.responses import JSONResponse
+from app.domain.model.login_cache import LoginCache
+from app.domain.model.login_model import LoginEntity
+from app.domain.repository.database import DatabasePool
+from app.domain.repository.login_repository import LoginRepository
+from app.domain.service.login_renewal import LoginRenewalScheduler
+from app.domain.service.login_service import LoginService
+from app.test.fake_postgres import FakePostgres
+
+
+class StubProvider:
+    """OAuth 토큰 엔드포인트 스텁 (호출 수와 최대 동시 호출 수 기록)"""
+
+    def __init__(self, latency: float = 0.02, reject: set = frozenset()):
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.app = FastAPI()
+
+        @self.app.post("/{path:path}")
+        async def token(refresh_token: str = Form(None), grant_type: str = Form(...)):
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            try:
+                await asyncio.sleep(latency)
+            finally:
+                self.active -= 1
+            if refresh_token in reject:
+                return JSONResponse({"error": "invalid_grant"}, status_code=400)
+            return {"access_token": f"new-{self.calls}", "expires_in": 3600, "refresh_token": refresh_token}
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app))
+
+
+def login(id: str, seconds: float) -> LoginEntity:
+    now = datetime.now()
+    return LoginEntity(
+        id=id, provider="google", access_token=f"old-{id}", refresh_token=f"refresh-{id}",
+        expires_at=now + timedelta(seconds=seconds), created_at=now
+    )
+
+
+async def make_service(provider: StubProvider) -> LoginService:
+    repository = LoginRepository(DatabasePool(pool=FakePostgres(max_size=4)), LoginCache())
+    return LoginService(repository=repository, http_client=provider.client())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_provider_call():
+    provider = StubProvider()
+    service = await make_service(provider)
+    await service.repository.save_login(login("a", 30))
+
+    results = await asyncio.gather(*(service.refresh_login_token("a") for _ in range(10)))
+    assert provider.calls == 1
+    assert {result.access_token for result in results} == {"new-1"}
+    assert service.stats()["refresh"]["coalesced"] == 9
+    assert (await service.get_login_by_id("a")).access_token == "new-1"
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_renews_expiring_logins_in_bounded_batches():
+    provider = StubProvider()
+    service = await make_service(provider)
+    for i in range(25):
+        await service.repository.save_login(login(f"soon-{i}", 60))
+    for i in range(5):
+        await service.repository.save_login(login(f"later-{i}", 3600))
+
+    scheduler = LoginRenewalScheduler(service, margin=300, interval=30, batch_size=10, concurrency=3)
+    assert await scheduler.run_once() == 25
+    assert provider.calls == 25
+    assert provider.max_active <= 3
+    assert (await service.get_login_by_id("soon-0")).access_token.startswith("new-")
+    assert (await service.get_login_by_id("later-0")).access_token == "old-later-0"
+
+    # 갱신된 토큰은 다시 대상이 되지 않음
+    assert await scheduler.run_once() == 0
+    assert provider.calls == 25
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_renewals_are_not_retried_until_claim_expires():
+    provider = StubProvider(reject={"refresh-bad"})
+    service = await make_service(provider)
+    await service.repository.save_login(login("bad", 60))
+    await service.repository.save_login(login("good", 60))
+
+    scheduler = LoginRenewalScheduler(service, margin=300, interval=30, batch_size=10, concurrency=2)
+    assert await scheduler.run_once() == 1
+    assert scheduler.stats()["failed"] == 1
+    assert await scheduler.run_once() == 0
+    assert provider.calls == 2
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_long_expired_logins_are_not_renewed():
+    """오래전에 만료된 Login 은 갱신 대상에서 빠져 제공자를 계속 호출하지 않아야 합니다."""
+    provider = StubProvider()
+    service = await make_service(provider)
+    await service.repository.save_login(login("abandoned", -7200))
+    await service.repository.save_login(login("recent", -60))
+
+    scheduler = LoginRenewalScheduler(service, margin=300, interval=30, batch_size=10, max_stale=3600)
+    assert await scheduler.run_once() == 1
+    assert provider.calls == 1
+    assert (await service.get_login_by_id("abandoned")).access_token == "old-abandoned"
+    await service.close()
@@ -0,0 +1,44 @@
+import pytest
+import httpx
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64
+
+
+def upstream_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/wordcloud":
+        return httpx.Response(200, content=PNG_BYTES, headers={"content-type": "image/png"})
+    if request.url.path == "/view-map":
+        return httpx.Response(404, text="지도 파일이 없습니다.", headers={"content-type": "text/html; charset=utf-8"})
+    if request.method == "PUT":
+        return httpx.Response(200, content=request.content, headers={"content-type": "application/json"})
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+@pytest.mark.asyncio
+async def test_binary_body_passes_through(mock_upstream, async_client):
+    """PNG 같은 바이너리 응답도 파싱 없이 그대로 전달되어야 합니다."""
+    mock_upstream(upstream_handler)
+    response = await async_client.get("/ai/v1/nlp/wordcloud")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content == PNG_BYTES
+
+
+@pytest.mark.asyncio
+async def test_status_and_content_type_are_kept(mock_upstream, async_client):
+    """업스트림 상태 코드와 content-type 이 유지되어야 합니다."""
+    mock_upstream(upstream_handler)
+    response = await async_client.get("/ai/v1/crime/view-map")
+    assert response.status_code == 404
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text == "지도 파일이 없습니다."
+
+
+@pytest.mark.asyncio
+async def test_request_body_is_forwarded(mock_upstream, async_client):
+    """PUT 본문은 재인코딩 없이 업스트림으로 전달되어야 합니다."""
+    mock_upstream(upstream_handler)
+    body = b'{"age": 27,  "fare": 130.0}'
+    response = await async_client.put("/ai/v1/titanic/predict", content=body)
+    assert response.status_code == 200
+    assert response.content == body
@@ -0,0 +1,150 @@
+import time
+import hashlib
+import pytest
+import httpx
+from jose import jwt
+from fastapi import HTTPException
+from app.domain.model.rate_limiter import (
+    MemoryBucketStore,
+    RateLimiter,
+    RateLimitRule,
+    RedisBucketStore,
+    TOKEN_BUCKET_SCRIPT,
+    rate_limiter,
+    take_tokens,
+)
+from app.domain.model.service_type import ServiceType
+from app.domain.model.token_cache import peek_claims
+
+VERIFIED = {"verified-token": "user-1"}
+
+
+class LocalRedis:
+    """EVALSHA 만 지원하는 Redis 대역 (스크립트 대신 같은 규칙의 take_tokens 실행)"""
+
+    def __init__(self):
+        self.scripts = set()
+        self.buckets = {}
+        self.calls = []
+
+    async def script_load(self, script: str) -> str:
+        sha = hashlib.sha1(script.encode()).hexdigest()
+        self.scripts.add(sha)
+        return sha
+
+    async def evalsha(self, sha, numkeys, key, rate, burst, cost):
+        if sha not in self.scripts:
+            raise Exception("NOSCRIPT No matching script. Please use EVAL.")
+        self.calls.append(key)
+        now = time.monotonic()
+        tokens, updated_at = self.buckets.get(key, (float(burst), now))
+        allowed, retry_after, tokens = take_tokens(tokens, updated_at, now, float(rate), float(burst), float(cost))
+        self.buckets[key] = (tokens, now)
+        return [int(allowed), str(retry_after), str(tokens)]
+
+
+class DownRedis:
+    async def script_load(self, script):
+        raise ConnectionError("connection refused")
+
+
+def make_limiter(store, rate=1.0, burst=2.0) -> RateLimiter:
+    rule = RateLimitRule(rate=rate, burst=burst)
+    return RateLimiter(enabled=True, rules={s: rule for s in ServiceType}, store=store, subject_lookup=VERIFIED.get)
+
+
+def test_take_tokens_refills_over_time():
+    allowed, retry_after, tokens = take_tokens(0.0, 0.0, 0.5, rate=1.0, burst=2.0)
+    assert not allowed and retry_after == pytest.approx(0.5)
+    allowed, _, tokens = take_tokens(0.0, 0.0, 10.0, rate=1.0, burst=2.0)
+    assert allowed and tokens == 1.0
+
+
+@pytest.mark.asyncio
+async def test_burst_then_429_with_retry_after_per_service():
+    """burst 를 다 쓰면 429 + Retry-After, 다른 서비스/클라이언트는 영향이 없어야 합니다."""
+    limiter = make_limiter(MemoryBucketStore())
+    await limiter.check(ServiceType.TITANIC, "ip:1.1.1.1")
+    await limiter.check(ServiceType.TITANIC, "ip:1.1.1.1")
+    with pytest.raises(HTTPException) as exc:
+        await limiter.check(ServiceType.TITANIC, "ip:1.1.1.1")
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "1"
+    await limiter.check(ServiceType.NLP, "ip:1.1.1.1")
+    await limiter.check(ServiceType.TITANIC, "ip:2.2.2.2")
+    assert limiter.stats()["services"]["titanic"]["limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_store_bounds_keys():
+    store = MemoryBucketStore(max_keys=2)
+    for client in ("a", "b", "c"):
+        await store.take(client, 1.0, 1.0)
+    assert store.stats()["keys"] == 2
+
+
+def test_client_key_prefers_verified_token_subject():
+    """검증 캐시에 있는 토큰만 subject 로 쓰고, 처음 보는 토큰은 IP 로 구분해야 합니다."""
+    limiter = make_limiter(MemoryBucketStore())
+
+    def request(headers):
+        from starlette.requests import Request
+        raw = [(k.encode(), v.encode()) for k, v in headers.items()]
+        return Request({"type": "http", "headers": raw, "client": ("10.0.0.1", 1234)})
+
+    assert limiter.client_key(request({"authorization": "Bearer verified-token"})) == "sub:user-1"
+    assert limiter.client_key(request({"authorization": "Bearer unknown-token"})) == "ip:10.0.0.1"
+    assert limiter.client_key(request({"x-forwarded-for": "3.3.3.3"})) == "ip:10.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_token_service_cached_subject_needs_prior_verification():
+    from app.domain.schema.token_schema import TokenSchema
+    from app.domain.service.token_service import TokenService
+    service = TokenService(cache_size=100)
+    token = (await service.create_token("user-1")).access_token
+    forged = jwt.encode(peek_claims(token), "attacker-key", algorithm="HS256")
+    assert service.cached_subject(token) is None
+    assert (await service.verify_token(TokenSchema(token=token))).is_valid
+    assert service.cached_subject(token) == "user-1"
+    assert service.cached_subject(forged) is None
+    assert service.cache_stats()["hits"] == 0
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("GATEWAY_RATE_LIMIT", raising=False)
+    assert not RateLimiter(store=MemoryBucketStore()).enabled
+
+
+@pytest.mark.asyncio
+async def test_redis_store_against_local_stand_in():
+    """Redis 저장소는 스크립트를 등록해 실행하고, NOSCRIPT 면 다시 등록해야 합니다."""
+    redis = LocalRedis()
+    limiter = make_limiter(RedisBucketStore(client=redis))
+    await limiter.check(ServiceType.TF, "ip:1.1.1.1")
+    redis.scripts.clear()
+    await limiter.check(ServiceType.TF, "ip:1.1.1.1")
+    with pytest.raises(HTTPException):
+        await limiter.check(ServiceType.TF, "ip:1.1.1.1")
+    assert redis.calls[0] == "gateway:ratelimit:tf:ip:1.1.1.1"
+    assert "redis.call('TIME')" in TOKEN_BUCKET_SCRIPT
+
+
+@pytest.mark.asyncio
+async def test_redis_store_fails_open():
+    store = RedisBucketStore(client=DownRedis())
+    limiter = make_limiter(store, burst=1.0)
+    for _ in range(3):
+        await limiter.check(ServiceType.CRIME, "ip:1.1.1.1")
+    assert store.errors == 3
+
+
+@pytest.mark.asyncio
+async def test_proxy_returns_429(monkeypatch, mock_upstream, async_client):
+    mock_upstream(lambda request: httpx.Response(200, json={"ok": True}))
+    monkeypatch.setattr(rate_limiter, "enabled", True)
+    monkeypatch.setitem(rate_limiter._rules, ServiceType.TITANIC, RateLimitRule(rate=0.5, burst=1))
+    assert (await async_client.put("/ai/v1/titanic/csv")).status_code == 200
+    response = await async_client.put("/ai/v1/titanic/csv")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "2"
@@ -0,0 +1,143 @@
+import os
+import time
+import signal
+import asyncio
+import threading
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from app.domain.model.readiness import Readiness
+
+
+def ready_app(readiness: Readiness) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ready")
+    async def ready():
+        return JSONResponse(content=readiness.status(), status_code=200 if readiness.ready else 503)
+
+    return app
+
+
+def test_preload_runs_loader_once():
+    readiness = Readiness()
+    calls = []
+    assert readiness.preload(lambda: calls.append(1))
+    assert readiness.preload(lambda: calls.append(1))
+    assert calls == [1]
+    assert readiness.loaded and not readiness.ready
+
+
+@pytest.mark.asyncio
+async def test_worker_skips_loader_preloaded_before_fork():
+    readiness = Readiness()
+    calls = []
+    readiness.preload(lambda: calls.append("master"))
+    await readiness.start(lambda: calls.append("worker"))
+    assert await readiness.wait(timeout=1)
+    assert calls == ["master"]
+
+
+@pytest.mark.asyncio
+async def test_ready_returns_503_until_warm_up_finishes():
+    readiness = Readiness()
+    release = threading.Event()
+    await readiness.start(lambda: release.wait(2), worker_init=lambda: None)
+
+    async with AsyncClient(transport=ASGITransport(app=ready_app(readiness)), base_url="http://test") as client:
+        response = await client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+
+        release.set()
+        assert await readiness.wait(timeout=2)
+        response = await client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["loaded"] is True
+
+        await readiness.drain()
+        response = await client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "draining"
+
+
+@pytest.mark.asyncio
+async def test_failed_preload_is_retried_by_worker():
+    readiness = Readiness()
+    attempts = []
+
+    def flaky():
+        attempts.append(time.time())
+        if len(attempts) == 1:
+            raise FileNotFoundError("stored-data/geo_simple.json")
+
+    assert not readiness.preload(flaky)
+    assert readiness.error == "stored-data/geo_simple.json"
+    await readiness.start(flaky)
+    assert await readiness.wait(timeout=1)
+    assert len(attempts) == 2 and readiness.error is None
+
+
+@pytest.mark.asyncio
+async def test_worker_init_failure_keeps_not_ready():
+    readiness = Readiness()
+
+    def broken():
+        raise RuntimeError("JVM 시작 실패")
+
+    await readiness.start(lambda: None, worker_init=broken)
+    assert not await readiness.wait(timeout=1)
+    assert readiness.status()["error"] == "JVM 시작 실패"
+
+
+@pytest.mark.asyncio
+async def test_start_without_state_is_ready_immediately():
+    readiness = Readiness()
+    await readiness.start()
+    assert readiness.ready
+
+
+@pytest.mark.asyncio
+async def test_sigterm_reports_draining_before_server_shutdown():
+    """종료 신호를 받으면 /ready 가 바로 503 이 되고, 원래 핸들러(uvicorn 종료)는 delay 뒤에 호출되어야 합니다."""
+    readiness = Readiness()
+    await readiness.start()
+    forwarded = []
+    original = signal.getsignal(signal.SIGTERM)
+    signal.signal(signal.SIGTERM, lambda signum, frame: forwarded.append(signum))
+    try:
+        readiness.install_signal_handlers(delay=0.2)
+        async with AsyncClient(transport=ASGITransport(app=ready_app(readiness)), base_url="http://test") as client:
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.sleep(0.05)
+            response = await client.get("/ready")
+            assert response.status_code == 503
+            assert response.json()["status"] == "draining"
+            assert forwarded == []
+
+            await asyncio.sleep(0.3)
+            assert forwarded == [signal.SIGTERM]
+    finally:
+        signal.signal(signal.SIGTERM, original)
+
+
+def load_gunicorn_conf():
+    import runpy
+    return runpy.run_path(os.path.join(os.path.dirname(__file__), "..", "..", "gunicorn.conf.py"))
+
+
+def test_gateway_defaults_to_one_worker_and_flags_local_state(monkeypatch):
+    """게이트웨이 기본 워커는 1개이고, 메모리 백엔드로 여러 워커를 띄우면 공유 설정이 빠졌다고 알려야 합니다."""
+    for name in ("WEB_CONCURRENCY", "TOKEN_REPOSITORY_BACKEND", "GATEWAY_DATABASE", "LOGIN_CACHE_INVALIDATION", "GATEWAY_RATE_LIMIT"):
+        monkeypatch.delenv(name, raising=False)
+    conf = load_gunicorn_conf()
+    assert conf["workers"] == 1
+    assert conf["local_state_settings"]() == [
+        "TOKEN_REPOSITORY_BACKEND=redis", "GATEWAY_DATABASE=true", "LOGIN_CACHE_INVALIDATION=redis"
+    ]
+
+    monkeypatch.setenv("TOKEN_REPOSITORY_BACKEND", "redis")
+    monkeypatch.setenv("GATEWAY_DATABASE", "true")
+    monkeypatch.setenv("LOGIN_CACHE_INVALIDATION", "redis")
+    assert load_gunicorn_conf()["local_state_settings"]() == []
@@ -0,0 +1,177 @@
+import time
+import pytest
+from datetime import datetime, timedelta
+from app.domain.model.token_model import TokenModel
+from app.domain.repository.redis_token_repository import RedisTokenRepository
+from app.domain.schema.token_schema import TokenSchema
+from app.domain.service.token_service import TOKEN_CACHE_SHARED_TTL, TokenService
+
+
+class FakeRedis:
+    """테스트용 Redis 대역 (토큰 저장소가 쓰는 명령과 PX/PEXPIREAT TTL 만 지원)"""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+        self.round_trips = 0
+        self.closed = False
+
+    def _alive(self, key):
+        expires = self.expires.get(key)
+        if expires is not None and expires <= time.time() * 1000:
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    async def aclose(self):
+        self.closed = True
+
+    async def _run(self, name, *args, **kwargs):
+        return getattr(self, "_" + name)(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def command(*args, **kwargs):
+            self.round_trips += 1
+            return getattr(self, "_" + name)(*args, **kwargs)
+        return command
+
+    def _get(self, key):
+        return self.data[key].encode() if self._alive(key) else None
+
+    def _mget(self, keys):
+        return [self._get(key) for key in keys]
+
+    def _set(self, key, value, px=None, xx=False, keepttl=False):
+        if xx and not self._alive(key):
+            return None
+        self.data[key] = value
+        if px is not None:
+            self.expires[key] = time.time() * 1000 + px
+        elif not keepttl:
+            self.expires.pop(key, None)
+        return True
+
+    def _hset(self, key, field, value):
+        self._alive(key)
+        self.data.setdefault(key, {})[field] = str(value)
+
+    def _hgetall(self, key):
+        return {f.encode(): v.encode() for f, v in self.data[key].items()} if self._alive(key) else {}
+
+    def _hdel(self, key, *fields):
+        for field in fields:
+            self.data.get(key, {}).pop(field.decode() if isinstance(field, bytes) else field, None)
+
+    def _pexpireat(self, key, when):
+        if self._alive(key):
+            self.expires[key] = when
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [getattr(self.redis, "_" + name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+def model(name: str, user: str = "user-1", seconds: float = 60) -> TokenModel:
+    return TokenModel(token=name, user_id=user, expires_at=datetime.utcnow() + timedelta(seconds=seconds))
+
+
+@pytest.mark.asyncio
+async def test_save_is_one_round_trip_with_native_ttl():
+    redis = FakeRedis()
+    repository = RedisTokenRepository(client=redis)
+    await repository.save(model("a", seconds=60))
+    assert redis.round_trips == 1
+    key = repository._token_key("a")
+    assert 59_000 < redis.expires[key] - time.time() * 1000 <= 60_000
+    assert (await repository.find_by_token("a")).user_id == "user-1"
+
+
+@pytest.mark.asyncio
+async def test_find_many_is_one_round_trip():
+    redis = FakeRedis()
+    repository = RedisTokenRepository(client=redis)
+    await repository.save(model("a"))
+    await repository.save(model("b"))
+    redis.round_trips = 0
+    found = await repository.find_many_by_token(["a", "missing", "b"])
+    assert set(found) == {"a", "b"}
+    assert redis.round_trips == 1
+
+
+@pytest.mark.asyncio
+async def test_user_hash_lookup_and_revoke_all():
+    repository = RedisTokenRepository(client=FakeRedis())
+    await repository.save(model("a"))
+    await repository.save(model("b"))
+    await repository.save(model("c", user="user-2"))
+    assert {t.token for t in await repository.find_by_user_id("user-1")} == {"a", "b"}
+
+    revoked = await repository.revoke_all_for_user("user-1")
+    assert len(revoked) == 2
+    assert (await repository.find_by_token("a")).is_revoked
+    assert not (await repository.find_by_token("c")).is_revoked
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_disappear_and_are_cleaned_from_user_hash():
+    redis = FakeRedis()
+    repository = RedisTokenRepository(client=redis)
+    await repository.save(model("old", seconds=0.01))
+    await repository.save(model("new", seconds=60))
+    time.sleep(0.02)
+    assert await repository.find_by_token("old") is None
+    assert [t.token for t in await repository.find_by_user_id("user-1")] == ["new"]
+    assert repository.stale_fields_removed == 1
+    # 만료된 토큰을 폐기해도 TTL 없는 키가 새로 생기지 않아야 함
+    await repository.revoke("old")
+    assert repository._token_key("old") not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_token_issued_on_one_worker_verifies_on_another():
+    """같은 Redis 를 쓰는 두 워커(TokenService)는 토큰과 폐기 상태를 공유해야 합니다."""
+    redis = FakeRedis()
+    worker_a = TokenService(repository=RedisTokenRepository(client=redis))
+    worker_b = TokenService(repository=RedisTokenRepository(client=redis))
+    token = (await worker_a.create_token("user-1")).access_token
+    assert (await worker_b.verify_token(TokenSchema(token=token))).is_valid
+
+    # 공유 저장소를 쓰면 검증 캐시는 TOKEN_CACHE_SHARED_TTL 까지만 유지
+    (entry,) = worker_b.cache._entries.values()
+    assert entry.expires_at <= time.time() + TOKEN_CACHE_SHARED_TTL
+
+    await worker_a.revoke_token(token)
+    entry.expires_at = time.time() - 1  # 캐시 유지 시간 경과
+    assert not (await worker_b.verify_token(TokenSchema(token=token))).is_valid
+
+
+@pytest.mark.asyncio
+async def test_service_close_closes_redis_client():
+    """게이트웨이 종료 시 TokenService.close() 가 Redis 연결을 닫아야 합니다."""
+    redis = FakeRedis()
+    service = TokenService(repository=RedisTokenRepository(client=redis))
+    await service.close()
+    assert redis.closed
@@ -0,0 +1,105 @@
+import pytest
+import httpx
+from fastapi import Request
+from app.domain.model.response_cache import ResponseCache, response_cache
+
+calls = []
+
+
+def map_handler(request: httpx.Request) -> httpx.Response:
+    calls.append(request.url.path)
+    return httpx.Response(200, text="<html>crime map</html>", headers={"content-type": "text/html; charset=utf-8"})
+
+
+def make_request(path: str, query: bytes = b"", headers: list = None) -> Request:
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query, "headers": headers or []})
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    calls.clear()
+    response_cache.purge()
+    yield
+    response_cache.purge()
+
+
+@pytest.mark.asyncio
+async def test_second_get_is_served_from_cache(mock_upstream, async_client):
+    """캐시 대상 GET 은 두 번째 요청부터 업스트림을 호출하지 않아야 합니다."""
+    mock_upstream(map_handler)
+    first = await async_client.get("/ai/v1/crime/view-map")
+    second = await async_client.get("/ai/v1/crime/view-map")
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.text == "<html>crime map</html>"
+    assert second.headers["content-type"].startswith("text/html")
+    assert calls == ["/view-map"]
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_returns_304(mock_upstream, async_client):
+    """ETag 가 일치하면 304 를 반환해야 합니다."""
+    mock_upstream(map_handler)
+    first = await async_client.get("/ai/v1/crime/view-map")
+    response = await async_client.get("/ai/v1/crime/view-map", headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_purge_endpoint_drops_entries(mock_upstream, async_client, monkeypatch):
+    """purge 후에는 다시 업스트림을 호출해야 하며, purge 는 관리자 토큰이 있어야 합니다."""
+    mock_upstream(map_handler)
+    monkeypatch.setenv("GATEWAY_ADMIN_TOKEN", "admin-secret")
+    await async_client.get("/ai/v1/crime/view-map")
+    assert (await async_client.delete("/ai/v1/admin/cache")).status_code == 401
+    assert (await async_client.delete("/ai/v1/admin/cache/crime", params={"path": "view-map"})).status_code == 401
+    purged = await async_client.delete(
+        "/ai/v1/admin/cache/crime", params={"path": "view-map"}, headers={"x-admin-token": "admin-secret"}
+    )
+    assert purged.json() == {"purged": 1}
+    await async_client.get("/ai/v1/crime/view-map")
+    assert calls == ["/view-map", "/view-map"]
+
+
+def test_lru_eviction_respects_memory_bound():
+    """전체 크기 제한을 넘으면 가장 오래 사용하지 않은 항목이 제거되어야 합니다."""
+    cache = ResponseCache(max_bytes=2500, max_entry_bytes=2000, route_ttls={})
+    keys = [cache.make_key("crime", "view-map", make_request("/", f"v={i}".encode())) for i in range(3)]
+    cache.put(keys[0], 200, {}, b"a" * 1000, ttl=60)
+    cache.put(keys[1], 200, {}, b"b" * 1000, ttl=60)
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], 200, {}, b"c" * 1000, ttl=60)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.evictions == 1
+    assert cache.put(keys[1], 200, {}, b"d" * 3000, ttl=60) is None
+
+
+def test_expired_entry_is_a_miss():
+    """TTL 이 지난 항목은 조회되지 않아야 합니다."""
+    cache = ResponseCache(route_ttls={})
+    key = cache.make_key("titanic", "predict", make_request("/"))
+    cache.put(key, 200, {}, b"{}", ttl=0)
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_credentials_are_part_of_the_key():
+    """Authorization / Cookie 가 다른 요청은 같은 캐시 항목을 공유하지 않아야 합니다."""
+    anonymous = ResponseCache.make_key("crime", "view-map", make_request("/"))
+    alice = ResponseCache.make_key("crime", "view-map", make_request("/", headers=[(b"authorization", b"Bearer alice")]))
+    bob = ResponseCache.make_key("crime", "view-map", make_request("/", headers=[(b"authorization", b"Bearer bob")]))
+    session = ResponseCache.make_key("crime", "view-map", make_request("/", headers=[(b"cookie", b"session=1")]))
+    assert len({anonymous, alice, bob, session}) == 4
+    assert alice == ResponseCache.make_key("crime", "view-map", make_request("/", headers=[(b"authorization", b"Bearer alice")]))
+    assert "alice" not in repr(alice)
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_not_shared_across_users(mock_upstream, async_client):
+    mock_upstream(map_handler)
+    await async_client.get("/ai/v1/crime/view-map", headers={"authorization": "Bearer alice"})
+    response = await async_client.get("/ai/v1/crime/view-map", headers={"authorization": "Bearer bob"})
+    assert response.headers["x-cache"] == "MISS"
+    assert calls == ["/view-map", "/view-map"]
@@ -0,0 +1,79 @@
+import gzip
+import pytest
+import httpx
+from app.domain.model.response_compression import ResponseCompression, choose_encoding, parse_accept_encoding
+from app.domain.model.service_client_pool import client_pool
+from app.test.conftest import ChunkedStream
+
+MAP_HTML = "<html><body>" + "서울시 범죄 지도 " * 5000 + "</body></html>"
+
+
+def compression_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path == "/view-map":
+        return httpx.Response(200, text=MAP_HTML, headers={"content-type": "text/html; charset=utf-8"})
+    if path == "/wordcloud":
+        return httpx.Response(200, content=b"\x89PNG" + b"\x00" * 5000, headers={"content-type": "image/png"})
+    return httpx.Response(200, json={"ok": True})
+
+
+def test_accept_encoding_negotiation():
+    assert parse_accept_encoding("gzip, br;q=0.5") == {"gzip": 1.0, "br": 0.5}
+    assert choose_encoding("gzip, br;q=0.5", ("br", "gzip")) == "gzip"
+    assert choose_encoding("gzip, br", ("br", "gzip")) == "br"
+    assert choose_encoding("br", ("gzip",)) is None
+    assert choose_encoding("*;q=0.1", ("gzip",)) == "gzip"
+    assert choose_encoding("gzip;q=0", ("gzip",)) is None
+
+
+def test_explicit_zero_level_is_kept(monkeypatch):
+    """gzip 레벨 / brotli 품질 0 을 명시하면 환경 변수나 기본값으로 바뀌지 않아야 합니다."""
+    monkeypatch.setenv("GATEWAY_GZIP_LEVEL", "9")
+    compression = ResponseCompression(min_size=0, gzip_level=0, brotli_quality=0)
+    assert (compression.min_size, compression.gzip_level, compression.brotli_quality) == (0, 0, 0)
+    assert ResponseCompression().gzip_level == 9
+
+
+@pytest.mark.asyncio
+async def test_large_html_is_gzipped_and_png_is_skipped(mock_upstream, async_client):
+    """큰 HTML 은 gzip 으로 압축하고 PNG 와 작은 JSON 은 그대로 보내야 합니다."""
+    mock_upstream(compression_handler)
+    response = await async_client.put("/ai/v1/crime/view-map", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert response.text == MAP_HTML
+    assert int(response.headers.get("content-length", 0)) < len(MAP_HTML.encode())
+
+    response = await async_client.put("/ai/v1/nlp/wordcloud", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.content.startswith(b"\x89PNG")
+
+    response = await async_client.put("/ai/v1/titanic/predict", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_upstream_compressed_body_passes_through(monkeypatch, mock_upstream, async_client):
+    """업스트림이 이미 압축한 응답은 다시 압축하지 않고 그대로 전달해야 합니다."""
+    def pre_compressed(request: httpx.Request) -> httpx.Response:
+        body = gzip.compress(b'{"ok": true}' * 500)
+        headers = {"content-type": "application/json", "content-encoding": "gzip"}
+        return httpx.Response(200, headers=headers, stream=ChunkedStream(body))
+
+    mock_upstream(compression_handler)
+    monkeypatch.setattr(client_pool, "_transport", httpx.MockTransport(pre_compressed))
+    async with async_client.stream("PUT", "/ai/v1/titanic/pre-compressed", headers={"accept-encoding": "gzip"}) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(raw) == b'{"ok": true}' * 500
+
+
+@pytest.mark.asyncio
+async def test_brotli_when_available(mock_upstream, async_client):
+    brotli = pytest.importorskip("brotli")
+    mock_upstream(compression_handler)
+    async with async_client.stream("PUT", "/ai/v1/crime/view-map", headers={"accept-encoding": "br"}) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert response.headers["content-encoding"] == "br"
+    assert brotli.decompress(raw).decode() == MAP_HTML
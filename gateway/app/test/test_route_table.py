@@ -0,0 +1,97 @@
+import json
+import os
+import pytest
+import httpx
+from app.domain.model.route_table import RouteTable, route_table
+from app.domain.model.response_cache import ResponseCache
+from app.domain.model.service_type import ServiceType
+
+requested = []
+
+
+def record_handler(request: httpx.Request) -> httpx.Response:
+    requested.append((str(request.url), request.extensions.get("timeout", {}).get("read")))
+    return httpx.Response(200, json={"ok": True})
+
+
+def write_routes(path, routes):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"routes": routes}, f)
+
+
+def test_default_rewrites_match_previous_behaviour(tmp_path):
+    """라우트 파일이 없으면 기존 경로 재작성 규칙을 그대로 적용해야 합니다."""
+    table = RouteTable(path=str(tmp_path / "missing.json"), reload_interval=0)
+    assert table.match(ServiceType.TITANIC, "titanic").path == "titanic/predict"
+    assert table.match(ServiceType.CRIME, "nlp").path == "nlp/wordcloud"
+    assert table.match(ServiceType.TITANIC, "titanic/csv") is None
+
+
+def test_prefix_rewrite_and_service_precedence(tmp_path):
+    """접두사 라우트는 나머지 경로를 유지하고, 서비스 라우트가 * 라우트보다 우선해야 합니다."""
+    routes_file = tmp_path / "routes.json"
+    write_routes(routes_file, [
+        {"service": "*", "path": "v2", "rewrite": "api/v2"},
+        {"service": "crime", "path": "v2", "rewrite": "crime/v2"},
+        {"service": "crime", "path": "v2/map", "match": "exact", "rewrite": "view-map"},
+    ])
+    table = RouteTable(path=str(routes_file), reload_interval=0)
+    assert table.match(ServiceType.NLP, "v2/wordcloud/large").path == "api/v2/wordcloud/large"
+    assert table.match(ServiceType.CRIME, "v2/preprocess").path == "crime/v2/preprocess"
+    assert table.match(ServiceType.CRIME, "v2/map").path == "view-map"
+    assert table.match(ServiceType.CRIME, "v2/map/extra").path == "crime/v2/map/extra"
+
+
+def test_hot_reload_keeps_last_good_table(tmp_path):
+    """파일이 바뀌면 다시 컴파일하고, 잘못된 설정이면 이전 테이블을 유지해야 합니다."""
+    routes_file = tmp_path / "routes.json"
+    write_routes(routes_file, [{"path": "old", "rewrite": "a"}])
+    table = RouteTable(path=str(routes_file), reload_interval=0)
+
+    write_routes(routes_file, [{"path": "new", "rewrite": "b"}])
+    os.utime(routes_file, (1, 1))
+    assert table.reload()
+    assert table.match(ServiceType.TF, "new").path == "b"
+    assert table.match(ServiceType.TF, "old") is None
+
+    write_routes(routes_file, [{"service": "unknown", "path": "x"}])
+    os.utime(routes_file, (2, 2))
+    assert not table.reload()
+    assert table.reload_errors == 1
+    assert table.match(ServiceType.TF, "new").path == "b"
+
+
+@pytest.mark.asyncio
+async def test_route_upstream_timeout_and_cache_policy(tmp_path, monkeypatch, mock_upstream, async_client):
+    """라우트별 upstream, 타임아웃, 캐시 TTL 이 프록시 요청에 적용되어야 합니다."""
+    routes_file = tmp_path / "routes.json"
+    write_routes(routes_file, [
+        {"service": "tf", "path": "mosaic", "upstream": "http://gpu-tf:9004", "timeout": 120},
+        {"service": "nlp", "path": "wordcloud", "cache_ttl": 0},
+    ])
+    table = RouteTable(path=str(routes_file), reload_interval=0)
+    monkeypatch.setattr(route_table, "_roots", table._roots)
+    mock_upstream(record_handler)
+    requested.clear()
+
+    response = await async_client.put("/ai/v1/tf/mosaic", content=b"{}")
+    assert response.status_code == 200
+    url, timeout = requested[-1]
+    # 라우트 timeout 은 요청 마감의 상한 (보낼 때까지 지난 시간만큼 줄어듦)
+    assert url == "http://gpu-tf:9004/mosaic" and 119 < timeout <= 120
+    assert ResponseCache(route_ttls={("nlp", "wordcloud"): 600.0}).ttl_for("nlp", "wordcloud") == 0
+
+
+@pytest.mark.asyncio
+async def test_reload_endpoint_requires_admin_token(async_client, monkeypatch):
+    """라우트 파일을 강제로 다시 읽는 API 는 관리자 토큰이 있어야 합니다."""
+    reloads = []
+    monkeypatch.setattr(route_table, "reload", lambda force=False: reloads.append(force) or True)
+    monkeypatch.delenv("GATEWAY_ADMIN_TOKEN", raising=False)
+    assert (await async_client.post("/ai/v1/admin/routes/reload")).status_code == 403
+
+    monkeypatch.setenv("GATEWAY_ADMIN_TOKEN", "admin-secret")
+    assert (await async_client.post("/ai/v1/admin/routes/reload", headers={"x-admin-token": "wrong"})).status_code == 401
+    response = await async_client.post("/ai/v1/admin/routes/reload", headers={"x-admin-token": "admin-secret"})
+    assert response.status_code == 200 and response.json()["reloaded"]
+    assert reloads == [True]
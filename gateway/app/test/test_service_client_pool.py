@@ -0,0 +1,47 @@
+import pytest
+import httpx
+from app.domain.model.service_type import ServiceType
+from app.domain.model.service_client_pool import PoolSettings, ServiceClientPool
+
+
+def echo_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_per_service():
+    """같은 서비스에는 같은 클라이언트가 재사용되어야 합니다."""
+    pool = ServiceClientPool(settings=PoolSettings(), transport=httpx.MockTransport(echo_handler))
+    await pool.startup()
+    try:
+        titanic = pool.get_client(ServiceType.TITANIC)
+        assert pool.get_client(ServiceType.TITANIC) is titanic
+        assert pool.get_client(ServiceType.CRIME) is not titanic
+    finally:
+        await pool.shutdown()
+    assert titanic.is_closed
+
+
+@pytest.mark.asyncio
+async def test_stats_counts_requests():
+    """track 으로 감싼 요청 수가 통계에 반영되어야 합니다."""
+    pool = ServiceClientPool(settings=PoolSettings(), transport=httpx.MockTransport(echo_handler))
+    client = pool.get_client(ServiceType.NLP)
+    async with pool.track(ServiceType.NLP):
+        assert pool.stats()["nlp"]["in_flight"] == 1
+        response = await client.get("http://nlp-service/wordcloud")
+    assert response.json() == {"path": "/wordcloud"}
+    stats = pool.stats()["nlp"]
+    assert stats["in_flight"] == 0
+    assert stats["total_requests"] == 1
+    assert stats["open"] is True
+    await pool.shutdown()
+
+
+def test_service_timeout_from_env(monkeypatch):
+    """서비스별 타임아웃은 환경 변수로 덮어쓸 수 있어야 합니다."""
+    monkeypatch.setenv("TITANIC_SERVICE_TIMEOUT", "120")
+    monkeypatch.setenv("GATEWAY_DEFAULT_TIMEOUT", "7")
+    settings = PoolSettings.from_env()
+    assert settings.timeout_for(ServiceType.TITANIC).read == 120
+    assert settings.timeout_for(ServiceType.CRIME).read == 7
@@ -0,0 +1,130 @@
+import asyncio
+import pytest
+import httpx
+from fastapi import HTTPException
+from app.domain.model.service_type import ServiceType
+from app.domain.model.service_guard import CircuitState, GuardSettings, ServiceGuard, service_guard
+
+
+def make_guard(**overrides) -> ServiceGuard:
+    settings = GuardSettings(window_size=4, min_calls=4, open_seconds=0.05, half_open_calls=1, **overrides)
+    return ServiceGuard({service: settings for service in ServiceType})
+
+
+async def call(guard: ServiceGuard, status_code: int = 200):
+    async with guard.protect(ServiceType.TF) as c:
+        c.mark_response(status_code)
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_on_error_rate_and_fails_fast():
+    """실패율이 임계값을 넘으면 circuit 이 열리고 즉시 503 을 반환해야 합니다."""
+    guard = make_guard()
+    for _ in range(4):
+        await call(guard, 500)
+    assert guard.breaker(ServiceType.TF).state == CircuitState.OPEN
+    with pytest.raises(HTTPException) as exc:
+        await call(guard)
+    assert exc.value.status_code == 503
+    assert "Retry-After" in exc.value.headers
+    # 다른 서비스는 영향을 받지 않아야 합니다.
+    async with guard.protect(ServiceType.TITANIC):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_circuit():
+    """open 시간이 지나면 탐색 요청이 성공했을 때 다시 닫혀야 합니다."""
+    guard = make_guard()
+    for _ in range(4):
+        await call(guard, 502)
+    await asyncio.sleep(0.06)
+    await call(guard, 200)
+    assert guard.breaker(ServiceType.TF).state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_on_slow_calls():
+    """느린 호출 비율이 임계값을 넘으면 circuit 이 열려야 합니다."""
+    guard = make_guard(slow_call_seconds=0.0, slow_call_rate_threshold=1.0)
+    for _ in range(4):
+        await call(guard, 200)
+    assert guard.breaker(ServiceType.TF).state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_rejects_when_queue_is_full():
+    """동시 실행 한도와 대기열이 모두 차면 즉시 거부해야 합니다."""
+    guard = make_guard(max_concurrency=1, max_queue=1, queue_timeout=1.0)
+    release = asyncio.Event()
+
+    async def hold():
+        async with guard.protect(ServiceType.TF):
+            await release.wait()
+
+    first = asyncio.ensure_future(hold())
+    second = asyncio.ensure_future(hold())
+    await asyncio.sleep(0.01)
+    with pytest.raises(HTTPException) as exc:
+        await call(guard)
+    assert exc.value.status_code == 503
+    release.set()
+    await asyncio.gather(first, second)
+    assert guard.bulkhead(ServiceType.TF).stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_admin_endpoint_shows_circuit_state(mock_upstream, async_client):
+    """관리자 엔드포인트에서 서비스별 상태를 조회할 수 있어야 합니다."""
+    mock_upstream(lambda request: httpx.Response(200, json={}))
+    response = await async_client.get("/ai/v1/admin/circuits")
+    assert response.status_code == 200
+    assert response.json()["tf"]["circuit"]["state"] == service_guard.breaker(ServiceType.TF).state.value
+
+
+@pytest.mark.asyncio
+async def test_circuit_reset_requires_admin_token(async_client, monkeypatch):
+    """열린 circuit 을 강제로 닫는 API 는 관리자 토큰이 있어야 합니다."""
+    monkeypatch.setenv("GATEWAY_ADMIN_TOKEN", "admin-secret")
+    breaker = service_guard.breaker(ServiceType.TF)
+    breaker._transition(CircuitState.OPEN, "tf")
+    try:
+        response = await async_client.post("/ai/v1/admin/circuits/tf/reset")
+        assert response.status_code == 401
+        assert breaker.state == CircuitState.OPEN
+
+        response = await async_client.post("/ai/v1/admin/circuits/tf/reset", headers={"x-admin-token": "admin-secret"})
+        assert response.status_code == 200
+        assert breaker.state == CircuitState.CLOSED
+    finally:
+        service_guard.reset(ServiceType.TF)
+
+
+class BrokenStream(httpx.AsyncByteStream):
+    """첫 청크 뒤에 연결이 끊기는 업스트림 본문"""
+
+    async def __aiter__(self):
+        yield b"partial"
+        raise httpx.ReadError("connection reset")
+
+
+@pytest.mark.asyncio
+async def test_body_failure_mid_stream_is_recorded(mock_upstream, monkeypatch):
+    """응답 헤더 뒤 본문을 읽다 실패한 호출은 성공이 아니라 실패로 기록해야 합니다."""
+    from app.domain.model import service_proxy_factory
+    from app.domain.model.service_client_pool import client_pool
+
+    guard = make_guard()
+    monkeypatch.setattr(service_proxy_factory, "service_guard", guard)
+    mock_upstream(lambda request: httpx.Response(200))
+    monkeypatch.setattr(client_pool, "_transport", httpx.MockTransport(lambda request: httpx.Response(200, stream=BrokenStream())))
+
+    for _ in range(4):
+        response = await service_proxy_factory.ServiceProxyFactory(ServiceType.TF).stream("GET", "mosaic")
+        with pytest.raises(httpx.ReadError):
+            async for _ in response.body_iterator:
+                pass
+    breaker = guard.breaker(ServiceType.TF)
+    assert breaker.stats()["failure_rate"] == 1.0
+    assert breaker.state == CircuitState.OPEN
+    assert guard.bulkhead(ServiceType.TF).stats()["active"] == 0
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+import httpx
+from app.domain.model.single_flight import SingleFlight
+
+calls = []
+
+
+async def slow_map_handler(request: httpx.Request) -> httpx.Response:
+    calls.append(request.url.path)
+    await asyncio.sleep(0.05)
+    return httpx.Response(200, json={"message": "서울시의 범죄 지도가 완성되었습니다."})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_flight():
+    """같은 키의 동시 호출은 한 번만 실행되어야 합니다."""
+    group = SingleFlight(max_waiters=10, routes=set())
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(group.do("key", work) for _ in range(5)))
+    assert results == ["result"] * 5
+    assert len(runs) == 1
+    assert group.stats()["coalesced"] == 4
+    assert group.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_error_is_propagated_to_all_waiters():
+    """호출이 실패하면 모든 대기자가 같은 예외를 받아야 합니다."""
+    group = SingleFlight(max_waiters=10, routes=set())
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(*(group.do("key", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert group.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_over_limit_run_independently():
+    """대기자 한도를 넘는 요청은 합류하지 않고 따로 호출해야 합니다."""
+    group = SingleFlight(max_waiters=2, routes=set())
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    await asyncio.gather(*(group.do("key", work) for _ in range(5)))
+    assert len(runs) == 3
+    assert group.overflow == 2
+
+
+@pytest.mark.asyncio
+async def test_leader_cancellation_does_not_cancel_waiters():
+    """첫 요청이 취소되어도 다른 대기자는 결과를 받아야 합니다."""
+    group = SingleFlight(max_waiters=10, routes=set())
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    leader = asyncio.ensure_future(group.do("key", work))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(group.do("key", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "ok"
+
+
+def test_default_routes_are_idempotent_rebuilds_only(monkeypatch):
+    """기본 대상은 같은 결과물을 다시 만드는 경로뿐이고, 학습 작업 트리거(titanic/csv)는 합치지 않아야 합니다."""
+    monkeypatch.delenv("GATEWAY_COALESCE_ROUTES", raising=False)
+    group = SingleFlight()
+    assert group.coalesces("crime", "map")
+    assert not group.coalesces("titanic", "csv")
+
+
+@pytest.mark.asyncio
+async def test_gateway_coalesces_identical_gets(mock_upstream, async_client):
+    """게이트웨이는 동시에 들어온 같은 GET 을 업스트림 호출 하나로 처리해야 합니다."""
+    calls.clear()
+    mock_upstream(slow_map_handler)
+    responses = await asyncio.gather(*(async_client.get("/ai/v1/crime/map") for _ in range(10)))
+    assert all(r.status_code == 200 for r in responses)
+    assert all(r.json() == {"message": "서울시의 범죄 지도가 완성되었습니다."} for r in responses)
+    assert calls == ["/map"]
@@ -0,0 +1,68 @@
+import time
+import pytest
+from jose import jwt
+from app.api.token_router import token_controller
+from app.domain.model.token_cache import HS256Verifier
+from app.domain.schema.token_schema import TokenSchema
+from app.domain.service.token_service import ALGORITHM, SECRET_KEY, TokenService
+
+
+@pytest.mark.asyncio
+async def test_verify_many_matches_single_verification():
+    service = TokenService(cache_size=0)
+    valid = (await service.create_token("user-1")).access_token
+    revoked = (await service.create_token("user-2")).access_token
+    await service.revoke_token(revoked)
+    forged = jwt.encode(jwt.get_unverified_claims(valid), "wrong-key", algorithm=ALGORITHM)
+    unknown = jwt.encode({"sub": "user-3", "jti": "x", "exp": int(time.time()) + 60}, SECRET_KEY, algorithm=ALGORITHM)
+    tokens = [valid, revoked, "not-a-token", forged, unknown, valid]
+
+    batch = await service.verify_many(tokens)
+    single = [await service.verify_token(TokenSchema(token=token)) for token in tokens]
+    assert [r.is_valid for r in batch] == [True, False, False, False, False, True]
+    assert [r.model_dump() for r in batch] == [r.model_dump() for r in single]
+
+
+@pytest.mark.asyncio
+async def test_verify_many_uses_one_repository_lookup():
+    service = TokenService(cache_size=100)
+    tokens = [(await service.create_token(f"user-{i}")).access_token for i in range(50)]
+    calls = []
+    find_many = service.repository.find_many_by_token
+
+    async def counting(batch):
+        calls.append(batch)
+        return await find_many(batch)
+
+    service.repository.find_many_by_token = counting
+    assert all(r.is_valid for r in await service.verify_many(tokens + tokens))
+    assert len(calls) == 1 and len(calls[0]) == 50
+
+    # 두 번째 배치는 캐시에서 응답
+    assert all(r.is_valid for r in await service.verify_many(tokens))
+    assert len(calls) == 1
+
+
+def test_hs256_verifier_checks_signature_and_expiry():
+    verifier = HS256Verifier(SECRET_KEY)
+    now = int(time.time())
+    token = jwt.encode({"sub": "u", "exp": now + 60}, SECRET_KEY, algorithm=ALGORITHM)
+    assert verifier.verify(token)["sub"] == "u"
+    assert verifier.verify(jwt.encode({"sub": "u", "exp": now - 5}, SECRET_KEY, algorithm=ALGORITHM)) is None
+    assert verifier.verify(jwt.encode({"sub": "u", "nbf": now + 60}, SECRET_KEY, algorithm=ALGORITHM)) is None
+    assert verifier.verify(jwt.encode({"sub": "u"}, SECRET_KEY, algorithm="HS384")) is None
+    assert verifier.verify(token[:-2]) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoint(async_client, monkeypatch):
+    token = (await token_controller.service.create_token("user-1")).access_token
+    response = await async_client.post("/ai/v1/token/verify/batch", json={"tokens": [token, "bad"]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["is_valid"] and results[0]["user_id"] == "user-1"
+    assert not results[1]["is_valid"]
+
+    monkeypatch.setattr("app.domain.service.token_service.TOKEN_VERIFY_BATCH_MAX", 1)
+    response = await async_client.post("/ai/v1/token/verify/batch", json={"tokens": [token, token]})
+    assert response.status_code == 400
@@ -0,0 +1,105 @@
+import time
+import pytest
+from jose import jwt
+from app.domain.model.token_cache import RevocationFilter, VerifiedToken, VerifiedTokenCache, peek_claims
+from app.domain.schema.token_schema import TokenSchema
+from app.domain.service.token_service import TokenService
+
+
+def count_lookups(service: TokenService) -> list:
+    calls = []
+    find = service.repository.find_by_token
+
+    async def counting(token):
+        calls.append(token)
+        return await find(token)
+
+    service.repository.find_by_token = counting
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_second_verification_is_served_from_cache():
+    """두 번째 검증부터는 저장소 조회 없이 캐시에서 응답해야 합니다."""
+    service = TokenService(cache_size=100)
+    token = (await service.create_token("user-1")).access_token
+    lookups = count_lookups(service)
+
+    first = await service.verify_token(TokenSchema(token=token))
+    second = await service.verify_token(TokenSchema(token=token))
+    assert first.is_valid and second.is_valid
+    assert second.user_id == "user-1" and second.payload["sub"] == "user-1"
+    assert len(lookups) == 1
+    assert service.cache_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_revocation_invalidates_cached_tokens_immediately():
+    service = TokenService(cache_size=100)
+    first = (await service.create_token("user-1")).access_token
+    second = (await service.create_token("user-1")).access_token
+    other = (await service.create_token("user-2")).access_token
+    for token in (first, second, other):
+        assert (await service.verify_token(TokenSchema(token=token))).is_valid
+
+    await service.revoke_token(first)
+    assert not (await service.verify_token(TokenSchema(token=first))).is_valid
+
+    await service.revoke_all_for_user("user-1")
+    assert not (await service.verify_token(TokenSchema(token=second))).is_valid
+    assert (await service.verify_token(TokenSchema(token=other))).is_valid
+
+    fresh = (await service.create_token("user-1")).access_token
+    assert (await service.verify_token(TokenSchema(token=fresh))).is_valid
+
+
+@pytest.mark.asyncio
+async def test_forged_token_with_cached_jti_is_rejected():
+    """캐시된 jti 를 재사용한 위조 토큰은 캐시를 통과하지 못해야 합니다."""
+    service = TokenService(cache_size=100)
+    token = (await service.create_token("user-1")).access_token
+    assert (await service.verify_token(TokenSchema(token=token))).is_valid
+    forged = jwt.encode(peek_claims(token), "attacker-key", algorithm="HS256")
+    assert not (await service.verify_token(TokenSchema(token=forged))).is_valid
+    assert not (await service.verify_token(TokenSchema(token="not-a-jwt"))).is_valid
+
+
+def test_cache_entries_expire_and_are_bounded():
+    cache = VerifiedTokenCache(max_entries=2)
+    now = time.time()
+    cache.put("a", VerifiedToken("ta", "u", {}, now + 10))
+    cache.put("b", VerifiedToken("tb", "u", {}, now - 1))
+    assert cache.get("b", "tb", now) is None
+    cache.put("c", VerifiedToken("tc", "u", {}, now + 10))
+    cache.put("d", VerifiedToken("td", "u", {}, now + 10))
+    assert len(cache) == 2 and cache.get("a", "ta", now) is None
+
+
+def test_revocation_filter_prunes_expired_entries():
+    revocations = RevocationFilter()
+    now = time.time()
+    revocations.revoke("old", now - 1)
+    revocations.revoke("new", now + 60)
+    assert revocations.is_revoked({"jti": "new"}, now)
+    assert not revocations.is_revoked({"jti": "old"}, now)
+    assert revocations.stats()["revoked_tokens"] == 1
+
+
+@pytest.mark.asyncio
+async def test_malformed_claims_of_revoked_user_are_invalid():
+    """폐기된 사용자의 위조 토큰이 iat 형식을 깨뜨려도 500 이 아니라 무효여야 합니다."""
+    service = TokenService(cache_size=100)
+    await service.revoke_all_for_user("user-1")
+    forged = jwt.encode({"sub": "user-1", "iat": "x"}, "attacker-key", algorithm="HS256")
+    assert not (await service.verify_token(TokenSchema(token=forged))).is_valid
+    assert not (await service.verify_many([forged]))[0].is_valid
+    assert RevocationFilter().is_revoked({"sub": ["user-1"], "jti": {}})
+
+
+def test_revocation_filter_drops_user_cutoffs_after_token_lifetime():
+    revocations = RevocationFilter(token_lifetime=60)
+    now = time.time()
+    revocations.revoke_user("old", now - 120)
+    revocations.revoke_user("new", now - 10)
+    assert revocations.is_revoked({"sub": "new", "iat": now - 20}, now)
+    assert revocations.stats()["revoked_users"] == 1
@@ -0,0 +1,89 @@
+import asyncio
+import time
+import pytest
+from fastapi import HTTPException
+from datetime import datetime, timedelta
+from app.domain.model.token_model import TokenModel
+from app.domain.repository.token_repository import TokenRepository
+from app.domain.schema.token_schema import TokenSchema
+from app.domain.service.token_service import TokenService
+
+
+def token(name: str, user: str = "user-1", seconds: float = 60) -> TokenModel:
+    return TokenModel(token=name, user_id=user, expires_at=datetime.utcnow() + timedelta(seconds=seconds))
+
+
+@pytest.mark.asyncio
+async def test_sweep_removes_expired_tokens_in_bounded_batches():
+    """만료된 토큰은 한 번에 최대 limit 개씩 제거되어야 합니다."""
+    repository = TokenRepository(sweep_interval=0)
+    for i in range(5):
+        await repository.save(token(f"expired-{i}", seconds=-1))
+    await repository.save(token("alive"))
+
+    assert repository.sweep(limit=3) == 3
+    assert repository.sweep(limit=3) == 2
+    assert repository.sweep(limit=3) == 0
+    assert await repository.find_by_token("alive") is not None
+    assert [t.token for t in await repository.find_by_user_id("user-1")] == ["alive"]
+    assert repository.stats()["expired_removed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_revoked_tokens_are_removed_after_retention():
+    repository = TokenRepository(sweep_interval=0, revoked_retention=0)
+    await repository.save(token("a"))
+    await repository.save(token("b", user="user-2"))
+    await repository.revoke_all_for_user("user-1")
+    assert repository.sweep() == 1
+    assert await repository.find_by_token("a") is None
+    assert repository.stats()["revoked_removed"] == 1
+    assert repository.stats()["users"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hard_cap_evicts_soonest_expiring():
+    """최대 항목 수를 넘으면 가장 먼저 만료될 토큰부터 제거해야 합니다."""
+    repository = TokenRepository(max_entries=3, sweep_interval=0)
+    await repository.save(token("late", seconds=300))
+    await repository.save(token("soon", seconds=10))
+    await repository.save(token("mid", seconds=100))
+    await repository.save(token("new", seconds=200))
+    assert repository.stats()["entries"] == 3
+    assert await repository.find_by_token("soon") is None
+    assert repository.capacity_evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_background_sweeper_runs_without_blocking():
+    repository = TokenRepository(sweep_interval=0.01, sweep_batch=10)
+    for i in range(50):
+        await repository.save(token(f"t{i}", seconds=0.05))
+    await asyncio.sleep(0.15)
+    assert repository.stats()["entries"] == 0
+    await repository.close()
+
+
+@pytest.mark.asyncio
+async def test_revoking_again_after_retention_succeeds():
+    """보존 시간이 지나 제거된 폐기 토큰을 다시 폐기해도 404 가 아니어야 합니다."""
+    service = TokenService(cache_size=100, repository=TokenRepository(sweep_interval=0, revoked_retention=0))
+    token = (await service.create_token("user-1")).access_token
+    await service.revoke_token(token)
+    assert service.repository.sweep() == 1
+
+    assert await service.revoke_token(token) == {"message": "토큰이 폐기되었습니다."}
+    assert not (await service.verify_token(TokenSchema(token=token))).is_valid
+    with pytest.raises(HTTPException) as error:
+        await service.revoke_token(token[:-2] + "xx")
+    assert error.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_service_close_stops_sweeper():
+    service = TokenService(cache_size=100, repository=TokenRepository(sweep_interval=60))
+    await service.create_token("user-1")
+    sweeper = service.repository._sweeper
+    assert sweeper is not None and not sweeper.done()
+    await service.close()
+    assert sweeper.cancelled() and service.repository._sweeper is None
@@ -0,0 +1,93 @@
+import json
+import pytest
+import httpx
+from app.domain.model.upload_forwarder import upload_forwarder
+
+received = {}
+
+
+def upload_handler(request: httpx.Request) -> httpx.Response:
+    received["content_type"] = request.headers["content-type"]
+    received["body"] = request.content
+    if request.headers["content-type"].startswith("application/json"):
+        return httpx.Response(200, json={"json": json.loads(request.content)})
+    return httpx.Response(200, json={"filename": "face.png", "message": "파일 업로드 성공!"})
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_is_forwarded_unchanged(mock_upstream, async_client):
+    """multipart 본문은 다시 인코딩되지 않고 그대로 전달되어야 합니다."""
+    mock_upstream(upload_handler)
+    image = b"\x89PNG" + b"\x01" * 200_000
+    request = async_client.build_request(
+        "POST", "/ai/v1/tf/upload", files={"file": ("face.png", image, "image/png")}
+    )
+    response = await async_client.send(request)
+    assert response.status_code == 200
+    assert response.json()["filename"] == "face.png"
+    assert received["content_type"] == request.headers["content-type"]
+    assert received["body"] == request.read()
+
+
+@pytest.mark.asyncio
+async def test_multipart_json_data_is_still_parsed(mock_upstream, async_client):
+    """파일이 없는 multipart 요청의 json_data 는 JSON 으로 전달되어야 합니다."""
+    mock_upstream(upload_handler)
+    response = await async_client.post(
+        "/ai/v1/titanic/predict", files={"json_data": (None, '{"pclass": 1}')}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"json": {"pclass": 1}}
+
+
+@pytest.mark.asyncio
+async def test_upload_over_limit_is_rejected(mock_upstream, async_client, monkeypatch):
+    """크기 제한을 넘는 업로드는 413 으로 거부되어야 합니다."""
+    mock_upstream(upload_handler)
+    monkeypatch.setattr(upload_forwarder, "_limit", 1024)
+    response = await async_client.post(
+        "/ai/v1/tf/upload", files={"file": ("big.png", b"\x00" * 4096, "image/png")}
+    )
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_file_after_form_field_is_forwarded(mock_upstream, async_client):
+    """json_data 가 file 보다 먼저 와도 파일 업로드로 그대로 전달되어야 합니다."""
+    mock_upstream(upload_handler)
+    request = async_client.build_request(
+        "POST", "/ai/v1/tf/upload",
+        files=[("json_data", (None, '{"mode": "mosaic"}')), ("file", ("face.png", b"\x89PNG" + b"\x01" * 1000, "image/png"))]
+    )
+    response = await async_client.send(request)
+    assert response.status_code == 200
+    assert response.json()["filename"] == "face.png"
+    assert received["body"] == request.read()
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_over_limit_is_cut_mid_stream(mock_upstream, async_client, monkeypatch):
+    """Content-Length 없이 청크로 오는 업로드도 전달 중에 크기 제한을 넘으면 413 이어야 합니다."""
+    mock_upstream(upload_handler)
+    monkeypatch.setattr(upload_forwarder, "_limit", 1024)
+    rejected = upload_forwarder.rejected
+    boundary = "test-boundary"
+    head = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="big.png"\r\n'
+        "Content-Type: image/png\r\n\r\n"
+    ).encode()
+
+    async def body():
+        yield head
+        for _ in range(16):
+            yield b"\x00" * 256
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    response = await async_client.post(
+        "/ai/v1/tf/upload",
+        content=body(),
+        headers={"content-type": f"multipart/form-data; boundary={boundary}"}
+    )
+    assert response.status_code == 413
+    assert upload_forwarder.rejected == rejected + 1
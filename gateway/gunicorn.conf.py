@@ -0,0 +1,50 @@
+"""운영 실행 설정 (gunicorn 마스터 + uvicorn 워커 여러 개)
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+마스터가 앱을 한 번 import 한 뒤(preload_app) 워커를 fork 하므로 import 된 모듈은
+워커들이 copy-on-write 로 공유합니다. 연결 풀·Redis·DB 연결은 fork 후 워커의 lifespan 에서 만듭니다.
+토큰 저장소·로그인 캐시·rate limit 은 기본적으로 프로세스 메모리에 있으므로 게이트웨이는 기본 워커 1개로 뜹니다.
+WEB_CONCURRENCY 를 2 이상으로 올리려면 TOKEN_REPOSITORY_BACKEND=redis, LOGIN_CACHE_INVALIDATION=redis,
+GATEWAY_DATABASE=true (rate limit 을 켰다면 GATEWAY_RATE_LIMIT_BACKEND=redis) 를 함께 설정하세요.
+SIGTERM 을 받으면 워커는 READINESS_DRAIN_DELAY 초(기본 5) 동안 /ready 를 503 으로 응답하며 요청을 계속 받고,
+그 뒤 리스닝 소켓을 닫고 진행 중인 요청이 끝나기를 기다립니다 (둘을 합쳐 graceful_timeout 초까지).
+"""
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '9090')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+
+
+def local_state_settings() -> list:
+    """워커끼리 공유되지 않는 (프로세스 메모리) 상태 저장소 설정 목록"""
+    settings = []
+    if os.getenv("TOKEN_REPOSITORY_BACKEND", "memory") != "redis":
+        settings.append("TOKEN_REPOSITORY_BACKEND=redis")
+    if os.getenv("GATEWAY_DATABASE", "false").lower() != "true":
+        settings.append("GATEWAY_DATABASE=true")
+    if os.getenv("LOGIN_CACHE_INVALIDATION", "none") != "redis":
+        settings.append("LOGIN_CACHE_INVALIDATION=redis")
+    if (os.getenv("GATEWAY_RATE_LIMIT", "false").lower() == "true"
+            and os.getenv("GATEWAY_RATE_LIMIT_BACKEND", "memory") != "redis"):
+        settings.append("GATEWAY_RATE_LIMIT_BACKEND=redis")
+    return settings
+
+
+def when_ready(server):
+    """워커를 fork 하기 직전 (마스터) - import 된 객체를 GC 대상에서 빼 둡니다."""
+    # 워커의 GC 가 공유 객체 헤더를 건드려 페이지가 복사되는 것을 막음
+    gc.freeze()
+    server.log.info(f"🚀 워커 {workers}개 시작 (graceful_timeout={graceful_timeout}s)")
+    missing = local_state_settings() if workers > 1 else []
+    if missing:
+        # 워커마다 토큰/로그인/rate limit 상태가 따로 있어 다른 워커로 간 요청이 404·무효 토큰이 됨
+        server.log.error(
+            f"❌ 워커 {workers}개가 상태를 공유하지 않습니다 - {', '.join(missing)} 를 설정하거나 WEB_CONCURRENCY=1 로 실행하세요."
+        )
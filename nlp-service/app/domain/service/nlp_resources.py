@@ -0,0 +1,65 @@
+import os
+import logging
+import threading
+from konlpy.tag import Okt
+
+logger = logging.getLogger("nlp_api")
+
+REPORT_FILE = os.path.join('app', 'orginal', 'kr-Report_2018.txt')
+STOPWORD_FILE = os.path.join('app', 'orginal', 'stopwords.txt')
+
+
+class NlpResources:
+    """삼성 리포트 원문, 불용어 사전, Okt 형태소 분석기를 프로세스에 한 번만 준비합니다.
+
+    원문과 불용어는 읽기 전용이라 gunicorn 마스터가 fork 전에 읽어 워커들이 공유합니다.
+    Okt 는 JVM 을 띄우는데 JVM 은 fork 후 자식에서 쓸 수 없으므로 워커마다 한 번 만들고,
+    짧은 문장을 미리 분석해 첫 요청이 JVM 워밍업 비용을 치르지 않게 합니다.
+    """
+
+    def __init__(self, report_file: str = REPORT_FILE, stopword_file: str = STOPWORD_FILE):
+        self.report_file = report_file
+        self.stopword_file = stopword_file
+        self._text = None
+        self._stopwords = None
+        self._okt = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._text is not None and self._stopwords is not None
+
+    def load(self):
+        """원문과 불용어 사전을 읽습니다 (이미 읽었으면 건너뜀)."""
+        text, stopwords = self.report(), self.stopwords()
+        logger.info(f"📦 원문 {len(text)}자, 불용어 {len(stopwords)}개 적재 완료")
+
+    def init_worker(self):
+        """fork 후 워커에서 Okt(JVM) 를 만들고 미리 한 번 분석합니다."""
+        self.okt().pos("삼성전자 지속가능경영 보고서")
+        logger.info("📦 Okt 형태소 분석기 준비 완료")
+
+    def report(self) -> str:
+        with self._lock:
+            if self._text is None:
+                with open(self.report_file, 'r', encoding='utf-8') as f:
+                    self._text = f.read()
+            return self._text
+
+    def stopwords(self) -> list:
+        with self._lock:
+            if self._stopwords is None:
+                with open(self.stopword_file, 'r', encoding='utf-8') as f:
+                    # 중복 제거 및 길이가 1인 단어 제외
+                    self._stopwords = frozenset(word for word in f.read().strip().split() if len(word) > 1)
+            return list(self._stopwords)
+
+    def okt(self) -> Okt:
+        with self._lock:
+            if self._okt is None:
+                self._okt = Okt()
+            return self._okt
+
+
+# ✅ 프로세스 전역 NLP 자원
+nlp_resources = NlpResources()
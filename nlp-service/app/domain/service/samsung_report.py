@@ -1,10 +1,11 @@
-from konlpy.tag import Okt
 import re
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 from collections import Counter
 import os
 import logging
+from app.domain.service.nlp_resources import nlp_resources
+from app.domain.model import deadline
 
 logger = logging.getLogger("nlp_api")
 
@@ -19,10 +20,9 @@ class SamsungReport:
 
     def read_file(self):
         print("📖 파일 읽기 시작...")
-        file_path = os.path.join('app', 'orginal', 'kr-Report_2018.txt')
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.text = f.read()
+            # 기동 시 한 번 읽어 둔 원문 사용
+            self.text = nlp_resources.report()
             print(f"✅ 파일 읽기 완료: {len(self.text)} 글자")
         except Exception as e:
             print(f"❌ 파일 읽기 오류: {e}")
@@ -46,13 +46,16 @@ class SamsungReport:
 
     def extract_noun(self):
         print("📝 형태소 분석 시작...")
-        okt = Okt()
+        # 워커마다 한 번 만든 Okt 재사용 (매번 만들면 요청마다 JVM 초기화 비용)
+        okt = nlp_resources.okt()
         self.nouns = []
         total_tokens = len(self.tokens)
         
         for i, token in enumerate(self.tokens, 1):
             if i % 100 == 0:
                 print(f"⏳ 형태소 분석 진행중: {i}/{total_tokens} ({i/total_tokens*100:.1f}%)")
+                # ✅ 형태소 분석이 가장 오래 걸리므로 중간에도 마감 확인
+                deadline.check("extract_noun")
             # token 내 단어별 품사 확인
             pos_tags = okt.pos(token)
             # 명사만 추출
@@ -63,14 +66,9 @@ class SamsungReport:
 
     def read_stopword(self):
         print("📚 불용어 사전 읽기 시작...")
-        # stopwords.txt 파일에서 불용어 읽기
-        file_path = os.path.join('app', 'orginal', 'stopwords.txt')
+        # 기동 시 stopwords.txt 에서 읽어 둔 불용어 사용
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # 파일의 내용을 읽어와서 공백으로 분리
-                words = f.read().strip().split()
-                # 중복 제거 및 길이가 1인 단어 제외
-                self.stopwords = list(set([word for word in words if len(word) > 1]))
+            self.stopwords = nlp_resources.stopwords()
             print(f"✅ 불용어 사전 읽기 완료: {len(self.stopwords)} 개의 불용어")
         except Exception as e:
             print(f"❌ 불용어 사전 읽기 오류: {e}")
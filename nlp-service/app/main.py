@@ -7,6 +7,9 @@ from fastapi.responses import FileResponse, JSONResponse
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 from app.domain.service.samsung_report import SamsungReport
+from app.domain.service.nlp_resources import nlp_resources
+from app.domain.model.readiness import readiness
+from app.domain.model.deadline import DeadlineExceeded, DeadlineMiddleware, deadline_exceeded_handler, guard
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -25,11 +28,18 @@ logger = logging.getLogger("nlp_api")
 # .env 파일 로드
 load_dotenv()
 
-# ✅ 애플리케이션 시작 시 실행
+# ✅ fork 전에 적재할 읽기 전용 상태 (gunicorn.conf.py 의 when_ready 에서 호출)
+def preload():
+    readiness.preload(nlp_resources.load)
+
+# ✅ 애플리케이션 시작 시 실행 (Okt 의 JVM 은 fork 후 워커마다 준비)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 NLP API 서비스 시작")
+    await readiness.start(nlp_resources.load, nlp_resources.init_worker)
+    readiness.install_signal_handlers()
     yield
+    await readiness.drain()
     logger.info("🛑 NLP API 서비스 종료")
 
 # ✅ FastAPI 앱 생성 
@@ -54,6 +64,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 게이트웨이가 보낸 x-deadline-ms 로 요청 마감 설정 (마감이 지나면 비싼 단계를 건너뛰고 504)
+app.add_middleware(DeadlineMiddleware)
+app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+
+# ✅ 준비 상태 엔드포인트 (원문·불용어·Okt 준비 전과 드레인 중에는 503)
+@app.get("/ready", include_in_schema=False)
+async def ready():
+    return JSONResponse(content=readiness.status(), status_code=200 if readiness.ready else 503)
+
 @app.get("/test")
 async def read_test():
     """테스트 엔드포인트"""
@@ -73,13 +92,15 @@ async def generate_wordcloud():
         sr.read_file()
         sr.extract_hangul()
         sr.change_token()
-        sr.extract_noun()
+        with guard("extract_noun"):
+            sr.extract_noun()
         sr.read_stopword()
         sr.remove_stopword()
         sr.find_frequency()
         
         # 워드클라우드 생성
-        output_path = sr.draw_wordcloud()
+        with guard("draw_wordcloud"):
+            output_path = sr.draw_wordcloud()
         
         # 파일이 존재하는지 확인
         if os.path.exists(output_path):
@@ -91,10 +112,13 @@ async def generate_wordcloud():
             )
         else:
             raise HTTPException(status_code=500, detail="워드클라우드 생성에 실패했습니다.")
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"워드클라우드 생성 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# ✅ 개발용 단일 프로세스 실행 (운영은 gunicorn.conf.py 로 워커 여러 개 실행)
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=9003, reload=True)
@@ -0,0 +1,37 @@
+import app.domain.service.nlp_resources as module
+from app.domain.service.nlp_resources import NlpResources
+
+
+def write(path, content):
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_report_and_stopwords_are_read_once(tmp_path):
+    report = write(tmp_path / "report.txt", "삼성전자 지속가능경영")
+    stopwords = write(tmp_path / "stopwords.txt", "및 그리고 그리고 등의")
+    resources = NlpResources(report, stopwords)
+    resources.load()
+    write(tmp_path / "report.txt", "바뀐 원문")
+    assert resources.loaded
+    assert resources.report() == "삼성전자 지속가능경영"
+    # 중복과 한 글자 단어는 제외
+    assert sorted(resources.stopwords()) == ["그리고", "등의"]
+
+
+def test_okt_is_created_once_per_worker(tmp_path, monkeypatch):
+    """Okt(JVM) 는 워커 초기화에서 한 번 만들고 이후 요청에서 재사용해야 합니다."""
+    created = []
+
+    class FakeOkt:
+        def __init__(self):
+            created.append(self)
+
+        def pos(self, text):
+            return [(text, "Noun")]
+
+    monkeypatch.setattr(module, "Okt", FakeOkt)
+    resources = NlpResources(str(tmp_path / "report.txt"), str(tmp_path / "stopwords.txt"))
+    resources.init_worker()
+    assert resources.okt() is created[0]
+    assert len(created) == 1
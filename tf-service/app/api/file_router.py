@@ -5,6 +5,8 @@ from pydantic import BaseModel
 import shutil
 import logging
 import cv2
+from app.domain.service.face_cascade import face_cascade
+from app.domain.model import deadline
 
 router = APIRouter()
 logger = logging.getLogger("tf_main")
@@ -38,19 +40,20 @@ async def upload_file(file: UploadFile = File(...)):
 
 @router.get("/mosaic")
 async def mosaic_all_uploads():
-    cascade = os.path.join(BASE_DIR, 'data', 'haarcascade_frontalface_alt.xml')
-    face_cascade = cv2.CascadeClassifier(cascade)
     processed_files = []
     failed_files = []
 
     for filename in os.listdir(UPLOAD_DIR):
         if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
+            # ✅ 파일마다 남은 마감 시간 확인 (지나면 504, 이미 만든 결과 파일은 그대로 둠)
+            deadline.check(f"mosaic:{filename}")
             img_path = os.path.join(UPLOAD_DIR, filename)
             img = cv2.imread(img_path)
             if img is None:
                 failed_files.append(filename)
                 continue
-            face = face_cascade.detectMultiScale(img, minSize=(30,30))
+            # 기동 시 적재한 cascade 재사용
+            face = face_cascade.detect(img, min_size=(30, 30))
             if len(face) == 0:
                 logger.error(f'얼굴인식 실패: {filename}')
                 failed_files.append(filename)
@@ -0,0 +1,79 @@
+import time
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger("tf_main")
+
+# ✅ 게이트웨이가 남은 처리 시간(ms)을 실어 보내는 헤더
+DEADLINE_HEADER = b"x-deadline-ms"
+
+# 현재 요청의 마감 시각 (time.monotonic 기준, 헤더가 없으면 None)
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+# 단계별 마지막 소요 시간 (남은 시간이 이보다 짧으면 시작하지 않음)
+_stage_seconds: Dict[str, float] = {}
+
+
+class DeadlineExceeded(Exception):
+    """요청 마감이 지나 남은 작업을 중단할 때 발생합니다."""
+
+    def __init__(self, stage: str):
+        super().__init__(f"요청 마감 시간이 지나 '{stage}' 단계를 중단했습니다.")
+        self.stage = stage
+
+
+def remaining() -> Optional[float]:
+    """현재 요청의 남은 시간 초 (마감이 없으면 None)"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def check(stage: str, needed: float = 0.0):
+    """남은 시간이 needed 초보다 짧으면 DeadlineExceeded 를 올립니다."""
+    left = remaining()
+    if left is not None and left <= needed:
+        logger.warning(f"⏱️ 마감 초과로 중단: {stage} (남은 {left:.2f}s, 필요 {needed:.2f}s)")
+        raise DeadlineExceeded(stage)
+
+
+@contextmanager
+def guard(stage: str):
+    """비싼 단계를 감쌉니다. 지난번 소요 시간보다 남은 시간이 짧으면 시작 전에 중단합니다."""
+    check(stage, _stage_seconds.get(stage, 0.0))
+    started = time.monotonic()
+    yield
+    _stage_seconds[stage] = time.monotonic() - started
+
+
+class DeadlineMiddleware:
+    """x-deadline-ms 헤더를 읽어 요청 마감을 설정하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        deadline = None
+        for key, value in scope.get("headers", []):
+            if key == DEADLINE_HEADER:
+                try:
+                    deadline = time.monotonic() + max(0.0, float(value) / 1000)
+                except ValueError:
+                    pass
+                break
+        token = _deadline.set(deadline)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _deadline.reset(token)
+
+
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+    """마감 초과를 504 로 응답합니다."""
+    return JSONResponse(status_code=504, content={"detail": str(exc), "stage": exc.stage})
@@ -0,0 +1,47 @@
+import os
+import logging
+import threading
+import cv2
+
+logger = logging.getLogger("tf_main")
+
+CASCADE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'data', 'haarcascade_frontalface_alt.xml')
+
+
+class FaceCascade:
+    """Haar cascade 얼굴 검출기를 프로세스에 한 번만 적재합니다.
+
+    gunicorn 마스터가 fork 전에 load 를 호출하면 워커들은 파싱된 cascade 를 공유하고,
+    /mosaic 요청마다 700KB 가까운 XML 을 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, fname: str = CASCADE_FILE):
+        self.fname = fname
+        self._classifier = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._classifier is not None
+
+    def load(self):
+        """cascade XML 을 읽습니다 (이미 읽었으면 건너뜀)."""
+        with self._lock:
+            if self._classifier is not None:
+                return
+            classifier = cv2.CascadeClassifier(self.fname)
+            if classifier.empty():
+                raise FileNotFoundError(f"cascade 파일을 읽을 수 없습니다: {self.fname}")
+            self._classifier = classifier
+            logger.info(f"📦 얼굴 검출 cascade 적재 완료: {self.fname}")
+
+    def detect(self, img, min_size=(30, 30)):
+        """이미지에서 얼굴 영역 (x, y, w, h) 목록을 찾습니다."""
+        if self._classifier is None:
+            self.load()
+        return self._classifier.detectMultiScale(img, minSize=min_size)
+
+
+# ✅ 프로세스 전역 얼굴 검출기
+face_cascade = FaceCascade()
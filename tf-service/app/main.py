@@ -3,7 +3,12 @@ TF 서비스 메인 애플리케이션 진입점
 """
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 from app.api.file_router import router as file_router
+from app.domain.model.readiness import readiness
+from app.domain.model.deadline import DeadlineExceeded, DeadlineMiddleware, deadline_exceeded_handler
+from app.domain.service.face_cascade import face_cascade
 import uvicorn
 import logging
 import traceback
@@ -27,11 +32,25 @@ logger.info(f"📂 파일 목록: {os.listdir()}")
 uploads_dir = "uploads"
 logger.info(f"📂 uploads 폴더: {os.path.exists(uploads_dir)} (생성됨: {os.makedirs(uploads_dir, exist_ok=True) or True})")
 
+# fork 전에 적재할 읽기 전용 상태 (gunicorn.conf.py 의 when_ready 에서 호출)
+def preload():
+    readiness.preload(face_cascade.load)
+
+# 워커 시작/종료 시 실행
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await readiness.start(face_cascade.load)
+    readiness.install_signal_handlers()
+    yield
+    await readiness.drain()
+    logger.info("🛑 TF 서비스 종료")
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="TensorFlow Service API",
     description="TensorFlow 기반 계산 및 머신러닝 서비스",
     version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 미들웨어 설정
@@ -43,6 +62,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 게이트웨이가 보낸 x-deadline-ms 로 요청 마감 설정 (마감이 지나면 비싼 단계를 건너뛰고 504)
+app.add_middleware(DeadlineMiddleware)
+app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+
 # 예외 처리 미들웨어 추가
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -77,7 +100,12 @@ async def root():
         }
     }
 
-# 직접 실행 시 (개발 환경)
+# 준비 상태 확인 (cascade 적재 전과 드레인 중에는 503)
+@app.get("/ready", tags=["상태 확인"], include_in_schema=False)
+async def ready():
+    return JSONResponse(content=readiness.status(), status_code=200 if readiness.ready else 503)
+
+# 직접 실행 시 (개발 환경 - 운영은 gunicorn.conf.py 로 워커 여러 개 실행)
 if __name__ == "__main__":
     logger.info(f"💻 개발 모드로 실행 - 포트: 9004")
     uvicorn.run(
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from app.domain.service.face_cascade import FaceCascade
+
+
+def test_cascade_is_parsed_once():
+    cascade = FaceCascade()
+    cascade.load()
+    classifier = cascade._classifier
+    cascade.load()
+    assert cascade.loaded and cascade._classifier is classifier
+
+
+def test_detect_loads_on_first_use():
+    cascade = FaceCascade()
+    faces = cascade.detect(np.zeros((64, 64, 3), dtype=np.uint8))
+    assert cascade.loaded
+    assert len(faces) == 0
+
+
+def test_missing_cascade_file(tmp_path):
+    cascade = FaceCascade(str(tmp_path / "missing.xml"))
+    with pytest.raises(FileNotFoundError):
+        cascade.load()
+    assert not cascade.loaded
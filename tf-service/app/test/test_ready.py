@@ -0,0 +1,45 @@
+import time
+import threading
+from fastapi.testclient import TestClient
+import app.main as main
+from app.domain.model.readiness import Readiness
+from app.domain.service.face_cascade import face_cascade
+
+
+def wait_ready(client: TestClient, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        response = client.get("/ready")
+        if response.status_code == 200:
+            return response
+        time.sleep(0.01)
+    return client.get("/ready")
+
+
+def test_preload_marks_state_loaded(monkeypatch):
+    """gunicorn when_ready 에서 부르는 preload 는 얼굴 검출 cascade 를 한 번 적재해야 합니다."""
+    state = Readiness()
+    calls = []
+    monkeypatch.setattr(main, "readiness", state)
+    monkeypatch.setattr(face_cascade, "load", lambda: calls.append("load"))
+    main.preload()
+    main.preload()
+    assert state.loaded and calls == ["load"]
+
+
+def test_ready_is_503_until_warm_up_finishes(monkeypatch):
+    """fork 전에 적재되지 않은 워커는 워밍업이 끝날 때까지 /ready 가 503 이어야 합니다."""
+    state = Readiness()
+    release = threading.Event()
+    monkeypatch.setattr(main, "readiness", state)
+    monkeypatch.setattr(face_cascade, "load", lambda: release.wait(5))
+    with TestClient(main.app) as client:
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+
+        release.set()
+        response = wait_ready(client)
+        assert response.status_code == 200
+        assert response.json()["loaded"] is True
+    assert state.draining and not state.ready
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Request
 import logging
 from app.domain.controller.titanic_controller import Controller
+from app.domain.model.deadline import DeadlineExceeded, guard
 
 
 # 로거 설정
@@ -108,25 +109,36 @@ def run_titanic_model():
         logger.info("Titanic 모델 실행 시작")
         titanic_controller = Controller()
         
+        # ✅ 단계마다 남은 마감 시간을 확인 (지난번 소요 시간보다 짧으면 시작하지 않고 504)
         logger.info("Titanic 모델 전처리 시작")
-        titanic_controller.preprocess("train.csv", "test.csv")
+        with guard("preprocess"):
+            titanic_controller.preprocess("train.csv", "test.csv")
         
         logger.info("Titanic 모델 학습 시작")
-        titanic_controller.learning()
+        with guard("learning"):
+            titanic_controller.learning()
         
         logger.info("Titanic 모델 평가 시작")
-        accuracy = titanic_controller.evaluation()
+        with guard("evaluation"):
+            accuracy = titanic_controller.evaluation()
         logger.info(f"Titanic 모델 정확도: {accuracy:.4f}")
         
-        titanic_controller.submit()
-        titanic_controller.tune()
-        titanic_controller.tune_svm()
-        titanic_controller.tune_voting()
-        titanic_controller.feature_importance()
+        with guard("submit"):
+            titanic_controller.submit()
+        with guard("tune"):
+            titanic_controller.tune()
+        with guard("tune_svm"):
+            titanic_controller.tune_svm()
+        with guard("tune_voting"):
+            titanic_controller.tune_voting()
+        with guard("feature_importance"):
+            titanic_controller.feature_importance()
         
         logger.info("Titanic 모델 실행 완료")
         return {"message": "csv파일이 생성되었습니다."}
     
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"Error: {str(e)}")
         return {"message": "csv파일 생성 중 오류가 발생했습니다."}
\ No newline at end of file
@@ -1,5 +1,6 @@
 from app.domain.service.titanic_service import TitanicService
 from app.domain.service.modelling_service import ModelingService
+from app.domain.service.model_store import model_store
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier, VotingClassifier
 from sklearn.naive_bayes import GaussianNB
@@ -167,8 +168,8 @@ class Controller :
         print(f"\n🏆 {this.best_model} 모델로 제출 파일 생성 (정확도: {this.best_accuracy:.4f})")
         
         try:
-            # 서비스 레이어에서 예측 수행
-            prediction = self.modeling_service.predict_with_voting(this)
+            # 기동 시 적재한 Voting 앙상블로 예측 (같은 데이터로 다시 학습하지 않음)
+            prediction = model_store.predict(this.test)
             
             # 제출용 데이터프레임 생성
             submission_df = pd.DataFrame({
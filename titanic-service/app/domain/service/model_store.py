@@ -0,0 +1,44 @@
+import logging
+import threading
+from app.domain.service.titanic_service import TitanicService
+from app.domain.service.modelling_service import ModelingService
+
+logger = logging.getLogger("titanic_api")
+
+
+class ModelStore:
+    """전처리한 데이터셋과 학습을 마친 Voting 앙상블을 프로세스에 한 번만 적재합니다.
+
+    gunicorn 마스터가 fork 전에 load 를 호출하면 워커들은 적재된 모델을 copy-on-write 로
+    공유하고, 요청마다 다시 학습하지 않습니다.
+    """
+
+    def __init__(self, train_fname: str = "train.csv", test_fname: str = "test.csv"):
+        self.train_fname = train_fname
+        self.test_fname = test_fname
+        self.dataset = None
+        self.voting = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.voting is not None
+
+    def load(self):
+        """데이터셋을 전처리하고 Voting 앙상블을 학습합니다 (이미 적재했으면 건너뜀)."""
+        with self._lock:
+            if self.voting is not None:
+                return
+            dataset = TitanicService().preprocess(self.train_fname, self.test_fname)
+            self.voting = ModelingService.fit_voting(dataset)
+            self.dataset = dataset
+            logger.info(f"📦 Titanic 모델 적재 완료 (학습 데이터 {len(dataset.train)}행)")
+
+    def predict(self, features):
+        """적재한 Voting 앙상블로 생존 여부를 예측합니다."""
+        self.load()
+        return self.voting.predict(features)
+
+
+# ✅ 프로세스 전역 모델 저장소
+model_store = ModelStore()
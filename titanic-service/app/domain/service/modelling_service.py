@@ -113,12 +113,8 @@ class ModelingService:
         
 
     @staticmethod
-    def predict_with_voting(this):
-        """랜덤포레스트 + SVM Voting 앙상블로 예측"""
-        X_train = this.train
-        y_train = this.label
-        X_test = this.test
-
+    def fit_voting(this):
+        """랜덤포레스트 + SVM Voting 앙상블 학습"""
         # 스케일링은 SVM만 필요하므로 파이프라인 생성
         svm_pipeline = Pipeline([
             ('scaler', StandardScaler()),
@@ -146,12 +142,14 @@ class ModelingService:
         )
 
         # 학습
-        voting_clf.fit(X_train, y_train)
+        voting_clf.fit(this.train, this.label)
 
-        # 예측
-        predictions = voting_clf.predict(X_test)
+        return voting_clf
 
-        return predictions
+    @staticmethod
+    def predict_with_voting(this):
+        """랜덤포레스트 + SVM Voting 앙상블로 예측"""
+        return ModelingService.fit_voting(this).predict(this.test)
 
 
     @staticmethod
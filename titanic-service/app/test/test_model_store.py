@@ -0,0 +1,38 @@
+import app.domain.service.model_store as module
+from app.domain.service.model_store import ModelStore
+
+
+class FakeDataset:
+    train = [1, 2, 3]
+
+
+class FakeVoting:
+    def predict(self, features):
+        return [1 for _ in features]
+
+
+def test_load_fits_once_and_predict_reuses_model(monkeypatch):
+    """모델은 한 번만 학습하고 예측 요청마다 다시 학습하지 않아야 합니다."""
+    calls = []
+
+    class FakeTitanicService:
+        def preprocess(self, train_fname, test_fname):
+            calls.append(("preprocess", train_fname, test_fname))
+            return FakeDataset()
+
+    class FakeModelingService:
+        @staticmethod
+        def fit_voting(dataset):
+            calls.append(("fit_voting",))
+            return FakeVoting()
+
+    monkeypatch.setattr(module, "TitanicService", FakeTitanicService)
+    monkeypatch.setattr(module, "ModelingService", FakeModelingService)
+    store = ModelStore()
+    assert not store.loaded
+
+    assert store.predict(["a", "b"]) == [1, 1]
+    store.load()
+    assert store.predict(["c"]) == [1]
+    assert calls == [("preprocess", "train.csv", "test.csv"), ("fit_voting",)]
+    assert store.loaded and isinstance(store.dataset, FakeDataset)